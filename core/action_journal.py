@@ -0,0 +1,278 @@
+"""
+서비스 전환 작업 저널 모듈
+시작/중지 전환의 의도(intent), 리소스별 완료(done), 종료(commit) 기록을 JSONL 파일에 추가만 하는 방식으로 남깁니다.
+기록은 모아서 한 번에 fsync하고(group commit), 재시작 시 종료되지 않은 전환을 찾아 복구할 수 있게 합니다.
+"""
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from collections import deque
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 저널 파일 경로
+ACTION_JOURNAL_PATH = os.path.join(os.path.expanduser("~"), ".aws_monitor_journal.jsonl")
+
+# 기록 종류
+OP_INTENT = "intent"
+OP_DONE = "done"
+OP_COMMIT = "commit"
+
+class ActionJournal:
+    """추가 전용, fsync 묶음 처리 전환 저널 클래스"""
+
+    def __init__(self, settings=None, path=ACTION_JOURNAL_PATH):
+        """초기화
+
+        Args:
+            settings (dict, optional): 저널 설정 (aws.journal)
+            path (str): 저널 파일 경로
+        """
+        settings = settings or {}
+        self.enabled = settings.get("enabled", True)
+        self.fsync_interval = settings.get("fsync_interval_ms", 50) / 1000
+        self.compact_every = settings.get("compact_every", 500)
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._flushed = threading.Condition(self._lock)
+        # 파일 쓰기와 압축(파일 교체)을 직렬화
+        self._io_lock = threading.Lock()
+        self._buffer = []
+        self._appended_seq = 0
+        # 기록 스레드가 처리한(성공 또는 실패) 마지막 순번과 fsync까지 성공한 마지막 순번
+        self._processed_seq = 0
+        self._flushed_seq = 0
+        # 쓰기/fsync에 실패한 기록 순번 범위 [(첫 순번, 마지막 순번, 오류)]
+        self._failures = deque(maxlen=100)
+        self._records_since_compact = 0
+        # 종료되지 않은 전환 {txn: {"action", "resources", "done"}}
+        self._open = {}
+
+        self._file = None
+        self._writer = None
+        self._wakeup = threading.Event()
+
+    def _ensure_writer(self):
+        """파일과 기록 스레드를 준비합니다. (잠금 안에서 호출)"""
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+
+    def _append(self, record, wait=False):
+        """기록을 버퍼에 추가합니다.
+
+        Args:
+            record (dict): 기록
+            wait (bool): fsync될 때까지 기다릴지 여부 (의도/종료 기록은 작업 전에 디스크에 있어야 함)
+
+        Raises:
+            OSError: wait가 True이고 기록을 쓰거나 fsync하지 못한 경우
+        """
+        if not self.enabled:
+            return
+
+        record["ts"] = time.time()
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._ensure_writer()
+            self._buffer.append(line)
+            self._appended_seq += 1
+            seq = self._appended_seq
+            if wait:
+                self._wakeup.set()
+                while self._processed_seq < seq:
+                    self._flushed.wait()
+                for first, last, error in self._failures:
+                    if first <= seq <= last:
+                        raise OSError(f"저널 기록에 실패했습니다: {error}") from error
+
+    def _writer_loop(self):
+        """버퍼에 모인 기록을 주기적으로 한 번에 쓰고 fsync합니다."""
+        while True:
+            self._wakeup.wait(self.fsync_interval)
+            self._wakeup.clear()
+
+            with self._lock:
+                if not self._buffer:
+                    continue
+                lines = self._buffer
+                self._buffer = []
+                seq = self._appended_seq
+
+            error = None
+            try:
+                with self._io_lock:
+                    self._file.write("\n".join(lines) + "\n")
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            except Exception as e:
+                logger.error(f"저널 기록 중 오류 발생: {e}")
+                error = e
+
+            with self._lock:
+                if error is None:
+                    self._flushed_seq = seq
+                    self._records_since_compact += len(lines)
+                else:
+                    # 디스크에 있다고 보장할 수 없으므로 fsync 완료로 표시하지 않고 기다리는 호출자에게 오류 전달
+                    self._failures.append((seq - len(lines) + 1, seq, error))
+                self._processed_seq = seq
+                self._flushed.notify_all()
+                compact = error is None and self._records_since_compact >= self.compact_every
+
+            if compact:
+                self.compact()
+
+    def begin(self, action, resources):
+        """전환 시작 의도를 기록합니다. (fsync 후 반환)
+
+        Args:
+            action (str): 전환 종류 ('start' 또는 'stop')
+            resources (list): {"type", "registration"} 목록
+
+        Returns:
+            str: 전환 ID
+
+        Raises:
+            OSError: 의도 기록을 디스크에 쓰지 못한 경우 (전환을 시작하면 안 됨)
+        """
+        txn = uuid.uuid4().hex
+        with self._lock:
+            self._open[txn] = {"action": action, "resources": resources, "done": {}}
+        try:
+            self._append({"op": OP_INTENT, "txn": txn, "action": action, "resources": resources}, wait=True)
+        except OSError:
+            with self._lock:
+                self._open.pop(txn, None)
+            raise
+        return txn
+
+    def record_result(self, txn, resource_type, region, resource_id, success):
+        """리소스 하나의 전환 결과를 기록합니다. (다음 묶음 fsync에 포함)"""
+        key = [resource_type, region, resource_id]
+        with self._lock:
+            if txn in self._open:
+                self._open[txn]["done"]["|".join(key)] = success
+        self._append({"op": OP_DONE, "txn": txn, "key": key, "success": success})
+
+    def commit(self, txn, status="committed"):
+        """전환 종료를 기록합니다. (fsync 후 반환)
+
+        Args:
+            txn (str): 전환 ID
+            status (str): 종료 상태 (committed, recovered 등)
+
+        Raises:
+            OSError: 종료 기록을 디스크에 쓰지 못한 경우 (전환은 열린 상태로 남아 다음 시작 시 복구됨)
+        """
+        with self._lock:
+            entry = self._open.pop(txn, None)
+        try:
+            self._append({"op": OP_COMMIT, "txn": txn, "status": status}, wait=True)
+        except OSError:
+            if entry is not None:
+                with self._lock:
+                    self._open.setdefault(txn, entry)
+            raise
+
+    def replay(self):
+        """저널 파일을 읽어 종료되지 않은 전환 목록을 반환합니다.
+
+        마지막 줄이 기록 도중 끊긴 경우는 무시합니다.
+
+        Returns:
+            list: {"txn", "action", "resources", "done"} 목록 - done은 "타입|리전|ID"별 성공 여부
+        """
+        if not self.enabled or not os.path.exists(self.path):
+            return []
+
+        transactions = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+
+                    txn = record.get("txn")
+                    op = record.get("op")
+                    if op == OP_INTENT:
+                        transactions[txn] = {
+                            "txn": txn,
+                            "action": record.get("action"),
+                            "resources": record.get("resources", []),
+                            "done": {}
+                        }
+                    elif op == OP_DONE and txn in transactions:
+                        transactions[txn]["done"]["|".join(record.get("key", []))] = record.get("success")
+                    elif op == OP_COMMIT:
+                        transactions.pop(txn, None)
+
+        except Exception as e:
+            logger.error(f"저널 재생 중 오류 발생: {e}")
+            return []
+
+        with self._lock:
+            for txn, transaction in transactions.items():
+                self._open.setdefault(txn, {
+                    "action": transaction["action"],
+                    "resources": transaction["resources"],
+                    "done": transaction["done"]
+                })
+
+        if transactions:
+            logger.warning(f"종료되지 않은 서비스 전환 {len(transactions)}개를 발견했습니다.")
+        return list(transactions.values())
+
+    def compact(self):
+        """종료되지 않은 전환만 남기도록 저널 파일을 다시 씁니다. (임시 파일 교체)
+
+        Returns:
+            bool: 압축 성공 여부
+        """
+        if not self.enabled:
+            return False
+
+        with self._io_lock, self._lock:
+            # 버퍼에 남은 기록이 있으면 다음 기록 주기 이후에 압축
+            if self._buffer:
+                return False
+
+            lines = []
+            for txn, transaction in self._open.items():
+                lines.append(json.dumps({"op": OP_INTENT, "txn": txn, "action": transaction["action"],
+                                         "resources": transaction["resources"], "ts": time.time()},
+                                        ensure_ascii=False))
+                for key, success in transaction["done"].items():
+                    lines.append(json.dumps({"op": OP_DONE, "txn": txn, "key": key.split("|"),
+                                             "success": success, "ts": time.time()}, ensure_ascii=False))
+
+            try:
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    if lines:
+                        f.write("\n".join(lines) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                if self._file is not None:
+                    self._file.close()
+                os.replace(temp_path, self.path)
+                self._file = open(self.path, "a", encoding="utf-8")
+                self._records_since_compact = 0
+                logger.debug(f"저널을 압축했습니다: 남은 전환 {len(self._open)}개")
+                return True
+
+            except Exception as e:
+                logger.error(f"저널 압축 중 오류 발생: {e}")
+                if self._file is None or self._file.closed:
+                    self._file = open(self.path, "a", encoding="utf-8")
+                return False
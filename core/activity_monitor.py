@@ -20,6 +20,10 @@ from core import timer
 from core.messages import message_format
 from core.config.config_loader import config
 from core.service_manager import service_manager
+from core.screen_detector import ScreenChangeDetector
+from core.screen_sampler import ScreenSampler
+from core.adaptive_interval import AdaptiveInterval
+from core.window_tracker import WindowTracker, SYSTEM_WINDOWS
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -47,13 +51,9 @@ PROCESS_NAME = "STUDY_AWS_MANAGER"  # 프로세스 이름 설정
 _last_keyboard_event = 0
 _last_mouse_movement = 0
 _last_mouse_click = 0
-_last_active_window_event = 0  # 활성 창 이벤트를 위한 변수 추가
-_last_active_window = ""  # 마지막으로 감지된 활성 창 저장용
 
-# 시스템 창 목록 - 이러한 창은 활성 창 메시지에서 무시됨
-SYSTEM_WINDOWS = ["Program Manager", "Windows Shell Experience Host", "Windows Explorer", 
-                 "Microsoft Text Input Application", "설정", "Settings", "Task Manager", 
-                 "작업 관리자", "시작", "Start", ""]
+# 활성 창 추적기 (monitor_active_window에서 생성)
+_window_tracker = None
 
 # 오디오 형식 상수 정의
 AUDIO_FORMAT = pyaudio.paInt16
@@ -116,6 +116,11 @@ def update_user_activity():
     service_manager.update_activity_time()
     logger.debug("사용자 활동 시간 업데이트됨")
 
+def get_input_age():
+    """마지막 키보드/마우스 입력 이후 경과 시간(초)을 반환합니다."""
+    last_input = max(_last_keyboard_event, _last_mouse_movement, _last_mouse_click)
+    return max(0.0, time.time() - last_input / 1000)
+
 def monitor_keyboard():
     """키보드 활동을 모니터링합니다."""
     # 설정에서 키보드 모니터링 활성화 여부 확인
@@ -225,87 +230,96 @@ def monitor_screen_changes():
         logger.info("화면 변화 모니터링이 비활성화되어 있습니다.")
         return
     
-    # PyAutoGUI 사용 가능 여부 확인
-    if not PYAUTOGUI_AVAILABLE:
-        logger.error("PyAutoGUI가 사용 불가능하여 화면 모니터링을 시작할 수 없습니다.")
+    # 설정에서 캡처 간격 및 유사도 임계값 로드
+    screen_settings = _get_setting("screen", {})
+    capture_interval = screen_settings.get("capture_interval_sec", 2)
+    detector = ScreenChangeDetector(screen_settings)
+    cadence = AdaptiveInterval(capture_interval, screen_settings.get("adaptive", {}))
+    
+    # 화면 캡처 준비 (GDI 캡처를 사용할 수 없으면 PyAutoGUI 사용)
+    try:
+        sampler = ScreenSampler(detector.thumbnail_width, pyautogui.screenshot if PYAUTOGUI_AVAILABLE else None)
+    except Exception as e:
+        logger.error(f"화면 캡처를 준비할 수 없어 화면 모니터링을 시작할 수 없습니다: {e}")
         logger.error("'pip install pillow pyautogui'를 실행하여 필요한 패키지를 설치해주세요.")
         return
-        
-    # 설정에서 캡처 간격 및 유사도 임계값 로드
-    capture_interval = _get_setting("screen", {}).get("capture_interval_sec", 2)
-    threshold = _get_setting("screen", {}).get("change_threshold", 0.8)
-    logger.info(f"화면 변화 모니터링 시작됨 (간격: {capture_interval}초, 임계값: {threshold})")
     
-    prev_screenshot = None
+    logger.info(f"화면 변화 모니터링 시작됨 (간격: {capture_interval}초, 썸네일 너비: {detector.thumbnail_width}, "
+                f"임계값: {detector.threshold}, 캡처: {sampler.get_stats()['capture']})")
+    
     cycle_count = 0
     
     while True:
         try:
-            # 현재 화면 캡처
-            screenshot = pyautogui.screenshot()
-            screenshot = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2GRAY)
+            # 현재 화면을 재사용 버퍼에 캡처/축소한 뒤 썸네일 타일/해시로 이전 화면과 비교 (애매한 경우만 상관계수 계산)
+            current, previous, frame_shape = sampler.sample()
+            changed, similarity, regions = detector.update(current, previous, frame_shape)
             
-            # 이전 화면과 비교
-            if prev_screenshot is not None:
-                # 이미지 크기를 맞추기
-                if prev_screenshot.shape != screenshot.shape:
-                    prev_screenshot = cv2.resize(prev_screenshot, (screenshot.shape[1], screenshot.shape[0]))
-                
-                # 구조적 유사성 계산
-                similarity = cv2.matchTemplate(prev_screenshot, screenshot, cv2.TM_CCOEFF_NORMED)[0][0]
-                
-                # 정기적으로 화면 감지 상태 기록 (20회마다)
-                cycle_count += 1
-                if cycle_count % 20 == 0:
-                    logger.debug(f"화면 유사성 검사: {similarity:.4f} (임계값: {threshold})")
-                    cycle_count = 0
-                
-                # 유사성이 임계값보다 낮으면 화면 변화로 간주
-                if similarity < threshold:
-                    logger.debug(f"화면 변화 감지 (유사성: {similarity:.4f}) - 메시지 전송 시도")
-                    
-                    timer_reset()
-                    result = message_format.send_screen_change()
-                    if result:
-                        logger.debug("화면 변화 메시지 전송 성공")
-                    else:
-                        logger.warning("화면 변화 메시지 전송 실패")
-                    update_user_activity()
-            
-            # 현재 화면을 이전 화면으로 저장
-            prev_screenshot = screenshot
+            # 정기적으로 화면 감지 상태 기록 (20회마다)
+            cycle_count += 1
+            if cycle_count % 20 == 0:
+                logger.debug(f"화면 유사성 검사: {similarity:.4f} (임계값: {detector.threshold}, "
+                             f"판단 통계: {detector.get_stats()}, "
+                             f"할당: {sampler.bytes_allocated + detector.bytes_allocated}바이트, "
+                             f"간격: {cadence.get_stats()})")
+                cycle_count = 0
             
-            # 현재 활성 창 이름 가져오기
-            active_window = GetWindowText(GetForegroundWindow())
-            if active_window:
-                # 디바운싱: 마지막 이벤트 이후 일정 시간이 지났을 때만 처리
-                current_time = time.time() * 1000  # 현재 시간(밀리초)
-                global _last_active_window_event, _last_active_window
+            # 유사성이 임계값보다 낮으면 화면 변화로 간주
+            if changed:
+                logger.debug(f"화면 변화 감지 (유사성: {similarity:.4f}, 변화 영역: {len(regions)}개) - 메시지 전송 시도")
                 
-                if (current_time - _last_active_window_event) > 1000 or active_window != _last_active_window:
-                    # 시스템 창 목록에 없는 경우에만 메시지 전송
-                    if active_window not in SYSTEM_WINDOWS:
-                        logger.debug(f"활성 창 감지: {active_window} - 메시지 전송 시도")
-                        result = message_format.send_active_window(active_window)
-                        if result:
-                            logger.debug("활성 창 메시지 전송 성공")
-                        else:
-                            logger.warning("활성 창 메시지 전송 실패")
-                        update_user_activity()
-                        _last_active_window_event = current_time
-                        _last_active_window = active_window
-                    else:
-                        logger.debug(f"시스템 창 무시됨: {active_window}")
+                timer_reset()
+                result = message_format.send_screen_change(regions)
+                if result:
+                    logger.debug("화면 변화 메시지 전송 성공")
                 else:
-                    logger.debug(f"활성 창 이벤트 무시됨 (디바운스 중): {current_time - _last_active_window_event}ms")
-                
-            # 대기
-            time.sleep(capture_interval)
+                    logger.warning("화면 변화 메시지 전송 실패")
+                update_user_activity()
+            
+            # 입력 활동과 화면 변화에 따라 정한 간격만큼 대기
+            time.sleep(cadence.next_interval(get_input_age(), changed))
             
         except Exception as e:
             logger.error(f"화면 모니터링 중 오류 발생: {e}")
             time.sleep(capture_interval)
 
+def monitor_active_window():
+    """활성 창 변경을 모니터링합니다. (바뀐 경우에만 메시지 전송)"""
+    global _window_tracker
+    
+    # 설정에서 활성 창 모니터링 활성화 여부 확인
+    window_settings = _get_setting("window", {})
+    if not window_settings.get("enabled", True):
+        logger.info("활성 창 모니터링이 비활성화되어 있습니다.")
+        return
+    
+    def on_change(active_window):
+        logger.debug(f"활성 창 변경 감지: {active_window} - 메시지 전송 시도")
+        result = message_format.send_active_window(active_window)
+        if result:
+            logger.debug("활성 창 메시지 전송 성공")
+        else:
+            logger.warning("활성 창 메시지 전송 실패")
+        update_user_activity()
+    
+    _window_tracker = WindowTracker(
+        lambda: GetWindowText(GetForegroundWindow()),
+        on_change,
+        window_settings,
+        get_input_age
+    )
+    _window_tracker.run()
+
+def get_window_dwell_times():
+    """창별 머문 시간을 반환합니다.
+    
+    Returns:
+        dict: {창 제목: 머문 시간(초)} - 활성 창 추적이 시작되지 않았으면 빈 딕셔너리
+    """
+    if _window_tracker is None:
+        return {}
+    return _window_tracker.get_dwell_times()
+
 def monitor_audio():
     """오디오 재생 여부를 모니터링합니다."""
     # 설정에서 오디오 모니터링 활성화 여부 확인
@@ -435,19 +449,19 @@ def start_monitoring():
     # 키보드 및 마우스 활동 모니터링 시작
     keyboard_thread = threading.Thread(target=monitor_keyboard, daemon=True, name="KeyboardMonitor")
     mouse_thread = threading.Thread(target=monitor_mouse, daemon=True, name="MouseMonitor")
-    # screen_thread = threading.Thread(target=monitor_screen_changes, daemon=True, name="ScreenMonitor")
+    screen_thread = threading.Thread(target=monitor_screen_changes, daemon=True, name="ScreenMonitor")
+    window_thread = threading.Thread(target=monitor_active_window, daemon=True, name="WindowMonitor")
     audio_thread = threading.Thread(target=monitor_audio, daemon=True, name="AudioMonitor")
     
     # 스레드 시작
     keyboard_thread.start()
     mouse_thread.start()
-    # screen_thread.start()
+    screen_thread.start()
+    window_thread.start()
     audio_thread.start()
     
     # 스레드 추적을 위해 목록에 저장
-
-    _monitoring_threads = [keyboard_thread, mouse_thread, audio_thread]
-    # _monitoring_threads = [keyboard_thread, mouse_thread, screen_thread, audio_thread]
+    _monitoring_threads = [keyboard_thread, mouse_thread, screen_thread, window_thread, audio_thread]
     
     # 활동 모니터링 시작 메시지 전송
     start_msg = {
@@ -499,7 +513,9 @@ def stop_monitoring():
             logger.error(f"잠금 포트 해제 중 오류 발생: {e}")
     
     # 스레드 종료는 daemon=True로 설정되어 있어 자동으로 처리됨
-    # 하지만 모니터링 상태를 비활성으로 설정
+    # 하지만 모니터링 상태를 비활성으로 설정 (활성 창 추적 루프는 직접 중지)
+    if _window_tracker is not None:
+        _window_tracker.stop()
     _monitoring_active = False
     _monitoring_threads = []
     
@@ -0,0 +1,291 @@
+"""
+사용자 복귀 시간 예측 모듈
+요일/시간대(주 168칸)별 활동 분 수 히스토그램을 모아 다음 복귀 시각을 예측하고,
+등록된 서비스를 미리 시작(warm-up)할 시각과 예측 적중 통계를 관리합니다.
+"""
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime, timedelta
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 히스토그램 파일 경로
+ACTIVITY_HISTOGRAM_PATH = os.path.join(os.path.expanduser("~"), ".aws_monitor_activity.json")
+
+# 주간 시간대 칸 수 (7일 x 24시간)
+HOURS_PER_WEEK = 7 * 24
+
+class ActivityPredictor:
+    """요일/시간대별 활동 히스토그램 기반 복귀 시간 예측 클래스"""
+
+    def __init__(self, settings=None, path=ACTIVITY_HISTOGRAM_PATH):
+        """초기화
+
+        Args:
+            settings (dict, optional): 예측 설정 (aws.predictive_warmup)
+            path (str): 히스토그램 저장 파일 경로
+        """
+        settings = settings or {}
+        self.enabled = settings.get("enabled", True)
+        self.lead_time = timedelta(minutes=settings.get("lead_time_minutes", 15))
+        self.grace = timedelta(minutes=settings.get("grace_minutes", 30))
+        self.min_active_minutes = settings.get("min_active_minutes", 10)
+        self.min_history_days = settings.get("min_history_days", 7)
+        self.save_interval_seconds = settings.get("save_interval_seconds", 300)
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._histogram = [0] * HOURS_PER_WEEK
+        self._first_recorded = None
+        self._last_minute = None
+        self._dirty = False
+        self._last_saved = time.monotonic()
+
+        # 현재 부재 기간의 warm-up 상태
+        self._warmup_at = None
+        self._warmed_at = None
+        self._expire_at = None
+        self._warmup_used = False
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "no_prediction": 0,
+            "false_warmups": 0,
+            "warm_idle_seconds": 0,
+            "wasted_uptime_seconds": 0
+        }
+
+        self._load()
+
+    def _load(self):
+        """저장된 히스토그램을 로드합니다."""
+        try:
+            if not os.path.exists(self.path):
+                return
+
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            histogram = data.get("histogram", [])
+            if len(histogram) == HOURS_PER_WEEK:
+                self._histogram = [int(count) for count in histogram]
+            if data.get("first_recorded"):
+                self._first_recorded = datetime.fromisoformat(data["first_recorded"])
+            self._stats.update(data.get("stats", {}))
+
+            logger.info(f"활동 히스토그램을 로드했습니다: 활동 {sum(self._histogram)}분")
+
+        except Exception as e:
+            logger.error(f"활동 히스토그램 로드 중 오류 발생: {e}")
+
+    def save(self, force=False):
+        """히스토그램을 파일에 저장합니다. (변경이 없거나 저장 간격이 지나지 않았으면 생략)
+
+        Args:
+            force (bool): 저장 간격과 관계없이 변경 사항을 저장할지 여부
+
+        Returns:
+            bool: 저장 여부
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            if not force and time.monotonic() - self._last_saved < self.save_interval_seconds:
+                return False
+
+            data = {
+                "histogram": list(self._histogram),
+                "first_recorded": self._first_recorded.isoformat() if self._first_recorded else None,
+                "stats": dict(self._stats)
+            }
+            self._dirty = False
+            self._last_saved = time.monotonic()
+
+        try:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            logger.error(f"활동 히스토그램 저장 중 오류 발생: {e}")
+            with self._lock:
+                self._dirty = True
+            return False
+
+    @staticmethod
+    def _hour_of_week(moment):
+        """시각의 요일/시간대 칸 번호를 반환합니다. (월요일 0시 = 0)"""
+        return moment.weekday() * 24 + moment.hour
+
+    def record_activity(self, now=None):
+        """사용자 활동을 기록합니다.
+
+        활동 이벤트마다 호출되므로 같은 분 안의 이벤트는 한 번만 집계합니다.
+
+        Args:
+            now (datetime, optional): 활동 시각
+        """
+        minute = int(time.time() // 60) if now is None else int(now.timestamp() // 60)
+        if minute == self._last_minute:
+            return
+
+        now = now or datetime.now()
+        with self._lock:
+            if minute == self._last_minute:
+                return
+            self._last_minute = minute
+            self._histogram[self._hour_of_week(now)] += 1
+            if self._first_recorded is None:
+                self._first_recorded = now
+            self._dirty = True
+
+        self.save()
+
+    def _is_active_hour(self, hour_of_week, weeks):
+        """해당 시간대가 평소 활동하는 시간대인지 반환합니다."""
+        return self._histogram[hour_of_week] / weeks >= self.min_active_minutes
+
+    def predict_next_return(self, now=None):
+        """다음 복귀 예상 시각을 반환합니다.
+
+        현재 시간대 이후로 활동하지 않는 시간대 다음에 오는 첫 활동 시간대(다음 활동 구간)의 시작 시각입니다.
+        활동 시간대는 주당 평균 활동 분 수가 min_active_minutes 이상인 시간대이며, 평소 활동 시간 중에
+        자리를 비운 경우 바로 다음 시간대가 아니라 활동하지 않는 시간대가 지난 뒤의 복귀를 예측합니다.
+
+        Args:
+            now (datetime, optional): 기준 시각
+
+        Returns:
+            datetime: 복귀 예상 시각 (기록이 부족하거나 활동 시간대가 없으면 None)
+        """
+        now = now or datetime.now()
+        with self._lock:
+            if self._first_recorded is None:
+                return None
+            history_days = (now - self._first_recorded).total_seconds() / 86400
+            if history_days < self.min_history_days:
+                return None
+
+            weeks = max(1.0, history_days / 7)
+            next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            previous_active = self._is_active_hour(self._hour_of_week(now), weeks)
+            for offset in range(HOURS_PER_WEEK):
+                candidate = next_hour + timedelta(hours=offset)
+                active = self._is_active_hour(self._hour_of_week(candidate), weeks)
+                if active and not previous_active:
+                    return candidate
+                previous_active = active
+        return None
+
+    def begin_away(self, now=None):
+        """부재 기간 시작 시 이번 부재 기간의 warm-up 시각을 계산합니다.
+
+        Returns:
+            datetime: warm-up 예정 시각 (예측하지 않으면 None)
+        """
+        self.save(force=True)
+        self._warmed_at = None
+        self._expire_at = None
+        self._warmup_used = False
+        self._warmup_at = None
+
+        if not self.enabled:
+            return None
+
+        now = now or datetime.now()
+        predicted = self.predict_next_return(now)
+        if predicted is not None and predicted - self.lead_time <= now:
+            # 미리 시작할 시각이 이미 지났으면 부재 직후 다시 시작하게 되므로 예측하지 않음
+            logger.debug(f"복귀 예상 시각({predicted:%Y-%m-%d %H:%M})이 너무 가까워 미리 시작하지 않습니다.")
+            predicted = None
+        if predicted is not None:
+            self._warmup_at = predicted - self.lead_time
+            self._expire_at = predicted + self.grace
+            logger.info(f"복귀 예상 시각: {predicted:%Y-%m-%d %H:%M}, "
+                        f"서비스 미리 시작 예정: {self._warmup_at:%Y-%m-%d %H:%M}")
+        return self._warmup_at
+
+    def is_warmed(self):
+        """현재 부재 기간에 서비스를 미리 시작한 상태인지 반환합니다."""
+        return self._warmed_at is not None
+
+    def next_deadline(self):
+        """다음 warm-up 관련 이벤트 시각을 반환합니다. (없으면 None)"""
+        if self._warmed_at is not None:
+            return self._expire_at
+        if self._warmup_at is not None and not self._warmup_used:
+            return self._warmup_at
+        return None
+
+    def poll(self, now=None):
+        """부재 중 warm-up 시작/취소 시점을 확인합니다.
+
+        Returns:
+            str: 'warm_up'(미리 시작), 'cool_down'(예측 실패로 다시 중지) 또는 None
+        """
+        now = now or datetime.now()
+        if self._warmed_at is not None:
+            if now >= self._expire_at:
+                wasted = int((now - self._warmed_at).total_seconds())
+                self._warmed_at = None
+                with self._lock:
+                    self._stats["false_warmups"] += 1
+                    self._stats["wasted_uptime_seconds"] += wasted
+                    self._dirty = True
+                logger.info(f"예상 시각까지 복귀하지 않아 미리 시작한 서비스를 다시 중지합니다. (낭비된 실행 시간 {wasted}초)")
+                return "cool_down"
+            return None
+
+        if self._warmup_at is not None and not self._warmup_used and now >= self._warmup_at:
+            # 한 부재 기간에는 한 번만 미리 시작
+            self._warmup_used = True
+            self._warmed_at = now
+            return "warm_up"
+        return None
+
+    def end_away(self, now=None):
+        """복귀 시 예측 결과를 집계합니다.
+
+        Returns:
+            bool: 미리 시작한 상태에서 복귀했는지 여부 (적중)
+        """
+        now = now or datetime.now()
+        hit = self._warmed_at is not None
+        with self._lock:
+            if hit:
+                idle = int((now - self._warmed_at).total_seconds())
+                self._stats["hits"] += 1
+                self._stats["warm_idle_seconds"] += idle
+                logger.info(f"복귀 예측 적중: 서비스가 {idle}초 전에 미리 시작되었습니다.")
+            elif self._warmup_at is not None:
+                # 이번 부재 기간에 예측했지만 미리 시작하기 전에 복귀했거나 예측 시각이 지나 다시 중지함
+                self._stats["misses"] += 1
+            elif self.enabled:
+                # 기록이 부족해 이번 부재 기간에는 예측하지 않음 (적중률 계산에서 제외)
+                self._stats["no_prediction"] += 1
+            self._dirty = True
+
+        self._warmup_at = None
+        self._warmed_at = None
+        self._expire_at = None
+        return hit
+
+    def get_stats(self):
+        """예측 통계를 반환합니다.
+
+        Returns:
+            dict: 적중/미스/예측 없음/잘못된 warm-up 수, 적중 시 복귀 전 대기 시간, 낭비된 실행 시간(초),
+                적중률 (예측한 부재 기간 기준)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        predictions = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / predictions if predictions else 0.0
+        stats["lead_time_minutes"] = self.lead_time.total_seconds() / 60
+        return stats
@@ -0,0 +1,80 @@
+"""
+적응형 샘플링 간격 모듈
+키보드/마우스 입력이 최근에 있었거나 화면이 오래 변하지 않으면 샘플링 간격을 지수적으로 늘리고,
+입력이 멈춰 화면/소리가 남은 활동 신호일 때는 간격을 최소로 줄입니다.
+"""
+import time
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+class AdaptiveInterval:
+    """입력 활동과 샘플 변화에 따라 다음 샘플링 간격을 정하는 클래스"""
+
+    def __init__(self, base_interval, settings=None):
+        """초기화
+
+        Args:
+            base_interval (float): 시작 간격(초)
+            settings (dict, optional): 적응형 간격 설정 (enabled, min_interval_sec, max_interval_sec,
+                backoff_factor, input_recent_sec, static_after_sec)
+        """
+        settings = settings or {}
+        self.enabled = settings.get("enabled", True)
+        self.base_interval = base_interval
+        self.min_interval = settings.get("min_interval_sec", min(1.0, base_interval))
+        self.max_interval = settings.get("max_interval_sec", max(16.0, base_interval))
+        self.backoff_factor = settings.get("backoff_factor", 2.0)
+        self.input_recent = settings.get("input_recent_sec", 5)
+        self.static_after = settings.get("static_after_sec", 60)
+
+        self.interval = base_interval
+        self._last_change = time.monotonic()
+        self.reason = "base"
+
+    def _backoff(self, reason):
+        """간격을 지수적으로 늘립니다. (최대 간격까지)"""
+        self.interval = min(self.max_interval, self.interval * self.backoff_factor)
+        self.reason = reason
+
+    def next_interval(self, input_age, changed):
+        """이번 샘플 결과로 다음 샘플링 간격을 계산합니다.
+
+        Args:
+            input_age (float): 마지막 키보드/마우스 입력 이후 경과 시간(초)
+            changed (bool): 이번 샘플에서 변화가 감지되었는지 여부
+
+        Returns:
+            float: 다음 샘플까지 대기할 시간(초)
+        """
+        if not self.enabled:
+            return self.base_interval
+
+        now = time.monotonic()
+        if changed:
+            self._last_change = now
+
+        if input_age < self.input_recent:
+            # 입력으로 이미 활동 중임을 알고 있으므로 샘플링이 새 정보를 주지 않음
+            self._backoff("input")
+        elif now - self._last_change >= self.static_after:
+            # 입력도 없고 화면도 오래 변하지 않음
+            self._backoff("static")
+        else:
+            # 입력이 멈췄으므로 화면/창 변화가 남은 활동 신호
+            self.interval = self.min_interval
+            self.reason = "quiet"
+
+        return self.interval
+
+    def get_stats(self):
+        """현재 간격 상태를 반환합니다.
+
+        Returns:
+            dict: 현재 간격(초), 마지막으로 간격을 정한 이유 (input, static, quiet)
+        """
+        return {
+            "interval": self.interval,
+            "reason": self.reason
+        }
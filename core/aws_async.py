@@ -0,0 +1,184 @@
+"""
+AWS 서비스 비동기 호출 모듈
+boto3 호출은 블로킹이므로 전용 스레드 풀에서 실행하고, 이벤트 루프에서는 결과만 기다립니다.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from core import aws_services
+from core.config.config_loader import config
+from core.inventory_cache import inventory_cache, FRESH, STALE
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# AWS 호출 전용 스레드 풀 크기
+ASYNC_MAX_WORKERS = config.get("aws", "async_max_workers", 8)
+
+# 상태 전용 갱신 중에도 전체 조회(describe_instances)를 수행할 최대 간격(초)
+EC2_FULL_REFRESH_SECONDS = config.get("aws", "ec2_full_refresh_seconds", 300)
+
+# AWS SDK 호출 전용 스레드 풀 (이벤트 루프의 기본 실행기와 분리)
+_aws_executor = ThreadPoolExecutor(max_workers=ASYNC_MAX_WORKERS, thread_name_prefix="aws-io")
+
+async def run_blocking(func, *args, **kwargs):
+    """블로킹 함수를 AWS 전용 스레드 풀에서 실행하고 결과를 기다립니다.
+
+    Args:
+        func: 실행할 블로킹 함수
+        *args: 함수 위치 인자
+        **kwargs: 함수 키워드 인자
+
+    Returns:
+        함수의 반환값
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_aws_executor, partial(func, *args, **kwargs))
+
+async def get_inventory(service, region, loader, force=False):
+    """인벤토리 캐시를 거쳐 조회 결과를 반환합니다.
+
+    신선한 캐시는 이벤트 루프에서 바로 반환하고, 만료된 캐시는 즉시 반환하면서
+    백그라운드 갱신을 예약합니다. 캐시가 없거나 force가 지정되면 스레드 풀에서 새로 조회합니다.
+
+    Args:
+        service: 서비스 이름 (ec2, ecs, eks)
+        region: AWS 리전 (None이면 전체 리전)
+        loader: 인자 없이 호출되는 블로킹 조회 함수
+        force: 캐시를 무시하고 새로 조회할지 여부
+
+    Returns:
+        인벤토리 데이터
+    """
+    if force:
+        return await run_blocking(inventory_cache.load, service, region, loader)
+
+    data, state = inventory_cache.peek(service, region)
+    if state == FRESH:
+        return data
+    if state == STALE:
+        inventory_cache.revalidate(service, region, loader)
+        return data
+
+    # 스레드 풀 대기 중 다른 요청이 이미 조회를 마쳤을 수 있으므로 캐시를 다시 확인
+    return await run_blocking(inventory_cache.get, service, region, loader)
+
+# ===== 조회 =====
+async def list_ec2_instances(region=None, force=False):
+    """EC2 인스턴스 목록을 비동기로 조회합니다. (인벤토리 캐시 사용)"""
+    return await get_inventory("ec2", region, partial(aws_services.list_ec2_instances, region), force)
+
+async def refresh_ec2_states(region=None):
+    """EC2 인스턴스 상태만 가볍게 갱신한 목록을 반환합니다.
+
+    캐시된 전체 조회 결과에 describe_instance_status 결과를 덮어쓰고, 마지막 전체 조회가
+    ec2_full_refresh_seconds보다 오래되었거나 새 인스턴스가 발견되면 전체 조회를 수행합니다.
+
+    Args:
+        region: AWS 리전 (None이면 모든 리전)
+
+    Returns:
+        list: EC2 인스턴스 목록
+    """
+    age = inventory_cache.get_described_age("ec2", region)
+    if age is None or age >= EC2_FULL_REFRESH_SECONDS:
+        return await list_ec2_instances(region, force=True)
+
+    instances = await run_blocking(
+        inventory_cache.refresh_field, "ec2", region,
+        partial(aws_services.list_ec2_instance_states, region), "state"
+    )
+    if instances is None:
+        return await list_ec2_instances(region, force=True)
+    return instances
+
+async def stream_ec2_instances(region=None):
+    """EC2 인스턴스를 리전/페이지 단위로 도착하는 대로 전달합니다.
+
+    모든 리전을 동시에 조회하며, 어떤 리전에서도 region_timeout_seconds 동안
+    새 페이지가 도착하지 않으면 남은 리전은 건너뜁니다.
+
+    Args:
+        region: AWS 리전 (None이면 설정된 모든 리전)
+
+    Yields:
+        tuple: (리전, 페이지별 EC2 인스턴스 목록)
+    """
+    regions = [region] if region else aws_services.aws_regions
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+
+    def _produce(current_region):
+        # 작업 스레드에서 페이지를 읽어 이벤트 루프의 큐로 전달
+        try:
+            for page in aws_services.iter_ec2_instance_pages(current_region):
+                loop.call_soon_threadsafe(queue.put_nowait, (current_region, page))
+        except RuntimeError:
+            # 소비하는 이벤트 루프가 이미 종료된 경우
+            return
+        except Exception as e:
+            logger.error(f"EC2 인스턴스 스트리밍 중 오류 발생 (리전: {current_region}): {e}")
+
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, (current_region, None))
+        except RuntimeError:
+            pass
+
+    for current_region in regions:
+        loop.run_in_executor(_aws_executor, _produce, current_region)
+
+    pending = set(regions)
+    while pending:
+        try:
+            current_region, page = await asyncio.wait_for(queue.get(), aws_services.REGION_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(f"EC2 인스턴스 스트리밍 응답 시간 초과로 리전을 건너뜁니다: {sorted(pending)}")
+            return
+
+        if page is None:
+            pending.discard(current_region)
+            continue
+
+        yield current_region, page
+
+async def list_ecs_clusters(region, force=False):
+    """ECS 클러스터 목록을 비동기로 조회합니다. (인벤토리 캐시 사용)"""
+    return await get_inventory("ecs", region, partial(aws_services.list_ecs_clusters, region), force)
+
+async def list_ecs_services(cluster_name, region):
+    """ECS 서비스 목록을 비동기로 조회합니다."""
+    return await run_blocking(aws_services.list_ecs_services, cluster_name, region)
+
+async def list_all_ecs_services(region, force=False):
+    """리전의 모든 ECS 서비스 목록을 비동기로 조회합니다. (인벤토리 캐시 사용)"""
+    return await get_inventory("ecs_services", region, partial(aws_services.list_all_ecs_services, region), force)
+
+async def list_eks_clusters(region, force=False):
+    """EKS 클러스터 목록을 비동기로 조회합니다. (인벤토리 캐시 사용)"""
+    return await get_inventory("eks", region, partial(aws_services.list_eks_clusters, region), force)
+
+async def list_eks_nodegroups(cluster_name, region):
+    """EKS 노드그룹 목록을 비동기로 조회합니다."""
+    return await run_blocking(aws_services.list_eks_nodegroups, cluster_name, region)
+
+# ===== 시작/중지 =====
+async def start_ec2_instance(instance_id, region):
+    """EC2 인스턴스를 비동기로 시작합니다."""
+    return await run_blocking(aws_services.start_ec2_instance, instance_id, region)
+
+async def stop_ec2_instance(instance_id, region):
+    """EC2 인스턴스를 비동기로 중지합니다."""
+    return await run_blocking(aws_services.stop_ec2_instance, instance_id, region)
+
+async def start_ecs_service(cluster_name, service_name, region):
+    """ECS 서비스를 비동기로 시작합니다."""
+    return await run_blocking(aws_services.start_ecs_service, cluster_name, service_name, region)
+
+async def stop_ecs_service(cluster_name, service_name, region):
+    """ECS 서비스를 비동기로 중지합니다."""
+    return await run_blocking(aws_services.stop_ecs_service, cluster_name, service_name, region)
+
+async def scale_eks_nodegroup(cluster_name, nodegroup_name, region, desired_size):
+    """EKS 노드그룹을 비동기로 스케일링합니다."""
+    return await run_blocking(aws_services.scale_eks_nodegroup, cluster_name, nodegroup_name, region, desired_size)
@@ -7,12 +7,21 @@ import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import threading
+from core.config.config_loader import config
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 풀에 보관하는 클라이언트 설정 (응답 없는 호출이 스레드를 무기한 점유하지 않도록 제한)
+CLIENT_CONFIG = Config(
+    connect_timeout=config.get("aws", "client_connect_timeout_seconds", 5),
+    read_timeout=config.get("aws", "client_read_timeout_seconds", 10),
+    retries={"max_attempts": config.get("aws", "client_max_attempts", 3)}
+)
+
 class AWSAuth:
     """AWS 인증 관리 클래스"""
     
@@ -20,6 +29,14 @@ class AWSAuth:
         """초기화"""
         self.credentials_file = os.path.join(os.path.expanduser("~"), ".aws_monitor_credentials")
         self.session = None
+        
+        # 리전별 세션 및 (리전, 서비스)별 클라이언트 풀
+        # boto3 세션은 스레드 안전하지 않으므로 풀 접근은 잠금으로 보호
+        self._pool_lock = threading.RLock()
+        self._session_pool = {}
+        self._client_pool = {}
+        self._pool_hits = 0
+        self._pool_misses = 0
         self.credentials = {
             'aws_access_key_id': '',
             'aws_secret_access_key': '',
@@ -68,11 +85,14 @@ class AWSAuth:
                 session_kwargs['region_name'] = self.credentials['region_name']
             
             self.session = boto3.Session(**session_kwargs)
+            # 자격 증명이 바뀌었으므로 이전 자격 증명으로 만든 세션/클라이언트 폐기
+            self.invalidate_pool()
             logger.info("AWS 세션이 생성되었습니다.")
             return True
         except Exception as e:
             logger.error(f"AWS 세션 생성 중 오류 발생: {e}")
             self.session = None
+            self.invalidate_pool()
             return False
     
     def validate_credentials(self, access_key, secret_key, region=None):
@@ -194,7 +214,7 @@ class AWSAuth:
             return False
         
         try:
-            sts_client = self.session.client('sts')
+            sts_client = self.get_client('sts')
             sts_client.get_caller_identity()
             return True
         except:
@@ -399,18 +419,83 @@ class AWSAuth:
                 return None
         
         if region_name and region_name != self.credentials.get('region_name'):
-            try:
-                # 특정 리전에 대한 새 세션 생성
-                return boto3.Session(
-                    aws_access_key_id=self.credentials['aws_access_key_id'],
-                    aws_secret_access_key=self.credentials['aws_secret_access_key'],
-                    region_name=region_name
-                )
-            except Exception as e:
-                logger.error(f"특정 리전({region_name})에 대한 세션 생성 중 오류 발생: {e}")
-                return None
+            with self._pool_lock:
+                session = self._session_pool.get(region_name)
+                if session is not None:
+                    return session
+                
+                try:
+                    # 특정 리전에 대한 새 세션 생성 후 풀에 보관
+                    session = boto3.Session(
+                        aws_access_key_id=self.credentials['aws_access_key_id'],
+                        aws_secret_access_key=self.credentials['aws_secret_access_key'],
+                        region_name=region_name
+                    )
+                except Exception as e:
+                    logger.error(f"특정 리전({region_name})에 대한 세션 생성 중 오류 발생: {e}")
+                    return None
+                
+                self._session_pool[region_name] = session
+                return session
         
         return self.session
+    
+    def get_client(self, service_name, region_name=None):
+        """(리전, 서비스)별로 재사용되는 AWS 클라이언트 반환
+        
+        boto3 클라이언트는 생성 비용(서비스 모델 로드, TLS 연결)이 크므로
+        한 번 만든 클라이언트를 풀에 보관하여 재사용합니다.
+        클라이언트에는 연결/읽기 제한 시간과 재시도 횟수(CLIENT_CONFIG)가 적용됩니다.
+        
+        Args:
+            service_name (str): AWS 서비스 이름 (예: 'ec2', 'ecs', 'eks')
+            region_name (str, optional): AWS 리전
+            
+        Returns:
+            botocore.client.BaseClient: AWS 클라이언트 (인증 정보가 없으면 None)
+        """
+        key = (region_name, service_name)
+        
+        with self._pool_lock:
+            client = self._client_pool.get(key)
+            if client is not None:
+                self._pool_hits += 1
+                return client
+            
+            self._pool_misses += 1
+        
+        session = self.get_session(region_name=region_name)
+        if not session:
+            return None
+        
+        with self._pool_lock:
+            # 잠금 해제 중 다른 스레드가 먼저 만들었으면 그것을 사용
+            client = self._client_pool.get(key)
+            if client is None:
+                client = session.client(service_name, config=CLIENT_CONFIG)
+                self._client_pool[key] = client
+            return client
+    
+    def invalidate_pool(self):
+        """세션/클라이언트 풀 초기화 (자격 증명 변경 시 호출)"""
+        with self._pool_lock:
+            self._session_pool.clear()
+            self._client_pool.clear()
+        logger.debug("AWS 세션/클라이언트 풀이 초기화되었습니다.")
+    
+    def get_pool_stats(self):
+        """세션/클라이언트 풀 사용 통계 반환
+        
+        Returns:
+            dict: 캐시 적중/미스 횟수 및 보관 중인 세션/클라이언트 수
+        """
+        with self._pool_lock:
+            return {
+                'hits': self._pool_hits,
+                'misses': self._pool_misses,
+                'sessions': len(self._session_pool),
+                'clients': len(self._client_pool)
+            }
 
 # 전역 인스턴스
 aws_auth = AWSAuth()
\ No newline at end of file
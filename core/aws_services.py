@@ -1,11 +1,14 @@
 """
 AWS 서비스 관리 모듈
 """
+import time
 import logging
 import boto3
-from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from botocore.exceptions import ClientError, WaiterError
 from core.aws_auth import aws_auth
 from core.config.config_loader import config
+from core.inventory_cache import inventory_cache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -15,8 +18,32 @@ aws_regions = config.settings.get("aws", {}).get("regions", ["ap-northeast-2"])
 DEFAULT_REGION = aws_regions[0] if aws_regions else "ap-northeast-2"
 logger.info(f"AWS 기본 리전: {DEFAULT_REGION}")
 
+# 멀티 리전 조회 설정
+REGION_MAX_WORKERS = config.get("aws", "region_max_workers", 5)
+REGION_TIMEOUT_SECONDS = config.get("aws", "region_timeout_seconds", 10)
+
+# describe_instances 페이지 크기 (5 ~ 1000)
+EC2_PAGE_SIZE = config.get("aws", "ec2_page_size", 100)
+
+# 리소스 상세 조회(describe_*)를 동시에 실행할 최대 수
+DESCRIBE_MAX_WORKERS = config.get("aws", "describe_max_workers", 8)
+
+# ECS describe API 배치 한도
+ECS_DESCRIBE_CLUSTERS_LIMIT = 100
+ECS_DESCRIBE_SERVICES_LIMIT = 10
+
+# 시작한 리소스의 준비 상태 대기 설정 (AWS waiter 폴링 간격과 최대 대기 시간)
+READINESS_POLL_SECONDS = config.get("aws", "readiness_poll_seconds", 10)
+READINESS_TIMEOUT_SECONDS = config.get("aws", "readiness_timeout_seconds", 600)
+
+# 리전별 조회를 동시에 실행하기 위한 스레드 풀 (조회마다 생성하지 않고 재사용)
+_region_executor = ThreadPoolExecutor(max_workers=REGION_MAX_WORKERS, thread_name_prefix="aws-region")
+
+# 상세 조회 전용 스레드 풀 (리전 스레드 풀 안에서 호출되어도 교착되지 않도록 분리)
+_describe_executor = ThreadPoolExecutor(max_workers=DESCRIBE_MAX_WORKERS, thread_name_prefix="aws-describe")
+
 def _get_ec2_client(region):
-    """EC2 클라이언트를 생성합니다.
+    """EC2 클라이언트를 반환합니다. (리전별로 풀에서 재사용)
     
     Args:
         region: AWS 리전
@@ -24,13 +51,10 @@ def _get_ec2_client(region):
     Returns:
         boto3.client: EC2 클라이언트
     """
-    session = aws_auth.get_session(region_name=region)
-    if session:
-        return session.client('ec2')
-    return None
+    return aws_auth.get_client('ec2', region_name=region)
 
 def _get_ecs_client(region):
-    """ECS 클라이언트를 생성합니다.
+    """ECS 클라이언트를 반환합니다. (리전별로 풀에서 재사용)
     
     Args:
         region: AWS 리전
@@ -38,13 +62,10 @@ def _get_ecs_client(region):
     Returns:
         boto3.client: ECS 클라이언트
     """
-    session = aws_auth.get_session(region_name=region)
-    if session:
-        return session.client('ecs')
-    return None
+    return aws_auth.get_client('ecs', region_name=region)
 
 def _get_eks_client(region):
-    """EKS 클라이언트를 생성합니다.
+    """EKS 클라이언트를 반환합니다. (리전별로 풀에서 재사용)
     
     Args:
         region: AWS 리전
@@ -52,60 +73,278 @@ def _get_eks_client(region):
     Returns:
         boto3.client: EKS 클라이언트
     """
-    session = aws_auth.get_session(region_name=region)
-    if session:
-        return session.client('eks')
-    return None
+    return aws_auth.get_client('eks', region_name=region)
+
+def _fan_out_regions(func, regions, timeout=None, answered=None):
+    """여러 리전에 대해 동일한 조회 함수를 동시에 실행합니다.
+    
+    리전 수가 스레드 수보다 많으면 일부 리전은 대기열에서 기다리므로, 제한 시간은 리전별로
+    조회가 실제로 시작된 시점부터 잽니다. 제한 시간을 넘긴 조회는 결과에서 제외할 뿐 중단할 수 없으므로
+    AWS 클라이언트의 연결/읽기 제한 시간(aws_auth.CLIENT_CONFIG)으로 스레드 점유 시간을 제한합니다.
+    
+    Args:
+        func: 리전을 인자로 받아 리스트를 반환하는 함수
+        regions: 조회할 리전 목록
+        timeout: 리전별 최대 대기 시간(초), None이면 설정값 사용
+        answered: 결과를 정상적으로 받은 리전을 추가할 목록 (선택 사항)
+        
+    Returns:
+        list: 리전 목록 순서대로 병합된 결과
+    """
+    if timeout is None:
+        timeout = REGION_TIMEOUT_SECONDS
+    
+    started = {}
+    
+    def _run(index, current_region):
+        started[index] = time.monotonic()
+        return func(current_region)
+    
+    futures = [_region_executor.submit(_run, index, current_region) for index, current_region in enumerate(regions)]
+    pending = set(range(len(futures)))
+    timed_out = set()
+    while pending:
+        now = time.monotonic()
+        for index in [index for index in pending if index in started and now - started[index] >= timeout]:
+            if not futures[index].done():
+                timed_out.add(index)
+                pending.discard(index)
+        pending = {index for index in pending if not futures[index].done()}
+        if not pending:
+            break
+        
+        # 가장 먼저 마감되는 리전까지 또는 다른 리전이 끝날 때까지 대기 (대기열의 리전은 최대 timeout마다 다시 확인)
+        deadlines = [started[index] + timeout for index in pending if index in started]
+        wait_seconds = max(0, min(deadlines) - now) if deadlines else timeout
+        wait([futures[index] for index in pending], timeout=min(wait_seconds, timeout), return_when=FIRST_COMPLETED)
+    
+    results = []
+    for index, (current_region, future) in enumerate(zip(regions, futures)):
+        if index in timed_out:
+            logger.warning(f"리전 조회 시간 초과로 결과에서 제외합니다 (리전: {current_region}, 제한: {timeout}초)")
+            continue
+        
+        try:
+            results.extend(future.result())
+            if answered is not None:
+                answered.append(current_region)
+        except Exception as e:
+            logger.error(f"리전 조회 중 오류 발생 (리전: {current_region}): {e}")
+    
+    return results
+
+def _format_ec2_instance(instance, region):
+    """describe_instances 응답의 인스턴스 정보를 대시보드 형식으로 변환합니다.
+    
+    Args:
+        instance: describe_instances 응답의 인스턴스 항목
+        region: AWS 리전
+        
+    Returns:
+        dict: 인스턴스 정보
+    """
+    # 인스턴스 이름 찾기
+    name = ""
+    for tag in instance.get('Tags', []):
+        if tag['Key'] == 'Name':
+            name = tag['Value']
+            break
+    
+    return {
+        'id': instance.get('InstanceId'),
+        'type': instance.get('InstanceType'),
+        'state': instance.get('State', {}).get('Name'),
+        'name': name,
+        'public_ip': instance.get('PublicIpAddress'),
+        'private_ip': instance.get('PrivateIpAddress'),
+        'region': region  # 리전 정보 추가
+    }
+
+def iter_ec2_instance_pages(region):
+    """단일 리전의 EC2 인스턴스를 페이지 단위로 조회합니다.
+    
+    describe_instances 페이지네이터를 사용하므로 인스턴스가 많은 계정에서도 잘리지 않고,
+    한 번에 한 페이지만 메모리에 유지합니다.
+    
+    Args:
+        region: AWS 리전
+        
+    Yields:
+        list: 페이지별 EC2 인스턴스 목록
+    """
+    client = _get_ec2_client(region)
+    if not client:
+        logger.error(f"AWS 인증 정보가 없습니다. 리전: {region}")
+        return
+    
+    try:
+        paginator = client.get_paginator('describe_instances')
+        for page in paginator.paginate(PaginationConfig={'PageSize': EC2_PAGE_SIZE}):
+            instances = []
+            for reservation in page.get('Reservations', []):
+                for instance in reservation.get('Instances', []):
+                    instances.append(_format_ec2_instance(instance, region))
+            yield instances
+        
+    except ClientError as e:
+        logger.error(f"EC2 인스턴스 목록 조회 중 오류 발생 (리전: {region}): {e}")
+
+def _map_concurrent(func, items):
+    """상세 조회 함수를 항목별로 동시에 실행합니다.
+    
+    Args:
+        func: 항목 하나를 받아 결과를 반환하는 함수 (실패 시 None 반환 가능)
+        items: 조회할 항목 목록
+        
+    Returns:
+        list: 입력 순서대로 정렬된 결과 (None 결과는 제외)
+    """
+    if len(items) <= 1:
+        results = [func(item) for item in items]
+    else:
+        results = list(_describe_executor.map(func, items))
+    return [result for result in results if result is not None]
+
+def _chunked(items, size):
+    """목록을 지정한 크기의 묶음으로 나눕니다.
+    
+    Args:
+        items: 나눌 목록
+        size: 묶음 크기
+        
+    Returns:
+        list: 묶음 목록
+    """
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _paginate(client, operation, result_key, **kwargs):
+    """페이지네이터로 목록 API의 모든 페이지를 조회합니다.
+    
+    Args:
+        client: boto3 클라이언트
+        operation: 목록 API 이름 (예: 'list_clusters')
+        result_key: 응답에서 항목 목록이 들어 있는 키
+        **kwargs: API 파라미터
+        
+    Returns:
+        list: 모든 페이지의 항목
+    """
+    items = []
+    paginator = client.get_paginator(operation)
+    for page in paginator.paginate(**kwargs):
+        items.extend(page.get(result_key, []))
+    return items
+
+def _list_ec2_instances_in_region(region):
+    """단일 리전의 EC2 인스턴스 목록을 조회합니다.
+    
+    Args:
+        region: AWS 리전
+        
+    Returns:
+        list: EC2 인스턴스 목록
+    """
+    instances = []
+    for page in iter_ec2_instance_pages(region):
+        instances.extend(page)
+    return instances
 
 def list_ec2_instances(region=None):
     """EC2 인스턴스 목록을 조회합니다.
     
+    리전이 지정되지 않으면 설정된 모든 리전을 동시에 조회하고,
+    결과는 설정된 리전 순서대로 병합합니다.
+    
     Args:
         region: AWS 리전 (None인 경우 모든 리전 조회)
         
     Returns:
         list: EC2 인스턴스 목록
     """
-    instances = []
-    
     # 모든 리전을 조회하는 경우
     regions_to_check = [region] if region else aws_regions
     logger.info(f"EC2 인스턴스 조회 리전: {regions_to_check}")
     
-    for current_region in regions_to_check:
-        client = _get_ec2_client(current_region)
-        if not client:
-            logger.error(f"AWS 인증 정보가 없습니다. 리전: {current_region}")
-            continue
+    if len(regions_to_check) == 1:
+        return _list_ec2_instances_in_region(regions_to_check[0])
+    
+    return _fan_out_regions(_list_ec2_instances_in_region, regions_to_check)
+
+def _list_ec2_instance_states_in_region(region):
+    """단일 리전의 EC2 인스턴스 상태를 describe_instance_status로 조회합니다.
+    
+    Args:
+        region: AWS 리전
+        
+    Returns:
+        list: (인스턴스 ID, 상태) 튜플 목록
+        
+    Raises:
+        RuntimeError: 인증 정보가 없는 경우
+        ClientError: 조회에 실패한 경우 (빈 결과와 구분하기 위해 그대로 전달)
+    """
+    client = _get_ec2_client(region)
+    if not client:
+        raise RuntimeError(f"AWS 인증 정보가 없습니다. 리전: {region}")
+    
+    statuses = _paginate(client, 'describe_instance_status', 'InstanceStatuses', IncludeAllInstances=True)
+    return [(status.get('InstanceId'), status.get('InstanceState', {}).get('Name')) for status in statuses]
+
+def list_ec2_instance_states(region=None):
+    """EC2 인스턴스 상태만 가볍게 조회합니다.
+    
+    describe_instances 대신 응답이 작은 describe_instance_status(IncludeAllInstances)를 사용하므로
+    자주 반복되는 상태 갱신에 적합합니다.
+    
+    Args:
+        region: AWS 리전 (None인 경우 모든 리전 조회)
         
+    Returns:
+        tuple: (인스턴스 ID별 상태 (예: {'i-123': 'running'}), 응답한 리전 목록)
+               - 오류나 시간 초과로 응답하지 않은 리전의 인스턴스는 상태에 포함되지 않음
+    """
+    regions_to_check = [region] if region else aws_regions
+    answered = []
+    
+    if len(regions_to_check) == 1:
         try:
-            response = client.describe_instances()
-            
-            for reservation in response.get('Reservations', []):
-                for instance in reservation.get('Instances', []):
-                    # 인스턴스 이름 찾기
-                    name = ""
-                    for tag in instance.get('Tags', []):
-                        if tag['Key'] == 'Name':
-                            name = tag['Value']
-                            break
-                    
-                    instances.append({
-                        'id': instance.get('InstanceId'),
-                        'type': instance.get('InstanceType'),
-                        'state': instance.get('State', {}).get('Name'),
-                        'name': name,
-                        'public_ip': instance.get('PublicIpAddress'),
-                        'private_ip': instance.get('PrivateIpAddress'),
-                        'region': current_region  # 리전 정보 추가
-                    })
-            
-        except ClientError as e:
-            logger.error(f"EC2 인스턴스 목록 조회 중 오류 발생 (리전: {current_region}): {e}")
+            states = dict(_list_ec2_instance_states_in_region(regions_to_check[0]))
+            answered.append(regions_to_check[0])
+        except Exception as e:
+            logger.error(f"EC2 인스턴스 상태 조회 중 오류 발생 (리전: {regions_to_check[0]}): {e}")
+            states = {}
+        return states, answered
     
-    # print("EC2 인스턴스 목록:", instances)
+    states = dict(_fan_out_regions(_list_ec2_instance_states_in_region, regions_to_check, answered=answered))
+    return states, answered
+
+def describe_ec2_instance_states(instance_ids, region):
+    """지정한 EC2 인스턴스들의 상태를 describe_instance_status 한 번의 호출로 조회합니다.
     
-    return instances
+    Args:
+        instance_ids: EC2 인스턴스 ID 목록 (같은 리전)
+        region: AWS 리전
+        
+    Returns:
+        dict: 인스턴스 ID별 상태 (조회 실패 시 None, 존재하지 않는 인스턴스는 제외)
+    """
+    instance_ids = list(dict.fromkeys(instance_ids))
+    if not instance_ids:
+        return {}
+    
+    client = _get_ec2_client(region)
+    if not client:
+        logger.error(f"AWS 인증 정보가 없습니다. 리전: {region}")
+        return None
+    
+    try:
+        statuses = _paginate(client, 'describe_instance_status', 'InstanceStatuses',
+                             InstanceIds=instance_ids, IncludeAllInstances=True)
+        return {status.get('InstanceId'): status.get('InstanceState', {}).get('Name') for status in statuses}
+        
+    except ClientError as e:
+        logger.error(f"EC2 인스턴스 상태 조회 중 오류 발생 (리전: {region}): {e}")
+        return None
 
 def start_ec2_instance(instance_id, region):
     """EC2 인스턴스를 시작합니다.
@@ -134,6 +373,7 @@ def start_ec2_instance(instance_id, region):
         
         # 인스턴스 시작
         client.start_instances(InstanceIds=[instance_id])
+        inventory_cache.invalidate("ec2", region)
         logger.info(f"인스턴스 {instance_id}가 시작되었습니다.")
         return True
         
@@ -168,6 +408,7 @@ def stop_ec2_instance(instance_id, region):
         
         # 인스턴스 중지
         client.stop_instances(InstanceIds=[instance_id])
+        inventory_cache.invalidate("ec2", region)
         logger.info(f"인스턴스 {instance_id}가 중지되었습니다.")
         return True
         
@@ -175,9 +416,153 @@ def stop_ec2_instance(instance_id, region):
         logger.error(f"EC2 인스턴스 중지 중 오류 발생: {e}")
         return False
 
+def _set_ec2_instances_state(instance_ids, region, action):
+    """여러 EC2 인스턴스를 한 번의 상태 확인과 한 번의 시작/중지 호출로 처리합니다.
+    
+    묶음 호출이 실패하면(예: 존재하지 않는 인스턴스 ID 포함) 인스턴스별 호출로 대체합니다.
+    
+    Args:
+        instance_ids: EC2 인스턴스 ID 목록 (같은 리전)
+        region: AWS 리전
+        action: 'start' 또는 'stop'
+        
+    Returns:
+        dict: 인스턴스 ID별 성공 여부
+    """
+    single_func = start_ec2_instance if action == 'start' else stop_ec2_instance
+    # 이미 원하는 상태이거나 전환 중이어서 호출이 필요 없는 상태
+    done_states = ('running',) if action == 'start' else ('stopped', 'stopping')
+    
+    instance_ids = list(dict.fromkeys(instance_ids))
+    if not instance_ids:
+        return {}
+    
+    client = _get_ec2_client(region)
+    if not client:
+        logger.error("AWS 인증 정보가 없습니다.")
+        return {instance_id: False for instance_id in instance_ids}
+    
+    try:
+        response = client.describe_instances(InstanceIds=instance_ids)
+    except ClientError as e:
+        logger.warning(f"EC2 인스턴스 일괄 상태 확인 실패, 개별 처리로 전환합니다 (리전: {region}): {e}")
+        return {instance_id: single_func(instance_id, region) for instance_id in instance_ids}
+    
+    states = {}
+    for reservation in response.get('Reservations', []):
+        for instance in reservation.get('Instances', []):
+            states[instance.get('InstanceId')] = instance.get('State', {}).get('Name')
+    
+    results = {}
+    targets = []
+    for instance_id in instance_ids:
+        state = states.get(instance_id)
+        if state is None:
+            logger.error(f"인스턴스 {instance_id}를 찾을 수 없습니다. (리전: {region})")
+            results[instance_id] = False
+        elif state in done_states:
+            logger.info(f"인스턴스 {instance_id}가 이미 {state} 상태입니다.")
+            results[instance_id] = True
+        else:
+            targets.append(instance_id)
+    
+    if not targets:
+        return results
+    
+    try:
+        if action == 'start':
+            client.start_instances(InstanceIds=targets)
+        else:
+            client.stop_instances(InstanceIds=targets)
+        inventory_cache.invalidate("ec2", region)
+        logger.info(f"인스턴스 {len(targets)}개 {'시작' if action == 'start' else '중지'} 요청 완료 (리전: {region}): {targets}")
+        results.update({instance_id: True for instance_id in targets})
+    except ClientError as e:
+        logger.warning(f"EC2 인스턴스 일괄 {action} 실패, 개별 처리로 전환합니다 (리전: {region}): {e}")
+        results.update({instance_id: single_func(instance_id, region) for instance_id in targets})
+    
+    return results
+
+def start_ec2_instances(instance_ids, region):
+    """같은 리전의 여러 EC2 인스턴스를 한 번에 시작합니다.
+    
+    Args:
+        instance_ids: EC2 인스턴스 ID 목록
+        region: AWS 리전
+        
+    Returns:
+        dict: 인스턴스 ID별 성공 여부
+    """
+    return _set_ec2_instances_state(instance_ids, region, 'start')
+
+def stop_ec2_instances(instance_ids, region):
+    """같은 리전의 여러 EC2 인스턴스를 한 번에 중지합니다.
+    
+    Args:
+        instance_ids: EC2 인스턴스 ID 목록
+        region: AWS 리전
+        
+    Returns:
+        dict: 인스턴스 ID별 성공 여부
+    """
+    return _set_ec2_instances_state(instance_ids, region, 'stop')
+
+def _format_ecs_cluster(cluster):
+    """describe_clusters 응답의 클러스터 정보를 대시보드 형식으로 변환합니다."""
+    return {
+        'name': cluster.get('clusterName'),
+        'status': cluster.get('status'),
+        'running_tasks_count': cluster.get('runningTasksCount'),
+        'pending_tasks_count': cluster.get('pendingTasksCount'),
+        'active_services_count': cluster.get('activeServicesCount')
+    }
+
+def _format_ecs_service(service):
+    """describe_services 응답의 서비스 정보를 대시보드 형식으로 변환합니다."""
+    return {
+        'name': service.get('serviceName'),
+        'cluster_name': service.get('clusterArn', '').split('/')[-1],
+        'status': service.get('status'),
+        'desired_count': service.get('desiredCount'),
+        'running_count': service.get('runningCount'),
+        'pending_count': service.get('pendingCount')
+    }
+
+def _describe_ecs_service_chunks(client, tasks):
+    """(클러스터, 서비스 목록) 묶음들에 대해 describe_services를 동시에 호출합니다.
+    
+    Args:
+        client: ECS 클라이언트
+        tasks: (클러스터, 서비스 ARN 또는 이름 목록) 튜플 목록
+        
+    Returns:
+        list: describe_services 응답의 서비스 항목 (입력 순서 유지)
+    """
+    # API 한도(10개)에 맞춰 묶음을 나눈 뒤 모든 묶음을 한 번에 동시 실행
+    chunk_tasks = []
+    for cluster, services in tasks:
+        for chunk in _chunked(services, ECS_DESCRIBE_SERVICES_LIMIT):
+            chunk_tasks.append((cluster, chunk))
+    
+    def _describe(task):
+        cluster, chunk = task
+        try:
+            return client.describe_services(cluster=cluster, services=chunk).get('services', [])
+        except ClientError as e:
+            logger.error(f"ECS 서비스 상세 조회 중 오류 발생 (클러스터: {cluster}): {e}")
+            return []
+    
+    services = []
+    for chunk_result in _map_concurrent(_describe, chunk_tasks):
+        services.extend(chunk_result)
+    return services
+
 def list_ecs_clusters(region):
     """ECS 클러스터 목록을 조회합니다.
     
+    list_clusters 전체 페이지를 조회한 뒤 describe_clusters 한도(100개)에 맞춰
+    나눈 묶음을 동시에 조회합니다.
+    
     Args:
         region: AWS 리전
         
@@ -189,25 +574,23 @@ def list_ecs_clusters(region):
         logger.error("AWS 인증 정보가 없습니다.")
         return []
     
+    def _describe(chunk):
+        try:
+            return client.describe_clusters(clusters=chunk).get('clusters', [])
+        except ClientError as e:
+            logger.error(f"ECS 클러스터 상세 조회 중 오류 발생: {e}")
+            return []
+    
     try:
-        response = client.list_clusters()
-        cluster_arns = response.get('clusterArns', [])
+        cluster_arns = _paginate(client, 'list_clusters', 'clusterArns')
         
         if not cluster_arns:
             return []
             
         # 클러스터 정보 조회
-        response = client.describe_clusters(clusters=cluster_arns)
         clusters = []
-        
-        for cluster in response.get('clusters', []):
-            clusters.append({
-                'name': cluster.get('clusterName'),
-                'status': cluster.get('status'),
-                'running_tasks_count': cluster.get('runningTasksCount'),
-                'pending_tasks_count': cluster.get('pendingTasksCount'),
-                'active_services_count': cluster.get('activeServicesCount')
-            })
+        for chunk_result in _map_concurrent(_describe, _chunked(cluster_arns, ECS_DESCRIBE_CLUSTERS_LIMIT)):
+            clusters.extend(_format_ecs_cluster(cluster) for cluster in chunk_result)
         
         return clusters
         
@@ -231,31 +614,76 @@ def list_ecs_services(cluster_name, region):
         return []
     
     try:
-        response = client.list_services(cluster=cluster_name)
-        service_arns = response.get('serviceArns', [])
+        service_arns = _paginate(client, 'list_services', 'serviceArns', cluster=cluster_name)
         
         if not service_arns:
             return []
             
         # 서비스 정보 조회
-        response = client.describe_services(cluster=cluster_name, services=service_arns)
-        services = []
+        services = _describe_ecs_service_chunks(client, [(cluster_name, service_arns)])
+        return [_format_ecs_service(service) for service in services]
         
-        for service in response.get('services', []):
-            services.append({
-                'name': service.get('serviceName'),
-                'status': service.get('status'),
-                'desired_count': service.get('desiredCount'),
-                'running_count': service.get('runningCount'),
-                'pending_count': service.get('pendingCount')
-            })
+    except ClientError as e:
+        logger.error(f"ECS 서비스 목록 조회 중 오류 발생: {e}")
+        return []
+
+def list_all_ecs_services(region):
+    """리전의 모든 클러스터에 있는 ECS 서비스 목록을 한 번에 조회합니다.
+    
+    클러스터별 서비스 목록을 동시에 조회한 뒤, 모든 클러스터의 describe_services
+    묶음을 한꺼번에 동시 실행합니다.
+    
+    Args:
+        region: AWS 리전
         
-        return services
+    Returns:
+        list: ECS 서비스 목록 (각 항목에 cluster_name 포함)
+    """
+    client = _get_ecs_client(region)
+    if not client:
+        logger.error("AWS 인증 정보가 없습니다.")
+        return []
+    
+    def _list_services(cluster_arn):
+        try:
+            return (cluster_arn, _paginate(client, 'list_services', 'serviceArns', cluster=cluster_arn))
+        except ClientError as e:
+            logger.error(f"ECS 서비스 목록 조회 중 오류 발생 (클러스터: {cluster_arn}): {e}")
+            return None
+    
+    try:
+        cluster_arns = _paginate(client, 'list_clusters', 'clusterArns')
+        
+        if not cluster_arns:
+            return []
+        
+        tasks = [task for task in _map_concurrent(_list_services, cluster_arns) if task[1]]
+        services = _describe_ecs_service_chunks(client, tasks)
+        return [_format_ecs_service(service) for service in services]
         
     except ClientError as e:
-        logger.error(f"ECS 서비스 목록 조회 중 오류 발생: {e}")
+        logger.error(f"ECS 전체 서비스 목록 조회 중 오류 발생: {e}")
         return []
 
+def describe_ecs_services(cluster_name, service_names, region):
+    """지정한 ECS 서비스들의 상태를 describe_services 묶음 호출로 조회합니다.
+    
+    Args:
+        cluster_name: ECS 클러스터 이름
+        service_names: ECS 서비스 이름 목록
+        region: AWS 리전
+        
+    Returns:
+        list: ECS 서비스 목록 (조회되지 않은 서비스는 제외)
+    """
+    client = _get_ecs_client(region)
+    if not client:
+        logger.error("AWS 인증 정보가 없습니다.")
+        return []
+    
+    services = _describe_ecs_service_chunks(client, [(cluster_name, list(service_names))])
+    return [_format_ecs_service(service) for service in services]
+
 def start_ecs_service(cluster_name, service_name, region):
     """ECS 서비스를 시작합니다.
     
@@ -297,6 +725,8 @@ def start_ecs_service(cluster_name, service_name, region):
             service=service_name,
             desiredCount=1
         )
+        inventory_cache.invalidate("ecs", region)
+        inventory_cache.invalidate("ecs_services", region)
         
         logger.info(f"서비스 {service_name}가 시작되었습니다.")
         return True
@@ -346,6 +776,8 @@ def stop_ecs_service(cluster_name, service_name, region):
             service=service_name,
             desiredCount=0
         )
+        inventory_cache.invalidate("ecs", region)
+        inventory_cache.invalidate("ecs_services", region)
         
         logger.info(f"서비스 {service_name}가 중지되었습니다.")
         return True
@@ -368,33 +800,45 @@ def list_eks_clusters(region):
         logger.error("AWS 인증 정보가 없습니다.")
         return []
     
+    def _describe(cluster_name):
+        try:
+            cluster = client.describe_cluster(name=cluster_name).get('cluster', {})
+        except ClientError as e:
+            logger.error(f"EKS 클러스터 {cluster_name} 조회 중 오류 발생: {e}")
+            return None
+        
+        return {
+            'name': cluster.get('name'),
+            'status': cluster.get('status'),
+            'version': cluster.get('version'),
+            'endpoint': cluster.get('endpoint'),
+            'created_at': cluster.get('createdAt')
+        }
+    
     try:
-        response = client.list_clusters()
-        cluster_names = response.get('clusters', [])
+        cluster_names = _paginate(client, 'list_clusters', 'clusters')
         
         if not cluster_names:
             return []
             
-        # 클러스터 정보 조회
-        clusters = []
-        for cluster_name in cluster_names:
-            cluster_info = client.describe_cluster(name=cluster_name)
-            cluster = cluster_info.get('cluster', {})
-            
-            clusters.append({
-                'name': cluster.get('name'),
-                'status': cluster.get('status'),
-                'version': cluster.get('version'),
-                'endpoint': cluster.get('endpoint'),
-                'created_at': cluster.get('createdAt')
-            })
-        
-        return clusters
+        # 클러스터 정보 조회 (describe_max_workers 만큼 동시 실행)
+        return _map_concurrent(_describe, cluster_names)
         
     except ClientError as e:
         logger.error(f"EKS 클러스터 목록 조회 중 오류 발생: {e}")
         return []
 
+def _format_eks_nodegroup(nodegroup):
+    """describe_nodegroup 응답의 노드그룹 정보를 대시보드 형식으로 변환합니다."""
+    return {
+        'name': nodegroup.get('nodegroupName'),
+        'status': nodegroup.get('status'),
+        'instance_type': nodegroup.get('instanceTypes', [])[0] if nodegroup.get('instanceTypes') else None,
+        'desired_size': nodegroup.get('scalingConfig', {}).get('desiredSize'),
+        'min_size': nodegroup.get('scalingConfig', {}).get('minSize'),
+        'max_size': nodegroup.get('scalingConfig', {}).get('maxSize')
+    }
+
 def list_eks_nodegroups(cluster_name, region):
     """EKS 노드그룹 목록을 조회합니다.
     
@@ -410,37 +854,63 @@ def list_eks_nodegroups(cluster_name, region):
         logger.error("AWS 인증 정보가 없습니다.")
         return []
     
+    def _describe(nodegroup_name):
+        try:
+            nodegroup = client.describe_nodegroup(
+                clusterName=cluster_name,
+                nodegroupName=nodegroup_name
+            ).get('nodegroup', {})
+        except ClientError as e:
+            logger.error(f"EKS 노드그룹 {nodegroup_name} 조회 중 오류 발생: {e}")
+            return None
+        
+        return _format_eks_nodegroup(nodegroup)
+    
     try:
-        response = client.list_nodegroups(clusterName=cluster_name)
-        nodegroup_names = response.get('nodegroups', [])
+        nodegroup_names = _paginate(client, 'list_nodegroups', 'nodegroups', clusterName=cluster_name)
         
         if not nodegroup_names:
             return []
             
-        # 노드그룹 정보 조회
-        nodegroups = []
-        for nodegroup_name in nodegroup_names:
-            nodegroup_info = client.describe_nodegroup(
-                clusterName=cluster_name,
-                nodegroupName=nodegroup_name
-            )
-            nodegroup = nodegroup_info.get('nodegroup', {})
-            
-            nodegroups.append({
-                'name': nodegroup.get('nodegroupName'),
-                'status': nodegroup.get('status'),
-                'instance_type': nodegroup.get('instanceTypes', [])[0] if nodegroup.get('instanceTypes') else None,
-                'desired_size': nodegroup.get('scalingConfig', {}).get('desiredSize'),
-                'min_size': nodegroup.get('scalingConfig', {}).get('minSize'),
-                'max_size': nodegroup.get('scalingConfig', {}).get('maxSize')
-            })
-        
-        return nodegroups
+        # 노드그룹 정보 조회 (describe_max_workers 만큼 동시 실행)
+        return _map_concurrent(_describe, nodegroup_names)
         
     except ClientError as e:
         logger.error(f"EKS 노드그룹 목록 조회 중 오류 발생: {e}")
         return []
 
+def describe_eks_nodegroups(cluster_name, nodegroup_names, region):
+    """지정한 EKS 노드그룹들의 상태를 조회합니다.
+    
+    EKS에는 묶음 describe API가 없으므로 describe_nodegroup을 동시에 호출합니다.
+    
+    Args:
+        cluster_name: EKS 클러스터 이름
+        nodegroup_names: EKS 노드그룹 이름 목록
+        region: AWS 리전
+        
+    Returns:
+        list: EKS 노드그룹 목록 (조회되지 않은 노드그룹은 제외)
+    """
+    client = _get_eks_client(region)
+    if not client:
+        logger.error("AWS 인증 정보가 없습니다.")
+        return []
+    
+    def _describe(nodegroup_name):
+        try:
+            nodegroup = client.describe_nodegroup(
+                clusterName=cluster_name,
+                nodegroupName=nodegroup_name
+            ).get('nodegroup', {})
+        except ClientError as e:
+            logger.error(f"EKS 노드그룹 {nodegroup_name} 조회 중 오류 발생: {e}")
+            return None
+        
+        return _format_eks_nodegroup(nodegroup)
+    
+    return _map_concurrent(_describe, list(dict.fromkeys(nodegroup_names)))
+
 def scale_eks_nodegroup(cluster_name, nodegroup_name, region, desired_size):
     """EKS 노드그룹을 스케일링합니다.
     
@@ -498,6 +968,7 @@ def scale_eks_nodegroup(cluster_name, nodegroup_name, region, desired_size):
                 'maxSize': max_size
             }
         )
+        inventory_cache.invalidate("eks", region)
         
         action = "시작" if desired_size > 0 else "중지"
         logger.info(f"노드그룹 {nodegroup_name}가 {action}되었습니다. (크기: {desired_size})")
@@ -505,4 +976,94 @@ def scale_eks_nodegroup(cluster_name, nodegroup_name, region, desired_size):
         
     except ClientError as e:
         logger.error(f"EKS 노드그룹 스케일링 중 오류 발생: {e}")
-        return False
\ No newline at end of file
+        return False
+
+def _wait(client, waiter_name, timeout=None, **kwargs):
+    """AWS waiter로 리소스가 준비될 때까지 대기합니다.
+    
+    Args:
+        client: boto3 클라이언트
+        waiter_name: waiter 이름 (예: 'instance_running')
+        timeout: 최대 대기 시간(초), None이면 설정값 사용
+        **kwargs: waiter 파라미터
+        
+    Returns:
+        bool: 제한 시간 안에 준비되었는지 여부
+    """
+    if timeout is None:
+        timeout = READINESS_TIMEOUT_SECONDS
+    
+    try:
+        client.get_waiter(waiter_name).wait(
+            WaiterConfig={
+                'Delay': READINESS_POLL_SECONDS,
+                'MaxAttempts': max(1, int(timeout // READINESS_POLL_SECONDS))
+            },
+            **kwargs
+        )
+        return True
+    except (WaiterError, ClientError) as e:
+        logger.warning(f"리소스 준비 대기 실패 ({waiter_name}): {e}")
+        return False
+
+def wait_ec2_instances_running(instance_ids, region, timeout=None):
+    """EC2 인스턴스들이 running 상태가 될 때까지 대기합니다.
+    
+    Args:
+        instance_ids: EC2 인스턴스 ID 목록 (같은 리전)
+        region: AWS 리전
+        timeout: 최대 대기 시간(초)
+        
+    Returns:
+        dict: 인스턴스 ID별 준비 여부
+    """
+    instance_ids = list(dict.fromkeys(instance_ids))
+    client = _get_ec2_client(region)
+    if not client:
+        logger.error("AWS 인증 정보가 없습니다.")
+        return {instance_id: False for instance_id in instance_ids}
+    
+    if _wait(client, 'instance_running', timeout, InstanceIds=instance_ids):
+        return {instance_id: True for instance_id in instance_ids}
+    
+    # 일부 인스턴스만 실패한 경우 현재 상태로 인스턴스별 결과 판단
+    states = describe_ec2_instance_states(instance_ids, region) or {}
+    return {instance_id: states.get(instance_id) == 'running' for instance_id in instance_ids}
+
+def wait_ecs_services_stable(cluster_name, service_names, region, timeout=None):
+    """ECS 서비스들의 실행 중인 태스크 수가 원하는 수에 도달할 때까지 대기합니다.
+    
+    Args:
+        cluster_name: ECS 클러스터 이름
+        service_names: ECS 서비스 이름 목록 (최대 10개)
+        region: AWS 리전
+        timeout: 최대 대기 시간(초)
+        
+    Returns:
+        bool: 준비 여부
+    """
+    client = _get_ecs_client(region)
+    if not client:
+        logger.error("AWS 인증 정보가 없습니다.")
+        return False
+    
+    return _wait(client, 'services_stable', timeout, cluster=cluster_name, services=list(service_names))
+
+def wait_eks_nodegroup_active(cluster_name, nodegroup_name, region, timeout=None):
+    """EKS 노드그룹이 ACTIVE 상태가 될 때까지 대기합니다.
+    
+    Args:
+        cluster_name: EKS 클러스터 이름
+        nodegroup_name: EKS 노드그룹 이름
+        region: AWS 리전
+        timeout: 최대 대기 시간(초)
+        
+    Returns:
+        bool: 준비 여부
+    """
+    client = _get_eks_client(region)
+    if not client:
+        logger.error("AWS 인증 정보가 없습니다.")
+        return False
+    
+    return _wait(client, 'nodegroup_active', timeout, clusterName=cluster_name, nodegroupName=nodegroup_name)
@@ -10,7 +10,9 @@ from typing import Dict, Any, Optional, Callable, Awaitable
 from functools import wraps
 from core.commands.command_registry import register_action_handler, register_type_handler, register_handler
 from core.messages import message_format
-from core import aws_services
+from core import aws_async
+from core.config.config_loader import config
+from core.inventory_delta import inventory_delta, MODE_DELTA
 import bcrypt
 import secrets
 import string
@@ -23,6 +25,9 @@ from cryptography.hazmat.primitives import hashes, serialization
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 새로고침 결과를 다른 클라이언트에게 변경분(delta)으로만 브로드캐스트할지 여부
+DELTA_BROADCAST = config.get("aws", "delta_broadcast", False)
+
 # 클라이언트 브로드캐스트 함수 참조를 위한 변수
 # 순환 참조를 방지하기 위해 런타임에 설정됨
 _ws_broadcast_func = None
@@ -72,6 +77,33 @@ async def broadcast_to_clients(message, exclude_client=None):
             
     return success
 
+async def send_to_client(client, message):
+    """
+    요청한 클라이언트에게만 메시지를 전송합니다.
+    
+    Args:
+        client: WebSocket 객체 또는 TCP 소켓
+        message: 전송할 메시지 딕셔너리
+        
+    Returns:
+        bool: 전송 성공 여부
+    """
+    if client is None:
+        return False
+    
+    try:
+        message_str = json.dumps(message, ensure_ascii=False, default=str)
+        if hasattr(client, "sendall"):
+            # TCP 소켓
+            client.sendall(message_str.encode("utf-8"))
+        else:
+            # WebSocket
+            await client.send(message_str)
+        return True
+    except Exception as e:
+        logger.error(f"클라이언트 메시지 전송 중 오류: {e}")
+        return False
+
 def shared_response_handler(handler_func):
     """
     핸들러 응답에 'share' 플래그가 있는지 확인하고, 있을 경우 모든 클라이언트에게 메시지를 전송하는 데코레이터입니다.
@@ -267,6 +299,135 @@ async def handle_verify_password(data: dict, client=None) -> dict:
         logger.error(f"비밀번호 검증 중 오류: {str(e)}", exc_info=True)
         return {"status": "error", "message": f"비밀번호 검증 중 오류가 발생했습니다: {str(e)}"}
 
+async def _stream_ec2_refresh(region, client):
+    """
+    EC2 인스턴스를 페이지 단위로 요청한 클라이언트에게 전송하고 완료 메시지를 반환합니다.
+    
+    Args:
+        region: AWS 리전 (None이면 모든 리전)
+        client: 요청한 클라이언트
+        
+    Returns:
+        dict: 스트리밍 완료 메시지
+    """
+    page_count = 0
+    instance_count = 0
+    regions = []
+    
+    async for page_region, instances in aws_async.stream_ec2_instances(region):
+        page_count += 1
+        instance_count += len(instances)
+        if page_region not in regions:
+            regions.append(page_region)
+        
+        await send_to_client(client, {
+            "service": "aws",
+            "type": "REFRESH_EC2_PAGE",
+            "content": {
+                "type": "ec2",
+                "instances": instances,
+                "region": page_region,
+                "page": page_count,
+            },
+            "self": True
+        })
+    
+    return {
+        "service": "aws",
+        "type": "REFRESH_EC2_DONE",
+        "content": {
+            "type": "ec2",
+            "region": region,
+            "regions": regions,
+            "pages": page_count,
+            "count": instance_count,
+        }
+    }
+
+def _version_items(service, region, items, since_version):
+    """
+    조회 결과로 인벤토리 버전을 갱신하고, 클라이언트 버전 이후의 변경분을 구합니다.
+    
+    Args:
+        service: 서비스 이름 (ec2, ecs, ecs_services, eks)
+        region: AWS 리전
+        items: 조회된 항목 목록
+        since_version: 클라이언트가 마지막으로 받은 버전 (None이면 변경분을 구하지 않음)
+        
+    Returns:
+        tuple: (현재 버전, 요청한 클라이언트에게 보낼 변경분 또는 None, 다른 클라이언트에게 보낼 변경분 또는 None)
+    """
+    delta = inventory_delta.update(service, region, items)
+    version = inventory_delta.get_version(service, region)
+    
+    reply = None
+    if since_version is not None:
+        try:
+            result = inventory_delta.since(service, region, int(since_version))
+        except (TypeError, ValueError):
+            result = {"mode": "full"}
+        
+        if result["mode"] == MODE_DELTA:
+            reply = {
+                "base_version": result["base_version"],
+                "added": result["added"],
+                "changed": result["changed"],
+                "removed": result["removed"],
+            }
+    
+    return version, reply, delta
+
+def _apply_inventory_version(response, service, region, items_key, since_version):
+    """
+    새로고침 응답에 인벤토리 버전을 기록하고, 클라이언트 버전이 있으면 변경분만 담도록 바꿉니다.
+    
+    Args:
+        response: 새로고침 응답 (content에 전체 목록 포함)
+        service: 서비스 이름
+        region: AWS 리전
+        items_key: content에서 목록이 들어 있는 키 (instances, clusters)
+        since_version: 클라이언트가 마지막으로 받은 버전 (None이면 전체 목록 유지)
+        
+    Returns:
+        dict: 다른 클라이언트에게 보낼 변경분 (변경이 없으면 None)
+    """
+    content = response["content"]
+    version, reply, delta = _version_items(service, region, content[items_key], since_version)
+    content["version"] = version
+    
+    if reply is not None:
+        content.pop(items_key, None)
+        content.update({"mode": MODE_DELTA, **reply})
+    elif since_version is not None:
+        content["mode"] = "full"
+    
+    return delta
+
+def _apply_services_version(response, region, since_version):
+    """
+    ECS 새로고침 응답의 서비스 목록(include_services)에 별도의 인벤토리 버전을 기록합니다.
+    
+    클러스터 목록과 서비스 목록은 ("ecs", 리전), ("ecs_services", 리전)으로 따로 버전을 관리하며,
+    클라이언트 버전 이후의 변경분이 있으면 services 대신 services_delta를 담습니다.
+    
+    Args:
+        response: ECS 새로고침 응답 (content에 services 포함)
+        region: AWS 리전
+        since_version: 클라이언트가 마지막으로 받은 서비스 목록 버전 (None이면 전체 목록 유지)
+        
+    Returns:
+        dict: 다른 클라이언트에게 보낼 서비스 변경분 (변경이 없으면 None)
+    """
+    content = response["content"]
+    version, reply, delta = _version_items("ecs_services", region, content["services"], since_version)
+    content["services_version"] = version
+    
+    if reply is not None:
+        content.pop("services", None)
+        content["services_delta"] = {"version": version, **reply}
+    
+    return delta
+
 @register_action_handler("refresh_service")
 @shared_response_handler
 async def handle_refresh(data: dict, client=None) -> dict:
@@ -276,18 +437,26 @@ async def handle_refresh(data: dict, client=None) -> dict:
     
     service = data.get("service")
     region = None
+    # force 플래그가 있으면 인벤토리 캐시를 무시하고 AWS에서 새로 조회
+    force = bool(data.get("force", False))
     logger.info(f"{service.upper()} 서비스 갱신 요청 - 리전: {region}")
     
     try:
         response = None
         
-        if service == "ec2":
+        if service == "ec2" and data.get("stream"):
+            # 스트리밍 모드: 페이지마다 요청한 클라이언트에게 전송 후 완료 메시지만 응답
+            return await _stream_ec2_refresh(region, client)
+        elif service == "ec2":
             response = {
                 "service": "aws",
                 "type": "REFRESH_EC2",
                 "content": {
                     "type": "ec2",
-                    "instances": aws_services.list_ec2_instances(region),
+                    "instances": await (
+                        aws_async.refresh_ec2_states(region) if data.get("tier") == "state"
+                        else aws_async.list_ec2_instances(region, force=force)
+                    ),
                     "region": region,
                 }
             }
@@ -298,10 +467,13 @@ async def handle_refresh(data: dict, client=None) -> dict:
                 "content": {
                     "activity": "REFRESH",
                     "type": "ecs",
-                    "clusters": aws_services.list_ecs_clusters(region),
+                    "clusters": await aws_async.list_ecs_clusters(region, force=force),
                     "region": region,
                 }
             }
+            # include_services 플래그가 있으면 모든 클러스터의 서비스를 함께 조회
+            if data.get("include_services"):
+                response["content"]["services"] = await aws_async.list_all_ecs_services(region, force=force)
         elif service == "eks":
             response = {
                 "service": "aws",
@@ -309,7 +481,7 @@ async def handle_refresh(data: dict, client=None) -> dict:
                 "content": {
                     "activity": "REFRESH",
                     "type": "eks",
-                    "clusters": aws_services.list_eks_clusters(region),
+                    "clusters": await aws_async.list_eks_clusters(region, force=force),
                     "region": region,
                 }
             }
@@ -317,7 +489,32 @@ async def handle_refresh(data: dict, client=None) -> dict:
             return {"status": "error", "message": f"알 수 없는 서비스: {service}"}
         
         if response:
-            await broadcast_to_clients(response, exclude_client=client)
+            items_key = "instances" if service == "ec2" else "clusters"
+            delta = _apply_inventory_version(response, service, region, items_key, data.get("since_version"))
+            services_delta = None
+            if "services" in response["content"]:
+                services_delta = _apply_services_version(response, region, data.get("services_since_version"))
+            
+            if not DELTA_BROADCAST:
+                await broadcast_to_clients(response, exclude_client=client)
+            elif delta is not None or services_delta is not None:
+                # 변경된 항목만 버전과 함께 브로드캐스트 (base_version이 다른 클라이언트는 since_version으로 재요청)
+                version = response["content"]["version"]
+                content = {
+                    "activity": "REFRESH",
+                    "type": service,
+                    "region": region,
+                    "mode": MODE_DELTA,
+                    # 서비스 목록만 바뀌었으면 클러스터 목록은 빈 변경분
+                    **(delta or {"version": version, "base_version": version, "added": [], "changed": [], "removed": []}),
+                }
+                if services_delta is not None:
+                    content["services_delta"] = services_delta
+                await broadcast_to_clients({
+                    "service": "aws",
+                    "type": response["type"],
+                    "content": content
+                }, exclude_client=client)
             return response
         
     except Exception as e:
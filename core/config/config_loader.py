@@ -4,7 +4,7 @@
 import os
 import json
 import logging
-import yaml
+from core.service_registry import ServiceRegistry, SERVICE_KEYS
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -34,7 +34,25 @@ class ConfigLoader:
                 "screen": {
                     "enabled": True,
                     "interval_seconds": 5,  # 5초마다 화면 변화 감지
-                    "diff_threshold": 0.05  # 5% 이상 변화 시 감지
+                    "diff_threshold": 0.05,  # 5% 이상 변화 시 감지
+                    "thumbnail_width": 320,  # 비교용 썸네일 가로 크기(픽셀)
+                    "grid_columns": 16,  # 타일 비교 격자 열 수
+                    "grid_rows": 9,  # 타일 비교 격자 행 수
+                    "tile_diff_threshold": 4.0,  # 타일 평균/표준편차 밝기 차이가 이 값을 넘으면 변화한 타일
+                    "changed_tile_fraction": 0.02,  # 변화한 타일 비율이 이 값 이상이면 화면 변화
+                    "adaptive": {
+                        "enabled": True,
+                        "min_interval_sec": 1,  # 입력이 멈췄을 때의 샘플링 간격(초)
+                        "max_interval_sec": 16,  # 늘어날 수 있는 최대 샘플링 간격(초)
+                        "backoff_factor": 2.0,  # 간격을 늘릴 때 곱하는 값
+                        "input_recent_sec": 5,  # 마지막 키보드/마우스 입력 후 이 시간 안이면 간격을 늘림
+                        "static_after_sec": 60  # 화면이 이 시간 동안 변하지 않으면 간격을 늘림
+                    },
+                    "hash_size": 8,  # 차이 해시 크기 (hash_size x hash_size 비트)
+                    "hash_unchanged_distance": 2,  # 해시 거리가 이 값 이하면 변화 없음
+                    "hash_changed_distance": 10,  # 해시 거리가 이 값 이상이면 변화
+                    "mean_diff_unchanged": 1.0,  # 썸네일 평균 밝기 차이가 이 값 이하(해시 조건도 충족)면 변화 없음
+                    "mean_diff_changed": 12.0  # 썸네일 평균 밝기 차이가 이 값 이상이면 변화, 그 외에는 상관계수로 판단
                 },
                 "audio": {
                     "enabled": True,
@@ -43,7 +61,12 @@ class ConfigLoader:
                 },
                 "window": {
                     "enabled": True,
-                    "interval_seconds": 2  # 2초마다 활성 창 변화 감지
+                    "interval_seconds": 2,  # 2초마다 활성 창 변화 감지
+                    "check_interval_sec": 1,  # 활성 창 추적 주기(초), 바뀐 경우에만 메시지 전송
+                    "max_tracked_windows": 500,  # 머문 시간을 기록할 최대 창 수
+                    "adaptive": {
+                        "enabled": False  # True면 screen.adaptive와 같은 방식으로 추적 주기 조정
+                    }
                 }
             },
             "aws": {
@@ -58,7 +81,46 @@ class ConfigLoader:
                 "credentials": {
                     "save": True
                 },
-                "service_state_check_interval_minutes": 5
+                "service_state_check_interval_minutes": 5,
+                "region_max_workers": 5,  # 동시에 조회할 최대 리전 수
+                "region_timeout_seconds": 10,  # 리전별 조회 제한 시간(초)
+                "client_connect_timeout_seconds": 5,  # AWS 클라이언트 연결 제한 시간(초)
+                "client_read_timeout_seconds": 10,  # AWS 클라이언트 응답 읽기 제한 시간(초)
+                "client_max_attempts": 3,  # AWS 클라이언트 최대 시도 횟수 (첫 시도 포함)
+                "async_max_workers": 8,  # 비동기 AWS 호출 전용 스레드 수
+                "ec2_page_size": 100,  # describe_instances 페이지 크기
+                "ec2_full_refresh_seconds": 300,  # 상태 전용 갱신 중 전체 조회 최대 간격(초)
+                "describe_max_workers": 8,  # 리소스 상세 조회(describe_*) 동시 실행 수
+                "delta_broadcast": False,  # 새로고침 결과를 변경분만 브로드캐스트 (변경분을 처리하는 클라이언트 전용)
+                "delta_history_size": 20,  # 변경분 계산을 위해 보관할 버전 수
+                "transition_max_workers": 8,  # 등록된 서비스 시작/중지 동시 실행 수
+                "reconcile_enabled": True,  # 상태 확인 주기마다 실제 상태가 어긋난 리소스 조정
+                "registry_flush_delay_seconds": 1.0,  # 서비스 등록 변경을 모아서 services.yaml에 저장하기까지 대기 시간(초)
+                "registry_watch_interval_seconds": 2.0,  # services.yaml 외부 수정 확인 간격(초)
+                "journal": {
+                    "enabled": True,
+                    "fsync_interval_ms": 50,  # 저널 기록을 모아서 fsync하는 간격(ms)
+                    "compact_every": 500  # 이 수만큼 기록되면 종료된 전환을 정리
+                },
+                "readiness_poll_seconds": 10,  # 의존 리소스 준비 상태 확인 간격(초)
+                "readiness_timeout_seconds": 600,  # 의존 리소스 준비 최대 대기 시간(초)
+                "predictive_warmup": {
+                    "enabled": True,
+                    "lead_time_minutes": 15,  # 예상 복귀 시각보다 먼저 서비스를 시작할 시간(분)
+                    "grace_minutes": 30,  # 예상 복귀 시각 이후 복귀를 기다릴 시간(분), 지나면 다시 중지
+                    "min_active_minutes": 10,  # 활동 시간대로 판단할 주당 평균 활동 분 수
+                    "min_history_days": 7,  # 예측을 시작하기 위한 최소 기록 기간(일)
+                    "save_interval_seconds": 300  # 활동 히스토그램 저장 간격(초)
+                },
+                "inventory_cache": {
+                    # 서비스별 TTL(초), "서비스:리전" 키로 리전별 TTL 지정 가능
+                    "ttl_seconds": {
+                        "ec2": 30,
+                        "ecs": 60,
+                        "eks": 120
+                    },
+                    "max_stale_seconds": 600  # TTL 이후 만료 데이터를 제공할 최대 시간(초)
+                }
             },
             "udp_server": {
                 "ip": "127.0.0.1",
@@ -76,7 +138,12 @@ class ConfigLoader:
         
         # 설정 로드
         self.settings = self._load_settings()
-        self.services = self._load_services()
+        # services.yaml 저장소 (ServiceManager와 공유하는 유일한 인스턴스)
+        self.service_registry = ServiceRegistry(
+            self.services_file,
+            self.settings.get("aws", {}).get("registry_flush_delay_seconds", 1.0)
+        )
+        self._load_services()
     
     def _load_settings(self):
         """settings.json 파일 로드
@@ -109,41 +176,20 @@ class ConfigLoader:
             logger.info("기본 설정을 사용합니다.")
             return self.default_settings
     
+    @property
+    def services(self):
+        """서비스 정보 (읽기 전용)"""
+        return self.service_registry.get_services()
+    
     def _load_services(self):
         """services.yaml 파일 로드
         
         Returns:
             dict: 서비스 정보
         """
-        # 서비스 파일이 없으면 기본 서비스 저장 후 반환
-        if not os.path.exists(self.services_file):
-            logger.info("서비스 파일이 없습니다. 빈 서비스 파일을 생성합니다.")
-            self._save_services(self.default_services)
-            return self.default_services
-        
-        # 서비스 파일 로드
-        try:
-            with open(self.services_file, 'r', encoding='utf-8') as f:
-                services = yaml.safe_load(f) or {}
-            
-            # YAML 파일이 예상 구조와 다른 경우를 처리
-            if not isinstance(services, dict):
-                logger.warning("서비스 파일 형식이 올바르지 않습니다. 빈 서비스 파일을 생성합니다.")
-                self._save_services(self.default_services)
-                return self.default_services
-            
-            # 기본 키가 없는 경우 추가
-            for key in self.default_services:
-                if key not in services:
-                    services[key] = []
-            
-            logger.info("서비스 파일을 로드했습니다.")
-            return services
-            
-        except Exception as e:
-            logger.error(f"서비스 파일 로드 중 오류 발생: {e}")
-            logger.info("기본 서비스 설정을 사용합니다.")
-            return self.default_services
+        services = self.service_registry.load()
+        logger.info("서비스 파일을 로드했습니다.")
+        return services
     
     def _save_settings(self, settings):
         """settings.json 파일 저장
@@ -164,23 +210,13 @@ class ConfigLoader:
             logger.error(f"설정 파일 저장 중 오류 발생: {e}")
             return False
     
-    def _save_services(self, services):
-        """services.yaml 파일 저장
+    def _save_services(self):
+        """services.yaml 파일 즉시 저장 (평소에는 변경 후 지연 저장됨)
         
-        Args:
-            services (dict): 저장할 서비스 정보
-            
         Returns:
             bool: 저장 성공 여부
         """
-        try:
-            with open(self.services_file, 'w', encoding='utf-8') as f:
-                yaml.dump(services, f, default_flow_style=False, sort_keys=False)
-            logger.info("서비스 파일을 저장했습니다.")
-            return True
-        except Exception as e:
-            logger.error(f"서비스 파일 저장 중 오류 발생: {e}")
-            return False
+        return self.service_registry.flush()
     
     def _update_dict_structure(self, source, reference):
         """딕셔너리 구조를 참조 딕셔너리에 맞게 업데이트
@@ -278,19 +314,12 @@ class ConfigLoader:
         """
         try:
             if service_type == 'ec2':
-                key = 'ec2_instances'
                 # 필수 매개변수 검증
                 if 'instance_id' not in kwargs or 'region' not in kwargs:
                     logger.error("EC2 서비스 등록 실패: 필수 매개변수 누락")
                     return False
                 
-                # 중복 서비스 검사
-                for instance in self.services.get(key, []):
-                    if instance['instance_id'] == kwargs['instance_id'] and instance['region'] == kwargs['region']:
-                        logger.info(f"이미 등록된 EC2 인스턴스입니다: {kwargs['instance_id']}")
-                        return True
-                
-                # 서비스 추가
+                resource_id = kwargs['instance_id']
                 service_info = {
                     'instance_id': kwargs['instance_id'],
                     'region': kwargs['region'],
@@ -298,21 +327,12 @@ class ConfigLoader:
                 }
                 
             elif service_type == 'ecs':
-                key = 'ecs_services'
                 # 필수 매개변수 검증
                 if 'cluster_name' not in kwargs or 'service_name' not in kwargs or 'region' not in kwargs:
                     logger.error("ECS 서비스 등록 실패: 필수 매개변수 누락")
                     return False
                 
-                # 중복 서비스 검사
-                for service in self.services.get(key, []):
-                    if (service['cluster_name'] == kwargs['cluster_name'] and
-                        service['service_name'] == kwargs['service_name'] and
-                        service['region'] == kwargs['region']):
-                        logger.info(f"이미 등록된 ECS 서비스입니다: {kwargs['cluster_name']}/{kwargs['service_name']}")
-                        return True
-                
-                # 서비스 추가
+                resource_id = f"{kwargs['cluster_name']}/{kwargs['service_name']}"
                 service_info = {
                     'cluster_name': kwargs['cluster_name'],
                     'service_name': kwargs['service_name'],
@@ -321,21 +341,12 @@ class ConfigLoader:
                 }
                 
             elif service_type == 'eks':
-                key = 'eks_nodegroups'
                 # 필수 매개변수 검증
                 if 'cluster_name' not in kwargs or 'nodegroup_name' not in kwargs or 'region' not in kwargs:
                     logger.error("EKS 노드그룹 등록 실패: 필수 매개변수 누락")
                     return False
                 
-                # 중복 서비스 검사
-                for nodegroup in self.services.get(key, []):
-                    if (nodegroup['cluster_name'] == kwargs['cluster_name'] and
-                        nodegroup['nodegroup_name'] == kwargs['nodegroup_name'] and
-                        nodegroup['region'] == kwargs['region']):
-                        logger.info(f"이미 등록된 EKS 노드그룹입니다: {kwargs['cluster_name']}/{kwargs['nodegroup_name']}")
-                        return True
-                
-                # 서비스 추가
+                resource_id = f"{kwargs['cluster_name']}/{kwargs['nodegroup_name']}"
                 service_info = {
                     'cluster_name': kwargs['cluster_name'],
                     'nodegroup_name': kwargs['nodegroup_name'],
@@ -348,14 +359,13 @@ class ConfigLoader:
                 logger.error(f"지원하지 않는 서비스 타입: {service_type}")
                 return False
             
-            # 서비스 목록에 추가
-            if key not in self.services:
-                self.services[key] = []
-            
-            self.services[key].append(service_info)
+            # 중복 서비스 검사 (색인 조회)
+            if self.service_registry.get(service_type, kwargs['region'], resource_id) is not None:
+                logger.info(f"이미 등록된 {SERVICE_KEYS[service_type]} 항목입니다: {resource_id}")
+                return True
             
-            # 서비스 파일 저장
-            if self._save_services(self.services):
+            # 서비스 추가 (파일은 지연 저장)
+            if self.service_registry.add(service_type, service_info):
                 logger.info(f"{service_type} 서비스가 등록되었습니다.")
                 return True
             
@@ -377,69 +387,40 @@ class ConfigLoader:
         """
         try:
             if service_type == 'ec2':
-                key = 'ec2_instances'
                 # 필수 매개변수 검증
                 if 'instance_id' not in kwargs or 'region' not in kwargs:
                     logger.error("EC2 서비스 등록 해제 실패: 필수 매개변수 누락")
                     return False
                 
-                # 서비스 찾기
-                for i, instance in enumerate(self.services.get(key, [])):
-                    if instance['instance_id'] == kwargs['instance_id'] and instance['region'] == kwargs['region']:
-                        self.services[key].pop(i)
-                        logger.info(f"EC2 인스턴스 등록이 해제되었습니다: {kwargs['instance_id']}")
-                        break
-                else:
-                    logger.warning(f"등록되지 않은 EC2 인스턴스입니다: {kwargs['instance_id']}")
-                    return False
+                resource_id = kwargs['instance_id']
                 
             elif service_type == 'ecs':
-                key = 'ecs_services'
                 # 필수 매개변수 검증
                 if 'cluster_name' not in kwargs or 'service_name' not in kwargs or 'region' not in kwargs:
                     logger.error("ECS 서비스 등록 해제 실패: 필수 매개변수 누락")
                     return False
                 
-                # 서비스 찾기
-                for i, service in enumerate(self.services.get(key, [])):
-                    if (service['cluster_name'] == kwargs['cluster_name'] and
-                        service['service_name'] == kwargs['service_name'] and
-                        service['region'] == kwargs['region']):
-                        self.services[key].pop(i)
-                        logger.info(f"ECS 서비스 등록이 해제되었습니다: {kwargs['cluster_name']}/{kwargs['service_name']}")
-                        break
-                else:
-                    logger.warning(f"등록되지 않은 ECS 서비스입니다: {kwargs['cluster_name']}/{kwargs['service_name']}")
-                    return False
+                resource_id = f"{kwargs['cluster_name']}/{kwargs['service_name']}"
                 
             elif service_type == 'eks':
-                key = 'eks_nodegroups'
                 # 필수 매개변수 검증
                 if 'cluster_name' not in kwargs or 'nodegroup_name' not in kwargs or 'region' not in kwargs:
                     logger.error("EKS 노드그룹 등록 해제 실패: 필수 매개변수 누락")
                     return False
                 
-                # 서비스 찾기
-                for i, nodegroup in enumerate(self.services.get(key, [])):
-                    if (nodegroup['cluster_name'] == kwargs['cluster_name'] and
-                        nodegroup['nodegroup_name'] == kwargs['nodegroup_name'] and
-                        nodegroup['region'] == kwargs['region']):
-                        self.services[key].pop(i)
-                        logger.info(f"EKS 노드그룹 등록이 해제되었습니다: {kwargs['cluster_name']}/{kwargs['nodegroup_name']}")
-                        break
-                else:
-                    logger.warning(f"등록되지 않은 EKS 노드그룹입니다: {kwargs['cluster_name']}/{kwargs['nodegroup_name']}")
-                    return False
+                resource_id = f"{kwargs['cluster_name']}/{kwargs['nodegroup_name']}"
                 
             else:
                 logger.error(f"지원하지 않는 서비스 타입: {service_type}")
                 return False
             
-            # 서비스 파일 저장
-            if self._save_services(self.services):
-                return True
+            # 서비스 삭제 (파일은 지연 저장)
+            if self.service_registry.remove(service_type, kwargs['region'], resource_id) is None:
+                logger.warning(f"등록되지 않은 {SERVICE_KEYS[service_type]} 항목입니다: {resource_id}")
+                return False
             
-            return False
+            logger.info(f"{SERVICE_KEYS[service_type]} 항목 등록이 해제되었습니다: {resource_id}")
+            return True
             
         except Exception as e:
             logger.error(f"서비스 등록 해제 중 오류 발생: {e}")
@@ -0,0 +1,343 @@
+"""
+AWS 인벤토리 캐시 모듈
+서비스/리전별 조회 결과를 TTL 동안 보관하고, 만료된 데이터는 즉시 반환한 뒤 백그라운드에서 갱신합니다.
+같은 서비스/리전에 대한 동시 조회는 하나로 합쳐 AWS 호출을 한 번만 수행합니다.
+"""
+import time
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from core.config.config_loader import config
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 캐시 항목 상태
+FRESH = "fresh"
+STALE = "stale"
+
+# 기본 TTL(초)
+DEFAULT_TTL_SECONDS = 30
+DEFAULT_MAX_STALE_SECONDS = 600
+
+class SingleFlight:
+    """키별로 동시에 하나의 호출만 실행하고, 나머지 호출자는 그 결과를 공유하는 클래스"""
+
+    def __init__(self):
+        """초기화"""
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key, func):
+        """키에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 직접 실행합니다.
+
+        Args:
+            key: 호출을 구분하는 키
+            func: 인자 없이 호출되는 함수
+
+        Returns:
+            함수의 반환값 (예외가 발생하면 모든 호출자에게 같은 예외가 전달됨)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def get_stats(self):
+        """호출 통계를 반환합니다.
+
+        Returns:
+            dict: 실제 실행 횟수, 합쳐진(절약된) 호출 수, 진행 중인 호출 수
+        """
+        with self._lock:
+            return {
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls)
+            }
+
+class InventoryCache:
+    """서비스/리전별 인벤토리 캐시 클래스"""
+
+    def __init__(self, settings=None):
+        """초기화
+
+        Args:
+            settings (dict, optional): 캐시 설정 (ttl_seconds, max_stale_seconds)
+        """
+        settings = settings or {}
+        # ttl_seconds 키는 "서비스" 또는 "서비스:리전" 형식 (리전 지정 값이 우선)
+        self._ttl_seconds = settings.get("ttl_seconds", {}) or {}
+        self._max_stale_seconds = settings.get("max_stale_seconds", DEFAULT_MAX_STALE_SECONDS)
+
+        self._lock = threading.Lock()
+        self._entries = {}
+        # 키별 무효화 세대 (무효화 전에 시작된 조회 결과가 저장되지 않도록 비교)
+        self._generations = {}
+        self._refreshing = set()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="inventory-refresh")
+        self._single_flight = SingleFlight()
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+
+    def get_ttl(self, service, region):
+        """서비스/리전에 적용되는 TTL(초)을 반환합니다."""
+        region_key = f"{service}:{region}"
+        if region_key in self._ttl_seconds:
+            return self._ttl_seconds[region_key]
+        return self._ttl_seconds.get(service, DEFAULT_TTL_SECONDS)
+
+    def peek(self, service, region):
+        """캐시된 데이터와 상태를 조회합니다.
+
+        Args:
+            service: 서비스 이름 (ec2, ecs, eks)
+            region: AWS 리전 (None이면 전체 리전)
+
+        Returns:
+            tuple: (데이터, 상태) - 상태는 FRESH, STALE 또는 None(캐시 없음/너무 오래됨)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((service, region))
+            if entry is None:
+                self._misses += 1
+                return None, None
+
+            age = now - entry["fetched_at"]
+            ttl = self.get_ttl(service, region)
+            if age < ttl:
+                self._hits += 1
+                return entry["data"], FRESH
+
+            if age < ttl + self._max_stale_seconds:
+                self._stale_hits += 1
+                return entry["data"], STALE
+
+            self._misses += 1
+            return None, None
+
+    def _generation(self, service, region):
+        """키의 현재 무효화 세대를 반환합니다."""
+        with self._lock:
+            return self._generations.setdefault((service, region), 0)
+
+    def put(self, service, region, data, generation=None):
+        """조회 결과를 캐시에 저장합니다.
+
+        Args:
+            service: 서비스 이름
+            region: AWS 리전
+            data: 조회 결과
+            generation: 조회를 시작할 때의 무효화 세대 (그 사이 무효화되었으면 저장하지 않음)
+
+        Returns:
+            bool: 저장 여부
+        """
+        with self._lock:
+            if generation is not None and self._generations.get((service, region), 0) != generation:
+                logger.debug(f"조회 중 무효화되어 결과를 캐시하지 않습니다: {service} (리전: {region})")
+                return False
+            now = time.monotonic()
+            self._entries[(service, region)] = {
+                "data": data,
+                "fetched_at": now,
+                "described_at": now
+            }
+            return True
+
+    def load(self, service, region, loader):
+        """로더를 호출하여 데이터를 새로 가져오고 캐시에 저장합니다.
+
+        같은 서비스/리전에 대한 조회가 이미 진행 중이면 새로 호출하지 않고 그 결과를 공유합니다.
+        조회 중에 무효화되면 결과를 캐시하지 않으며, 무효화 이후의 호출은 진행 중인 조회를 공유하지 않습니다.
+
+        Args:
+            service: 서비스 이름
+            region: AWS 리전
+            loader: 인자 없이 호출되어 데이터를 반환하는 함수
+
+        Returns:
+            로더가 반환한 데이터
+        """
+        generation = self._generation(service, region)
+
+        def _load():
+            data = loader()
+            self.put(service, region, data, generation)
+            return data
+
+        return self._single_flight.do((service, region, generation), _load)
+
+    def get_described_age(self, service, region):
+        """마지막 전체 조회 이후 경과 시간(초)을 반환합니다. (캐시가 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get((service, region))
+            if entry is None:
+                return None
+            return time.monotonic() - entry["described_at"]
+
+    def refresh_field(self, service, region, loader, field, id_key="id"):
+        """가벼운 조회 결과로 캐시된 항목의 특정 필드만 갱신합니다.
+
+        캐시 항목의 신선도(fetched_at)는 갱신하지만 전체 조회 시각(described_at)은 유지합니다.
+        캐시가 없거나 캐시에 없는 새 리소스가 발견되면 전체 조회가 필요하므로 None을 반환합니다.
+        응답한 리전의 리소스만 삭제 여부를 판단하고, 응답하지 않은(오류, 시간 초과) 리전의 리소스는
+        캐시된 값을 그대로 유지하며 이 경우 신선도도 갱신하지 않습니다.
+
+        Args:
+            service: 서비스 이름
+            region: AWS 리전
+            loader: 인자 없이 호출되어 ({리소스 ID: 필드 값}, 응답한 리전 목록)을 반환하는 함수
+            field: 갱신할 필드 이름 (예: 'state')
+            id_key: 리소스 ID 키
+
+        Returns:
+            list: 갱신된 데이터 (전체 조회가 필요하면 None)
+        """
+        generation = self._generation(service, region)
+
+        def _refresh():
+            values, answered = loader()
+            answered = set(answered)
+            with self._lock:
+                entry = self._entries.get((service, region))
+                if entry is None or self._generations.get((service, region), 0) != generation:
+                    # 조회 중에 무효화된 경우 전체 조회 필요
+                    return None
+
+                known_ids = {item.get(id_key) for item in entry["data"]}
+                if any(item_id not in known_ids for item_id in values):
+                    return None
+
+                data = []
+                complete = True
+                for item in entry["data"]:
+                    item_id = item.get(id_key)
+                    if item.get("region") not in answered:
+                        # 응답하지 않은 리전의 리소스는 캐시된 값 유지
+                        complete = False
+                        data.append(item)
+                        continue
+                    if item_id not in values:
+                        # 응답한 리전의 상태 조회에 나타나지 않는 리소스는 삭제된 것으로 간주
+                        continue
+                    if item.get(field) != values[item_id]:
+                        item = dict(item, **{field: values[item_id]})
+                    data.append(item)
+
+                entry["data"] = data
+                if complete:
+                    entry["fetched_at"] = time.monotonic()
+                return data
+
+        return self._single_flight.do((service, region, field, generation), _refresh)
+
+    def revalidate(self, service, region, loader):
+        """백그라운드에서 캐시를 갱신합니다. 이미 갱신 중이면 무시합니다."""
+        key = (service, region)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _refresh():
+            try:
+                self.load(service, region, loader)
+                logger.debug(f"인벤토리 캐시 백그라운드 갱신 완료: {service} (리전: {region})")
+            except Exception as e:
+                logger.error(f"인벤토리 캐시 백그라운드 갱신 중 오류 발생: {service} (리전: {region}): {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._refresh_executor.submit(_refresh)
+
+    def get(self, service, region, loader):
+        """캐시된 데이터를 반환하고, 필요하면 새로 조회합니다.
+
+        신선한 데이터는 그대로, 만료된 데이터는 즉시 반환하면서 백그라운드 갱신을 예약하며,
+        캐시가 없으면 로더를 직접 호출합니다.
+
+        Args:
+            service: 서비스 이름
+            region: AWS 리전
+            loader: 인자 없이 호출되어 데이터를 반환하는 함수
+
+        Returns:
+            인벤토리 데이터
+        """
+        data, state = self.peek(service, region)
+        if state == FRESH:
+            return data
+        if state == STALE:
+            self.revalidate(service, region, loader)
+            return data
+        return self.load(service, region, loader)
+
+    def invalidate(self, service=None, region=None):
+        """캐시를 무효화합니다.
+
+        특정 리전을 무효화하면 전체 리전(None) 조회 결과도 함께 무효화합니다.
+        무효화 세대를 올려 이미 진행 중인 조회 결과가 나중에 저장되지 않게 합니다.
+
+        Args:
+            service: 서비스 이름 (None이면 모든 서비스)
+            region: AWS 리전 (None이면 모든 리전)
+        """
+        def _matches(key):
+            key_service, key_region = key
+            if service is not None and key_service != service:
+                return False
+            return region is None or key_region in (region, None)
+
+        with self._lock:
+            for key in list(self._generations):
+                if _matches(key):
+                    self._generations[key] += 1
+            for key in list(self._entries):
+                if _matches(key):
+                    del self._entries[key]
+        logger.debug(f"인벤토리 캐시 무효화: {service or '전체'} (리전: {region or '전체'})")
+
+    def get_stats(self):
+        """캐시 사용 통계를 반환합니다.
+
+        Returns:
+            dict: 적중/만료 적중/미스 횟수 및 항목 수
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "single_flight": self._single_flight.get_stats()
+            }
+
+# 전역 인스턴스
+inventory_cache = InventoryCache(config.get("aws", "inventory_cache", {}))
@@ -0,0 +1,163 @@
+"""
+AWS 인벤토리 변경분(delta) 계산 모듈
+서비스/리전별 마지막 스냅샷을 리소스 ID 기준으로 보관하고, 추가/삭제/변경된 항목만 버전과 함께 전달합니다.
+"""
+import logging
+import threading
+from collections import deque
+from core.config.config_loader import config
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 서비스별 리소스 ID 키
+ID_KEYS = {
+    "ec2": "id",
+    "ecs": "name",
+    "ecs_services": "name",
+    "eks": "name"
+}
+
+# 전달 방식
+MODE_FULL = "full"
+MODE_DELTA = "delta"
+
+class InventoryDeltaTracker:
+    """서비스/리전별 인벤토리 스냅샷과 변경 이력을 관리하는 클래스"""
+
+    def __init__(self, max_history=20):
+        """초기화
+
+        Args:
+            max_history (int): 보관할 변경 이력 수 (이보다 오래된 버전의 클라이언트는 전체 스냅샷을 받음)
+        """
+        self._max_history = max_history
+        self._lock = threading.Lock()
+        self._snapshots = {}
+
+    @staticmethod
+    def _item_id(service, item):
+        """항목의 리소스 ID를 반환합니다."""
+        if service == "ecs_services":
+            # ECS 서비스 이름은 클러스터 안에서만 고유
+            return f"{item.get('cluster_name')}/{item.get('name')}"
+        return item.get(ID_KEYS.get(service, "id"))
+
+    def update(self, service, region, items):
+        """새 조회 결과를 반영하고 이전 스냅샷과의 변경분을 반환합니다.
+
+        Args:
+            service: 서비스 이름 (ec2, ecs, ecs_services, eks)
+            region: AWS 리전 (None이면 전체 리전)
+            items: 조회된 항목 목록
+
+        Returns:
+            dict: 변경분 (version, base_version, added, changed, removed) - 변경이 없으면 None
+        """
+        new_items = {self._item_id(service, item): item for item in items}
+
+        with self._lock:
+            snapshot = self._snapshots.get((service, region))
+            if snapshot is None:
+                snapshot = {
+                    "version": 0,
+                    "items": {},
+                    "history": deque(maxlen=self._max_history)
+                }
+                self._snapshots[(service, region)] = snapshot
+
+            old_items = snapshot["items"]
+            added = [item for item_id, item in new_items.items() if item_id not in old_items]
+            changed = [item for item_id, item in new_items.items()
+                       if item_id in old_items and old_items[item_id] != item]
+            removed = [item_id for item_id in old_items if item_id not in new_items]
+
+            if not added and not changed and not removed and snapshot["version"] > 0:
+                return None
+
+            delta = {
+                "version": snapshot["version"] + 1,
+                "base_version": snapshot["version"],
+                "added": added,
+                "changed": changed,
+                "removed": removed
+            }
+            snapshot["version"] = delta["version"]
+            snapshot["items"] = new_items
+            snapshot["history"].append(delta)
+            return delta
+
+    def get_version(self, service, region):
+        """현재 스냅샷 버전을 반환합니다. (스냅샷이 없으면 0)"""
+        with self._lock:
+            snapshot = self._snapshots.get((service, region))
+            return snapshot["version"] if snapshot else 0
+
+    def since(self, service, region, since_version):
+        """클라이언트가 가진 버전 이후의 변경분을 반환합니다.
+
+        클라이언트 버전이 보관 중인 이력보다 오래되었거나 알 수 없는 버전이면 전체 스냅샷을 반환합니다.
+
+        Args:
+            service: 서비스 이름
+            region: AWS 리전
+            since_version: 클라이언트가 마지막으로 받은 버전
+
+        Returns:
+            dict: mode가 "delta"이면 added/changed/removed, "full"이면 items를 포함
+        """
+        with self._lock:
+            snapshot = self._snapshots.get((service, region))
+            if snapshot is None:
+                return {"mode": MODE_FULL, "version": 0, "items": []}
+
+            version = snapshot["version"]
+            history = list(snapshot["history"])
+            items = list(snapshot["items"].values())
+
+        if since_version == version:
+            return {"mode": MODE_DELTA, "version": version, "base_version": since_version,
+                    "added": [], "changed": [], "removed": []}
+
+        deltas = [delta for delta in history if delta["base_version"] >= since_version]
+        if (not since_version or since_version > version
+                or not deltas or deltas[0]["base_version"] != since_version):
+            return {"mode": MODE_FULL, "version": version, "items": items}
+
+        # 여러 버전의 변경분을 하나로 합침
+        added = {}
+        changed = {}
+        removed = set()
+        for delta in deltas:
+            for item in delta["added"]:
+                item_id = self._item_id(service, item)
+                if item_id in removed:
+                    # 클라이언트가 가진 항목이 삭제 후 다시 추가된 경우
+                    removed.discard(item_id)
+                    changed[item_id] = item
+                else:
+                    added[item_id] = item
+            for item in delta["changed"]:
+                item_id = self._item_id(service, item)
+                if item_id in added:
+                    added[item_id] = item
+                else:
+                    changed[item_id] = item
+            for item_id in delta["removed"]:
+                if item_id in added:
+                    del added[item_id]
+                else:
+                    changed.pop(item_id, None)
+                    removed.add(item_id)
+
+        return {
+            "mode": MODE_DELTA,
+            "version": version,
+            "base_version": since_version,
+            "added": list(added.values()),
+            "changed": list(changed.values()),
+            "removed": sorted(removed)
+        }
+
+# 전역 인스턴스
+inventory_delta = InventoryDeltaTracker(config.get("aws", "delta_history_size", 20))
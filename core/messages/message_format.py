@@ -392,10 +392,10 @@ def send_mouse_click():
     logger.info("마우스 클릭 메시지 큐에 추가")
     return send_activity_message(MessageType.MOUSE_CLICK)
 
-def send_screen_change():
-    """화면 변화 메시지를 전송합니다."""
+def send_screen_change(regions=None):
+    """화면 변화 메시지를 전송합니다. (변화한 영역 {"x", "y", "width", "height"} 목록 포함)"""
     logger.info("화면 변화 메시지 큐에 추가")
-    return send_activity_message(MessageType.SCREEN_CHANGE)
+    return send_activity_message(MessageType.SCREEN_CHANGE, {"regions": regions} if regions else None)
 
 def send_active_window(window_name):
     """활성 창 변경 메시지를 전송합니다."""
@@ -407,5 +407,12 @@ def send_audio_playback(volume):
     logger.info(f"오디오 재생 메시지 큐에 추가 (볼륨: {volume})")
     return send_activity_message(MessageType.AUDIO_PLAYBACK, {"volume": volume})
 
+def send_service_transition_summary(summary):
+    """등록된 서비스 시작/중지 결과 요약 메시지를 전송합니다."""
+    logger.info(f"서비스 전환 요약 메시지 큐에 추가: {summary.get('action')} "
+                f"({summary.get('succeeded')}/{summary.get('total')} 성공)")
+    message = create_message(MessageType.AWS_SERVICE_STATUS, summary, source="service_manager")
+    return queue_message(message, MessageType.AWS_SERVICE_STATUS, direct_send=True)
+
 # 큐 처리 스레드 자동 시작
 start_queue_processor()
\ No newline at end of file
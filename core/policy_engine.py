@@ -0,0 +1,221 @@
+"""
+등록된 리소스의 시간대 정책 모듈
+services.yaml 항목의 policies(요일/시간대 창)로 리소스별 원하는 상태를 정하고,
+정책 경계 시각을 하나의 힙 기반 스케줄러 스레드가 순서대로 처리합니다.
+"""
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from core.service_registry import SERVICE_KEYS, registration_key
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 정책 종류
+FORCE_STOP = "force_stop"
+KEEP_RUNNING = "keep_running"
+
+# 요일 이름 (월요일 = 0)
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+# 시계 변경에 대비한 최대 대기 시간(초)
+MAX_WAIT_SECONDS = 3600
+
+def _parse_minutes(value):
+    """"HH:MM" 형식 시각을 자정 이후 분으로 변환합니다."""
+    hour, minute = str(value).split(":")
+    return int(hour) * 60 + int(minute)
+
+class PolicyWindow:
+    """요일/시간대 정책 창 클래스
+
+    종료 시각이 시작 시각보다 이르면 다음 날 종료 시각까지 이어지는 창입니다. (예: 20:00 ~ 08:00)
+    """
+
+    def __init__(self, policy):
+        """초기화
+
+        Args:
+            policy (dict): 정책 정의 (type, start, end, days)
+        """
+        self.type = policy.get("type")
+        if self.type not in (FORCE_STOP, KEEP_RUNNING):
+            raise ValueError(f"지원하지 않는 정책 종류: {self.type}")
+
+        self.start = _parse_minutes(policy.get("start", "00:00"))
+        self.end = _parse_minutes(policy.get("end", "24:00"))
+        days = policy.get("days") or WEEKDAYS
+        self.days = frozenset(WEEKDAYS.index(day.lower()[:3]) if isinstance(day, str) else int(day) for day in days)
+
+    def _occurrences(self, now):
+        """기준 시각 전후의 (시작, 종료) 시각 목록을 반환합니다."""
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        length = (self.end - self.start) % (24 * 60) or 24 * 60
+        occurrences = []
+        for offset in range(-1, 8):
+            day = midnight + timedelta(days=offset)
+            if day.weekday() in self.days:
+                start = day + timedelta(minutes=self.start)
+                occurrences.append((start, start + timedelta(minutes=length)))
+        return occurrences
+
+    def is_active(self, now):
+        """기준 시각에 창이 적용 중인지 반환합니다."""
+        return any(start <= now < end for start, end in self._occurrences(now))
+
+    def next_boundary(self, now):
+        """기준 시각 이후 창이 시작되거나 끝나는 가장 가까운 시각을 반환합니다."""
+        boundaries = [moment for occurrence in self._occurrences(now) for moment in occurrence if moment > now]
+        return min(boundaries) if boundaries else None
+
+class PolicyEngine:
+    """리소스별 시간대 정책과 경계 시각 스케줄러를 관리하는 클래스"""
+
+    def __init__(self):
+        """초기화"""
+        self._on_boundary = None
+        self._condition = threading.Condition()
+        # {(타입, 리전, ID): [PolicyWindow]}
+        self._windows = {}
+        # (시각, 순번, 세대, 키) 힙
+        self._heap = []
+        self._sequence = 0
+        self._generation = 0
+        self._thread = None
+        self._running = False
+
+    def load(self, services):
+        """등록된 서비스의 policies를 읽어 정책과 스케줄을 다시 만듭니다.
+
+        Args:
+            services (dict): 등록된 서비스 목록 (ec2_instances, ecs_services, eks_nodegroups)
+        """
+        windows = {}
+        for service_type, services_key in SERVICE_KEYS.items():
+            for registration in services.get(services_key, []):
+                policies = registration.get("policies") or []
+                key = registration_key(service_type, registration)
+                if not policies or key is None:
+                    continue
+
+                try:
+                    windows[key] = [PolicyWindow(policy) for policy in policies]
+                except (ValueError, AttributeError) as e:
+                    logger.error(f"{key[2]}의 정책 형식이 올바르지 않아 무시합니다: {e}")
+
+        now = datetime.now()
+        with self._condition:
+            self._windows = windows
+            self._generation += 1
+            self._heap = []
+            for key in windows:
+                self._schedule(key, now)
+            self._condition.notify()
+
+        if windows:
+            logger.info(f"리소스 정책을 로드했습니다: {len(windows)}개 리소스")
+
+    def _schedule(self, key, now):
+        """리소스의 다음 정책 경계를 힙에 추가합니다. (잠금 안에서 호출)"""
+        boundaries = [window.next_boundary(now) for window in self._windows.get(key, [])]
+        boundaries = [boundary for boundary in boundaries if boundary is not None]
+        if boundaries:
+            self._sequence += 1
+            heapq.heappush(self._heap, (min(boundaries), self._sequence, self._generation, key))
+
+    def get_active_policy(self, resource_type, registration, now=None):
+        """리소스에 현재 적용 중인 정책 종류를 반환합니다.
+
+        force_stop과 keep_running 창이 겹치면 force_stop이 우선합니다.
+
+        Returns:
+            str: FORCE_STOP, KEEP_RUNNING 또는 None
+        """
+        key = registration_key(resource_type, registration)
+        with self._condition:
+            windows = self._windows.get(key)
+        if not windows:
+            return None
+
+        now = now or datetime.now()
+        active = {window.type for window in windows if window.is_active(now)}
+        if FORCE_STOP in active:
+            return FORCE_STOP
+        if KEEP_RUNNING in active:
+            return KEEP_RUNNING
+        return None
+
+    def is_desired_running(self, resource_type, registration, idle_desired, now=None):
+        """정책과 사용자 부재 여부를 합쳐 리소스가 실행 중이어야 하는지 반환합니다.
+
+        Args:
+            resource_type (str): 리소스 타입
+            registration (dict): 등록 항목
+            idle_desired (bool): 사용자 활동 기준 원하는 상태 (자리에 있거나 미리 시작한 경우 True)
+            now (datetime, optional): 기준 시각
+
+        Returns:
+            bool: 실행 중이어야 하면 True
+        """
+        policy = self.get_active_policy(resource_type, registration, now)
+        if policy == FORCE_STOP:
+            return False
+        if policy == KEEP_RUNNING:
+            return True
+        return idle_desired
+
+    def start(self, on_boundary=None):
+        """스케줄러 스레드를 시작합니다.
+
+        Args:
+            on_boundary (Callable, optional): 정책 경계에 도달한 리소스 키 목록을 받는 함수 (스케줄러 스레드에서 호출)
+        """
+        with self._condition:
+            if self._running:
+                return False
+            self._on_boundary = on_boundary
+            self._running = True
+            self._thread = threading.Thread(target=self._scheduler_loop, daemon=True)
+            self._thread.start()
+        return True
+
+    def stop(self):
+        """스케줄러 스레드를 중지합니다."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+    def _scheduler_loop(self):
+        """가장 가까운 정책 경계까지 대기한 뒤 해당 리소스를 알리는 루프"""
+        while True:
+            with self._condition:
+                due = []
+                while self._running and not due:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+
+                    delay = (self._heap[0][0] - datetime.now()).total_seconds()
+                    if delay > 0:
+                        self._condition.wait(min(delay, MAX_WAIT_SECONDS))
+                        continue
+
+                    # 같은 시각에 도달한 경계를 모두 꺼내고 다음 경계를 예약
+                    now = datetime.now()
+                    while self._heap and self._heap[0][0] <= now:
+                        _, _, generation, key = heapq.heappop(self._heap)
+                        if generation != self._generation:
+                            continue
+                        due.append(key)
+                        self._schedule(key, now)
+
+                if not self._running:
+                    return
+
+            logger.info(f"정책 경계 도달: {[key[2] for key in due]}")
+            if self._on_boundary is not None:
+                try:
+                    self._on_boundary(due)
+                except Exception as e:
+                    logger.error(f"정책 경계 처리 중 오류 발생: {e}")
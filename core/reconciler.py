@@ -0,0 +1,250 @@
+"""
+등록된 서비스 상태 조정(reconcile) 모듈
+등록된 리소스의 원하는 상태와 실제 상태를 비교하고, 어긋난 리소스에 대해서만 시작/중지 호출을 수행합니다.
+실제 상태는 리전/서비스별 묶음 조회로 가져오므로 변경이 없으면 조회 몇 번으로 끝납니다.
+"""
+import time
+import logging
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from core.config.config_loader import config
+from core.transition_executor import TransitionTask
+from core.aws_services import (
+    describe_ec2_instance_states,
+    describe_ecs_services,
+    describe_eks_nodegroups,
+    start_ec2_instances,
+    stop_ec2_instances,
+    start_ecs_service,
+    stop_ecs_service,
+    scale_eks_nodegroup
+)
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+class ServiceReconciler:
+    """등록된 서비스의 원하는 상태와 실제 상태를 맞추는 클래스"""
+
+    def __init__(self, transition_executor, max_workers=None):
+        """초기화
+
+        Args:
+            transition_executor (TransitionExecutor): 조정 작업을 실행할 전환 실행기
+            max_workers (int, optional): 실제 상태 조회를 동시에 실행할 최대 수
+        """
+        self._transition_executor = transition_executor
+        max_workers = max_workers or config.get("aws", "transition_max_workers", 8)
+        self._fetch_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reconcile-fetch")
+
+        self._cycles = 0
+        self._drift_cycles = 0
+        self._fixes = 0
+        self._last_elapsed_ms = 0
+
+    @staticmethod
+    def _group(registrations, *keys):
+        """등록 정보를 지정한 키 값 기준으로 묶습니다. (키 값이 비어 있는 항목은 제외)"""
+        groups = {}
+        for registration in registrations:
+            group_key = tuple(registration.get(key) for key in keys)
+            if all(group_key):
+                groups.setdefault(group_key, []).append(registration)
+        return groups
+
+    def _fetch_actual_state(self, services):
+        """등록된 리소스의 실제 상태를 리전/서비스별 묶음 조회로 가져옵니다.
+
+        Returns:
+            tuple: (EC2 그룹별 상태, ECS 그룹별 서비스, EKS 그룹별 노드그룹) - 조회 실패한 그룹은 None
+        """
+        ec2_groups = self._group(services["ec2_instances"], "region")
+        ecs_groups = self._group(services["ecs_services"], "region", "cluster_name")
+        eks_groups = self._group(services["eks_nodegroups"], "region", "cluster_name")
+
+        ec2_futures = {
+            group_key: self._fetch_executor.submit(
+                describe_ec2_instance_states,
+                [instance["instance_id"] for instance in registrations if instance.get("instance_id")],
+                group_key[0]
+            )
+            for group_key, registrations in ec2_groups.items()
+        }
+        ecs_futures = {
+            group_key: self._fetch_executor.submit(
+                describe_ecs_services,
+                group_key[1],
+                [service["service_name"] for service in registrations if service.get("service_name")],
+                group_key[0]
+            )
+            for group_key, registrations in ecs_groups.items()
+        }
+        eks_futures = {
+            group_key: self._fetch_executor.submit(
+                describe_eks_nodegroups,
+                group_key[1],
+                [nodegroup["nodegroup_name"] for nodegroup in registrations if nodegroup.get("nodegroup_name")],
+                group_key[0]
+            )
+            for group_key, registrations in eks_groups.items()
+        }
+
+        def _results(futures):
+            results = {}
+            for group_key, future in futures.items():
+                try:
+                    results[group_key] = future.result()
+                except Exception as e:
+                    logger.error(f"실제 상태 조회 중 오류 발생 {group_key}: {e}")
+                    results[group_key] = None
+            return results
+
+        return (
+            (ec2_groups, _results(ec2_futures)),
+            (ecs_groups, _results(ecs_futures)),
+            (eks_groups, _results(eks_futures))
+        )
+
+    def plan(self, services, desired_fn):
+        """실제 상태를 조회하고 어긋난 리소스에 대한 조정 작업 목록을 만듭니다.
+
+        실제 상태를 알 수 없는 리소스(조회 실패, 존재하지 않음)나 전환 중인 리소스는 건드리지 않습니다.
+
+        Args:
+            services (dict): 등록된 서비스 목록 (ec2_instances, ecs_services, eks_nodegroups)
+            desired_fn (Callable): (리소스 타입, 등록 정보)를 받아 실행 중이어야 하면 True를 반환하는 함수
+
+        Returns:
+            list: TransitionTask 목록
+        """
+        (ec2_groups, ec2_states), (ecs_groups, ecs_states), (eks_groups, eks_states) = \
+            self._fetch_actual_state(services)
+        tasks = []
+
+        # EC2 인스턴스 (리전별로 시작/중지 대상을 모아 일괄 호출)
+        for (region,), registrations in ec2_groups.items():
+            states = ec2_states.get((region,))
+            if states is None:
+                continue
+
+            to_start = []
+            to_stop = []
+            for instance in registrations:
+                instance_id = instance.get("instance_id")
+                state = states.get(instance_id)
+                if state is None:
+                    logger.warning(f"등록된 인스턴스 {instance_id}를 찾을 수 없습니다. (리전: {region})")
+                elif desired_fn("ec2", instance):
+                    if state == "stopped":
+                        to_start.append(instance_id)
+                elif state == "running":
+                    to_stop.append(instance_id)
+
+            if to_start:
+                tasks.append(TransitionTask(
+                    "ec2", f"{region} ({len(to_start)}개)", region,
+                    partial(start_ec2_instances, to_start, region), action="start"
+                ))
+            if to_stop:
+                tasks.append(TransitionTask(
+                    "ec2", f"{region} ({len(to_stop)}개)", region,
+                    partial(stop_ec2_instances, to_stop, region), action="stop"
+                ))
+
+        # ECS 서비스 (클러스터별 describe_services 묶음 조회 결과와 비교)
+        for (region, cluster_name), registrations in ecs_groups.items():
+            described = ecs_states.get((region, cluster_name))
+            if described is None:
+                continue
+
+            actual = {service["name"]: service for service in described}
+            for service in registrations:
+                service_name = service.get("service_name")
+                current = actual.get(service_name)
+                if current is None or current.get("status") != "ACTIVE":
+                    continue
+
+                desired_count = current.get("desired_count") or 0
+                if desired_fn("ecs", service):
+                    if desired_count == 0:
+                        tasks.append(TransitionTask(
+                            "ecs", service_name, region,
+                            partial(start_ecs_service, cluster_name, service_name, region),
+                            service.get("description", ""), f"{cluster_name}/{service_name}", "start"
+                        ))
+                elif desired_count > 0:
+                    tasks.append(TransitionTask(
+                        "ecs", service_name, region,
+                        partial(stop_ecs_service, cluster_name, service_name, region),
+                        service.get("description", ""), f"{cluster_name}/{service_name}", "stop"
+                    ))
+
+        # EKS 노드그룹 (최소/최대 크기로 제한한 목표 크기와 비교)
+        for (region, cluster_name), registrations in eks_groups.items():
+            described = eks_states.get((region, cluster_name))
+            if described is None:
+                continue
+
+            actual = {nodegroup["name"]: nodegroup for nodegroup in described}
+            for nodegroup in registrations:
+                nodegroup_name = nodegroup.get("nodegroup_name")
+                current = actual.get(nodegroup_name)
+                if current is None or current.get("status") != "ACTIVE":
+                    continue
+
+                running = desired_fn("eks", nodegroup)
+                target = nodegroup.get("desired_size", 1) if running else 0
+                if current.get("min_size") is not None:
+                    target = max(target, current["min_size"])
+                if current.get("max_size") is not None:
+                    target = min(target, current["max_size"])
+
+                if current.get("desired_size") != target:
+                    logger.debug(f"EKS 노드그룹 {cluster_name}/{nodegroup_name} 크기 조정: "
+                                 f"{current.get('desired_size')} -> {target} (리전: {region})")
+                    tasks.append(TransitionTask(
+                        "eks", nodegroup_name, region,
+                        partial(scale_eks_nodegroup, cluster_name, nodegroup_name, region, target),
+                        nodegroup.get("description", ""), f"{cluster_name}/{nodegroup_name}",
+                        "start" if running else "stop"
+                    ))
+
+        return tasks
+
+    def reconcile(self, services, desired_fn):
+        """원하는 상태와 실제 상태를 맞춥니다.
+
+        Args:
+            services (dict): 등록된 서비스 목록
+            desired_fn (Callable): (리소스 타입, 등록 정보)를 받아 실행 중이어야 하면 True를 반환하는 함수
+
+        Returns:
+            dict: 조정 작업 요약 (어긋난 리소스가 없으면 None)
+        """
+        started = time.monotonic()
+        tasks = self.plan(services, desired_fn)
+
+        self._cycles += 1
+        self._last_elapsed_ms = int((time.monotonic() - started) * 1000)
+        if not tasks:
+            logger.debug(f"서비스 상태 조정: 어긋난 리소스 없음 ({self._last_elapsed_ms}ms)")
+            return None
+
+        logger.info(f"서비스 상태 조정: 어긋난 리소스 작업 {len(tasks)}개를 실행합니다.")
+        self._drift_cycles += 1
+        summary = self._transition_executor.run("reconcile", tasks)
+        self._fixes += summary["succeeded"]
+        return summary
+
+    def get_stats(self):
+        """조정 통계를 반환합니다.
+
+        Returns:
+            dict: 조정 횟수, 어긋남이 발견된 횟수, 성공한 조정 수, 마지막 조회 소요 시간
+        """
+        return {
+            "cycles": self._cycles,
+            "drift_cycles": self._drift_cycles,
+            "fixes": self._fixes,
+            "last_elapsed_ms": self._last_elapsed_ms
+        }
@@ -0,0 +1,290 @@
+"""
+화면 변화 감지 모듈
+흑백 썸네일을 격자 타일별 서명(평균/표준편차)으로 비교하여 변화한 영역을 찾고,
+전체 화면은 차이 해시(dHash)와 썸네일 픽셀(블록 평균) 차이로 비교합니다.
+이것만으로 판단하기 애매한 경우에만 썸네일끼리 상관계수(matchTemplate)를 계산합니다.
+중간 계산은 썸네일 크기가 바뀔 때만 할당하는 작업 버퍼에 출력(out/dst)합니다.
+"""
+import math
+import logging
+import numpy as np
+import cv2
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+class TiledScreenComparator:
+    """격자 타일 서명 비교로 변화한 화면 영역을 찾는 클래스
+
+    타일 행 묶음(band) 단위로 서명을 계산하고 비교하며, 변화한 타일 수가 기준에 도달하면
+    나머지 묶음은 계산하지 않습니다. 계산하지 않은 묶음은 다음 비교에서 비교 없이 서명만 다시 저장합니다.
+    """
+
+    def __init__(self, settings=None):
+        """초기화
+
+        Args:
+            settings (dict, optional): 화면 모니터링 설정 (activity_monitor.screen)
+        """
+        settings = settings or {}
+        self.columns = settings.get("grid_columns", 16)
+        self.rows = settings.get("grid_rows", 9)
+        self.tile_threshold = settings.get("tile_diff_threshold", 4.0)
+        self.changed_tile_fraction = settings.get("changed_tile_fraction", 0.02)
+        self.required_tiles = max(1, math.ceil(self.columns * self.rows * self.changed_tile_fraction))
+        # 한 번에 비교할 타일 행 수 (전체를 4개 정도의 묶음으로 나눔)
+        self.band_rows = max(1, self.rows // 4)
+
+        self._shape = None
+        # 조기 종료로 서명을 계산하지 않은 첫 타일 행 (다음 비교에서 이 행부터는 기준만 다시 저장)
+        self._stale_from = None
+        self._tile_height = 0
+        self._tile_width = 0
+        self.bytes_allocated = 0
+
+        # 통계 (비교한 타일 수 / 조기 종료 횟수)
+        self.tiles_compared = 0
+        self.early_exits = 0
+
+    def _allocate(self, shape):
+        """썸네일 크기에 맞는 작업 버퍼를 할당합니다."""
+        self._shape = shape
+        self._tile_height, self._tile_width = shape[0] // self.rows, shape[1] // self.columns
+        pixels = (self.rows * self._tile_height, self.columns * self._tile_width)
+        grid = (self.rows, self.columns)
+
+        self._pixels = np.empty(pixels, dtype=np.float32)
+        self._squares = np.empty(pixels, dtype=np.float32)
+        self._means = np.empty(grid, dtype=np.float32)
+        self._stds = np.empty(grid, dtype=np.float32)
+        self._prev_means = np.empty(grid, dtype=np.float32)
+        self._prev_stds = np.empty(grid, dtype=np.float32)
+        self._diff = np.empty(grid, dtype=np.float32)
+        self._std_diff = np.empty(grid, dtype=np.float32)
+        self._changed = np.empty(grid, dtype=bool)
+        self.bytes_allocated += sum(buffer.nbytes for buffer in (
+            self._pixels, self._squares, self._means, self._stds, self._prev_means,
+            self._prev_stds, self._diff, self._std_diff, self._changed
+        ))
+
+    def _band_signatures(self, image, row_start, row_end):
+        """타일 행 범위의 타일별 평균/표준편차를 작업 버퍼에 계산합니다."""
+        tile_height, tile_width = self._tile_height, self._tile_width
+        pixel_rows = slice(row_start * tile_height, row_end * tile_height)
+        pixels = self._pixels[pixel_rows]
+        squares = self._squares[pixel_rows]
+        np.copyto(pixels, image[pixel_rows, :self.columns * tile_width])
+        np.multiply(pixels, pixels, out=squares)
+
+        shape = (row_end - row_start, tile_height, self.columns, tile_width)
+        means = self._means[row_start:row_end]
+        stds = self._stds[row_start:row_end]
+        np.mean(pixels.reshape(shape), axis=(1, 3), out=means)
+        np.mean(squares.reshape(shape), axis=(1, 3), out=stds)
+        # 표준편차 = sqrt(E[x^2] - E[x]^2)
+        np.subtract(stds, np.square(means, out=self._diff[row_start:row_end]), out=stds)
+        np.maximum(stds, 0, out=stds)
+        np.sqrt(stds, out=stds)
+
+    def reset(self, image):
+        """기준 이미지의 서명만 저장합니다. (첫 이미지이거나 크기가 바뀐 경우)"""
+        if self._shape != image.shape:
+            self._allocate(image.shape)
+        if self._tile_height == 0 or self._tile_width == 0:
+            return
+        self._band_signatures(image, 0, self.rows)
+        np.copyto(self._prev_means, self._means)
+        np.copyto(self._prev_stds, self._stds)
+        self._stale_from = None
+
+    def compare(self, image):
+        """흑백 이미지를 이전 이미지와 타일 단위로 비교합니다.
+
+        Args:
+            image (numpy.ndarray): 흑백 이미지 (썸네일)
+
+        Returns:
+            tuple: (변화 여부, 변화한 타일 목록 [(행, 열)]) - 변화로 판단되면 조기 종료하여 일부 타일만 포함
+        """
+        if self._shape != image.shape:
+            self.reset(image)
+            return False, []
+        if self._tile_height == 0 or self._tile_width == 0:
+            return False, []
+
+        changed_tiles = []
+        stale_from, self._stale_from = self._stale_from, None
+        for row_start in range(0, self.rows, self.band_rows):
+            row_end = min(self.rows, row_start + self.band_rows)
+            band = slice(row_start, row_end)
+            self._band_signatures(image, row_start, row_end)
+
+            if stale_from is not None and row_start >= stale_from:
+                # 이전 비교에서 건너뛴 묶음은 두 프레임 이상 전 서명과 비교하지 않고 기준만 갱신
+                np.copyto(self._prev_means[band], self._means[band])
+                np.copyto(self._prev_stds[band], self._stds[band])
+                continue
+
+            # 평균/표준편차 중 큰 차이를 타일 차이로 사용하고 현재 서명을 이전 서명으로 저장
+            diff, std_diff = self._diff[band], self._std_diff[band]
+            np.abs(np.subtract(self._means[band], self._prev_means[band], out=diff), out=diff)
+            np.abs(np.subtract(self._stds[band], self._prev_stds[band], out=std_diff), out=std_diff)
+            np.maximum(diff, std_diff, out=diff)
+            np.copyto(self._prev_means[band], self._means[band])
+            np.copyto(self._prev_stds[band], self._stds[band])
+            self.tiles_compared += diff.size
+
+            changed = np.greater(diff, self.tile_threshold, out=self._changed[band])
+            if changed.any():
+                rows, columns = np.nonzero(changed)
+                changed_tiles.extend(zip((rows + row_start).tolist(), columns.tolist()))
+            if len(changed_tiles) >= self.required_tiles:
+                if row_end < self.rows:
+                    self.early_exits += 1
+                    self._stale_from = row_end
+                return True, changed_tiles
+
+        return False, changed_tiles
+
+    def to_regions(self, tiles, frame_shape):
+        """타일 목록을 원본 화면 좌표의 영역 목록으로 변환합니다.
+
+        Args:
+            tiles (list): (행, 열) 목록
+            frame_shape (tuple): 원본 화면 크기 (높이, 너비, ...)
+
+        Returns:
+            list: {"x", "y", "width", "height"} 목록
+        """
+        if not tiles or self._shape is None:
+            return []
+
+        frame_height, frame_width = frame_shape[:2]
+        tile_height = frame_height * self._tile_height / self._shape[0]
+        tile_width = frame_width * self._tile_width / self._shape[1]
+        return [
+            {
+                "x": int(column * tile_width),
+                "y": int(row * tile_height),
+                "width": int(math.ceil(tile_width)),
+                "height": int(math.ceil(tile_height))
+            }
+            for row, column in tiles
+        ]
+
+    def get_stats(self):
+        """비교 통계를 반환합니다.
+
+        Returns:
+            dict: 비교한 타일 수, 조기 종료 횟수
+        """
+        return {
+            "tiles_compared": self.tiles_compared,
+            "early_exits": self.early_exits
+        }
+
+class ScreenChangeDetector:
+    """썸네일/지각 해시 기반 화면 변화 감지 클래스"""
+
+    def __init__(self, settings=None):
+        """초기화
+
+        Args:
+            settings (dict, optional): 화면 모니터링 설정 (activity_monitor.screen)
+        """
+        settings = settings or {}
+        self.comparator = TiledScreenComparator(settings)
+        self.thumbnail_width = settings.get("thumbnail_width", 320)
+        self.hash_size = settings.get("hash_size", 8)
+        self.unchanged_distance = settings.get("hash_unchanged_distance", 2)
+        self.changed_distance = settings.get("hash_changed_distance", 10)
+        self.unchanged_mean_diff = settings.get("mean_diff_unchanged", 1.0)
+        self.changed_mean_diff = settings.get("mean_diff_changed", 12.0)
+        self.threshold = settings.get("change_threshold", 0.8)
+
+        # 해시 작업 버퍼 (이전/현재 해시는 번갈아 사용)
+        self._hash_pixels = np.empty((self.hash_size, self.hash_size + 1), dtype=np.uint8)
+        self._hashes = [np.empty((self.hash_size, self.hash_size), dtype=bool) for _ in range(2)]
+        self._hash_diff = np.empty((self.hash_size, self.hash_size), dtype=bool)
+        self._current_hash = 0
+        self._pixel_diff = None
+        self._bytes_allocated = self._hash_pixels.nbytes + self._hash_diff.nbytes + \
+            sum(buffer.nbytes for buffer in self._hashes)
+
+        # 통계 (해시/평균 차이로 결정된 횟수 / 상관계수 계산까지 간 횟수)
+        self.hash_decisions = 0
+        self.template_decisions = 0
+
+    @property
+    def bytes_allocated(self):
+        """지금까지 작업 버퍼로 할당한 배열 크기의 합(바이트)"""
+        return self._bytes_allocated + self.comparator.bytes_allocated
+
+    def dhash(self, thumbnail):
+        """썸네일의 차이 해시(가로로 이웃한 픽셀 밝기 비교 비트 배열)를 계산합니다.
+
+        Returns:
+            numpy.ndarray: 해시 버퍼 (이전/현재 버퍼를 번갈아 사용)
+        """
+        self._current_hash ^= 1
+        cv2.resize(thumbnail, (self.hash_size + 1, self.hash_size), dst=self._hash_pixels,
+                   interpolation=cv2.INTER_AREA)
+        return np.greater(self._hash_pixels[:, 1:], self._hash_pixels[:, :-1], out=self._hashes[self._current_hash])
+
+    def _similarity(self, prev, current, mean_diff):
+        """두 썸네일의 정규화 상관계수를 계산합니다. (밝기 변화가 없는 단색 화면은 평균 차이로 판단)"""
+        similarity = float(cv2.matchTemplate(prev, current, cv2.TM_CCOEFF_NORMED)[0][0])
+        if np.isnan(similarity) or np.isinf(similarity):
+            similarity = 1.0 - mean_diff / 255
+        return similarity
+
+    def update(self, current, previous, frame_shape):
+        """새 썸네일을 이전 썸네일과 비교합니다.
+
+        Args:
+            current (numpy.ndarray): 현재 흑백 썸네일
+            previous (numpy.ndarray): 이전 흑백 썸네일 (첫 화면이거나 크기가 바뀐 경우 None)
+            frame_shape (tuple): 원본 화면 크기 (변화 영역 좌표 계산용)
+
+        Returns:
+            tuple: (변화 여부, 유사도, 변화한 영역 목록) - 비교할 이전 썸네일이 없으면 (False, 1.0, [])
+        """
+        frame_hash = self.dhash(current)
+        if previous is None or previous.shape != current.shape:
+            self.comparator.reset(current)
+            return False, 1.0, []
+
+        # 일부 영역만 바뀐 경우(터미널 스크롤 등)도 놓치지 않도록 타일 비교를 먼저 수행
+        tiles_changed, tiles = self.comparator.compare(current)
+        regions = self.comparator.to_regions(tiles, frame_shape)
+
+        if self._pixel_diff is None or self._pixel_diff.shape != current.shape:
+            self._pixel_diff = np.empty_like(current)
+            self._bytes_allocated += self._pixel_diff.nbytes
+
+        prev_hash = self._hashes[self._current_hash ^ 1]
+        distance = int(np.count_nonzero(np.not_equal(frame_hash, prev_hash, out=self._hash_diff)))
+        mean_diff = cv2.mean(cv2.absdiff(previous, current, dst=self._pixel_diff))[0]
+        similarity = 1.0 - distance / frame_hash.size
+        if tiles_changed or distance >= self.changed_distance or mean_diff >= self.changed_mean_diff:
+            # 변화한 타일이 기준 이상이거나 구조(해시), 밝기(블록 평균)가 크게 달라진 경우
+            self.hash_decisions += 1
+            return True, min(similarity, 1.0 - mean_diff / 255), regions
+        if distance <= self.unchanged_distance and mean_diff <= self.unchanged_mean_diff:
+            self.hash_decisions += 1
+            return False, similarity, regions
+
+        self.template_decisions += 1
+        similarity = self._similarity(previous, current, mean_diff)
+        return similarity < self.threshold, similarity, regions
+
+    def get_stats(self):
+        """판단 통계를 반환합니다.
+
+        Returns:
+            dict: 해시/평균 차이로 판단한 횟수, 상관계수를 계산한 횟수, 타일 비교 통계
+        """
+        return dict({
+            "hash_decisions": self.hash_decisions,
+            "template_decisions": self.template_decisions
+        }, **self.comparator.get_stats())
@@ -0,0 +1,223 @@
+"""
+화면 샘플링 모듈
+화면을 미리 할당한 버퍼에 캡처하고, 썸네일 축소와 흑백 변환도 출력 버퍼(dst)에 직접 수행합니다.
+이전/현재 흑백 썸네일은 두 버퍼를 번갈아 사용하므로 화면 크기가 바뀌지 않는 한 매 주기 새 배열을 만들지 않습니다.
+"""
+import ctypes
+import logging
+import numpy as np
+import cv2
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# GDI 상수
+SRCCOPY = 0x00CC0020
+DIB_RGB_COLORS = 0
+BI_RGB = 0
+SM_CXSCREEN = 0
+SM_CYSCREEN = 1
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    """GDI 비트맵 정보 헤더"""
+    _fields_ = [
+        ("biSize", ctypes.c_uint32),
+        ("biWidth", ctypes.c_int32),
+        ("biHeight", ctypes.c_int32),
+        ("biPlanes", ctypes.c_uint16),
+        ("biBitCount", ctypes.c_uint16),
+        ("biCompression", ctypes.c_uint32),
+        ("biSizeImage", ctypes.c_uint32),
+        ("biXPelsPerMeter", ctypes.c_int32),
+        ("biYPelsPerMeter", ctypes.c_int32),
+        ("biClrUsed", ctypes.c_uint32),
+        ("biClrImportant", ctypes.c_uint32)
+    ]
+
+class GdiScreenCapture:
+    """GDI BitBlt/GetDIBits로 미리 할당한 BGRA 버퍼에 주 모니터 화면을 복사하는 캡처 클래스 (Windows 전용)"""
+
+    # 캡처 결과 색상 순서
+    color_conversion = cv2.COLOR_BGRA2GRAY
+
+    def __init__(self):
+        """초기화 (화면 크기의 BGRA 버퍼와 GDI 핸들을 한 번만 만듦)"""
+        self._user32 = ctypes.windll.user32
+        self._gdi32 = ctypes.windll.gdi32
+        for function in (self._user32.GetDC, self._gdi32.CreateCompatibleDC,
+                         self._gdi32.CreateCompatibleBitmap, self._gdi32.SelectObject):
+            function.restype = ctypes.c_void_p
+        self._user32.ReleaseDC.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        self._gdi32.CreateCompatibleDC.argtypes = [ctypes.c_void_p]
+        self._gdi32.CreateCompatibleBitmap.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+        self._gdi32.SelectObject.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        self._gdi32.BitBlt.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                       ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_uint32]
+        self._gdi32.GetDIBits.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint,
+                                          ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint]
+        self._gdi32.DeleteObject.argtypes = [ctypes.c_void_p]
+        self._gdi32.DeleteDC.argtypes = [ctypes.c_void_p]
+
+        self.width = self._user32.GetSystemMetrics(SM_CXSCREEN)
+        self.height = self._user32.GetSystemMetrics(SM_CYSCREEN)
+        self._screen_dc = self._user32.GetDC(None)
+        self._memory_dc = self._gdi32.CreateCompatibleDC(self._screen_dc)
+        self._bitmap = self._gdi32.CreateCompatibleBitmap(self._screen_dc, self.width, self.height)
+        self._gdi32.SelectObject(self._memory_dc, self._bitmap)
+
+        # 위에서 아래 순서(음수 높이)의 32비트 BGRA
+        self._info = BITMAPINFOHEADER()
+        self._info.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        self._info.biWidth = self.width
+        self._info.biHeight = -self.height
+        self._info.biPlanes = 1
+        self._info.biBitCount = 32
+        self._info.biCompression = BI_RGB
+        self._info_pointer = ctypes.addressof(self._info)
+
+        self.buffer = np.empty((self.height, self.width, 4), dtype=np.uint8)
+        self._buffer_pointer = self.buffer.ctypes.data
+        self.bytes_allocated = self.buffer.nbytes
+
+    def grab(self):
+        """화면을 버퍼에 복사합니다.
+
+        Returns:
+            numpy.ndarray: BGRA 화면 버퍼 (다음 캡처 때 덮어씀)
+        """
+        if not self._gdi32.BitBlt(self._memory_dc, 0, 0, self.width, self.height,
+                                  self._screen_dc, 0, 0, SRCCOPY):
+            raise OSError("BitBlt 화면 복사 실패")
+        if not self._gdi32.GetDIBits(self._memory_dc, self._bitmap, 0, self.height,
+                                     self._buffer_pointer, self._info_pointer, DIB_RGB_COLORS):
+            raise OSError("GetDIBits 화면 복사 실패")
+        return self.buffer
+
+    def close(self):
+        """GDI 핸들을 해제합니다."""
+        self._gdi32.DeleteObject(self._bitmap)
+        self._gdi32.DeleteDC(self._memory_dc)
+        self._user32.ReleaseDC(None, self._screen_dc)
+
+class ImageScreenCapture:
+    """이미지를 반환하는 캡처 함수(pyautogui.screenshot 등)를 감싸는 캡처 클래스
+
+    캡처 함수가 매번 새 이미지를 만들므로 할당이 없는 캡처를 사용할 수 없을 때의 대체 수단입니다.
+    """
+
+    # 캡처 결과 색상 순서
+    color_conversion = cv2.COLOR_RGB2GRAY
+
+    def __init__(self, grab_function):
+        """초기화
+
+        Args:
+            grab_function (Callable): PIL 이미지 또는 RGB 배열을 반환하는 함수
+        """
+        self._grab_function = grab_function
+        self.bytes_allocated = 0
+
+    def grab(self):
+        """화면을 캡처합니다.
+
+        Returns:
+            numpy.ndarray: RGB 화면
+        """
+        frame = np.asarray(self._grab_function())
+        self.bytes_allocated += frame.nbytes
+        return frame
+
+    def close(self):
+        """해제할 자원이 없습니다."""
+
+class ScreenSampler:
+    """미리 할당한 버퍼로 화면을 캡처하고 흑백 썸네일로 줄이는 클래스"""
+
+    def __init__(self, thumbnail_width=320, grab_function=None):
+        """초기화
+
+        Windows에서는 GDI 캡처를 사용하고, 사용할 수 없으면 grab_function으로 캡처합니다.
+
+        Args:
+            thumbnail_width (int): 흑백 썸네일 가로 크기(픽셀)
+            grab_function (Callable, optional): 대체 캡처 함수 (pyautogui.screenshot 등)
+        """
+        self.thumbnail_width = thumbnail_width
+        self._capture = None
+        if hasattr(ctypes, "windll"):
+            try:
+                self._capture = GdiScreenCapture()
+            except Exception as e:
+                logger.warning(f"GDI 화면 캡처를 사용할 수 없어 대체 캡처를 사용합니다: {e}")
+        if self._capture is None:
+            if grab_function is None:
+                raise RuntimeError("사용할 수 있는 화면 캡처 방법이 없습니다.")
+            self._capture = ImageScreenCapture(grab_function)
+
+        # 썸네일 버퍼 (화면 크기가 바뀔 때만 다시 할당)
+        self._frame_shape = None
+        self._small = None
+        self._frames = None
+        self._current = 0
+        self._has_previous = False
+
+        self.cycles = 0
+        self._buffer_bytes = 0
+
+    @property
+    def bytes_allocated(self):
+        """지금까지 샘플링 과정에서 할당한 배열 크기의 합(바이트)"""
+        return self._buffer_bytes + self._capture.bytes_allocated
+
+    def _allocate(self, frame):
+        """화면 크기에 맞는 축소/흑백 썸네일 버퍼를 할당합니다."""
+        height, width = frame.shape[:2]
+        size = (self.thumbnail_width, max(1, round(height * self.thumbnail_width / width)))
+        self._small = np.empty((size[1], size[0]) + frame.shape[2:], dtype=np.uint8)
+        self._frames = [np.empty((size[1], size[0]), dtype=np.uint8) for _ in range(2)]
+        self._frame_shape = frame.shape
+        self._has_previous = False
+        self._buffer_bytes += self._small.nbytes + sum(buffer.nbytes for buffer in self._frames)
+        logger.debug(f"화면 샘플링 버퍼 할당: 화면 {width}x{height}, 썸네일 {size[0]}x{size[1]}")
+
+    def sample(self):
+        """화면을 캡처하여 흑백 썸네일을 만듭니다.
+
+        반환한 썸네일 버퍼는 다음 다음 샘플링 때 덮어씁니다.
+
+        Returns:
+            tuple: (현재 썸네일, 이전 썸네일 또는 None, 원본 화면 크기)
+        """
+        frame = self._capture.grab()
+        if frame.shape != self._frame_shape:
+            self._allocate(frame)
+
+        # 전체 해상도에서 흑백 변환을 하지 않도록 먼저 영역 평균으로 축소
+        self._current ^= 1
+        current = self._frames[self._current]
+        cv2.resize(frame, (current.shape[1], current.shape[0]), dst=self._small, interpolation=cv2.INTER_AREA)
+        if self._small.ndim == 3:
+            cv2.cvtColor(self._small, self._capture.color_conversion, dst=current)
+        else:
+            np.copyto(current, self._small)
+
+        previous = self._frames[self._current ^ 1] if self._has_previous else None
+        self._has_previous = True
+        self.cycles += 1
+        return current, previous, self._frame_shape
+
+    def close(self):
+        """캡처 자원을 해제합니다."""
+        self._capture.close()
+
+    def get_stats(self):
+        """샘플링 통계를 반환합니다.
+
+        Returns:
+            dict: 샘플링 횟수, 할당한 배열 크기의 합(바이트), 캡처 방식
+        """
+        return {
+            "cycles": self.cycles,
+            "bytes_allocated": self.bytes_allocated,
+            "capture": type(self._capture).__name__
+        }
@@ -1,17 +1,24 @@
 """
 AWS 서비스 자동 관리 모듈
 """
-import os
 import threading
 import time
-import yaml
 import logging
-from datetime import datetime, timedelta
+from functools import partial
+from datetime import datetime
 from core.config.config_loader import config
 from core.aws_auth import aws_auth
+from core.messages import message_format
+from core.transition_executor import TransitionExecutor, TransitionTask
+from core.reconciler import ServiceReconciler
+from core.activity_predictor import ActivityPredictor
+from core.start_plan import StartPlan
+from core.action_journal import ActionJournal
+from core.policy_engine import PolicyEngine
+from core.service_registry import SERVICE_KEYS, registration_key
 from core.aws_services import (
-    start_ec2_instance, 
-    stop_ec2_instance,
+    start_ec2_instances,
+    stop_ec2_instances,
     start_ecs_service,
     stop_ecs_service,
     scale_eks_nodegroup
@@ -20,21 +27,22 @@ from core.aws_services import (
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-# 서비스 목록 파일 경로
-SERVICE_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "services.yaml")
-
 class ServiceManager:
     """AWS 서비스 자동 관리 클래스"""
     _instance = None
-    _services = {
-        "ec2_instances": [],
-        "ecs_services": [],
-        "eks_nodegroups": []
-    }
-    _last_activity_time = datetime.now()
+    # services.yaml 저장소 (ConfigLoader와 같은 인스턴스를 공유)
+    _registry = config.service_registry
+    _last_activity_time = time.monotonic()
     _user_away = False
     _thread = None
     _running = False
+    _wake_event = threading.Event()
+    _reconcile_requested = False
+    _transition_executor = TransitionExecutor()
+    _reconciler = ServiceReconciler(_transition_executor)
+    _activity_predictor = ActivityPredictor(config.get("aws", "predictive_warmup", {}))
+    _journal = ActionJournal(config.get("aws", "journal", {}))
+    _policy_engine = PolicyEngine()
     
     def __new__(cls):
         """싱글톤 패턴 구현"""
@@ -50,6 +58,12 @@ class ServiceManager:
         # 서비스 목록 로드
         self._load_services()
         
+        # 이전 실행에서 중단된 전환 복구
+        self._recover_interrupted_transitions()
+        
+        # 시간대 정책 경계 스케줄러 시작
+        self._policy_engine.start(self._on_policy_boundary)
+        
         # 서비스 관리 스레드 시작
         self._running = True
         self._thread = threading.Thread(target=self._service_check_loop, daemon=True)
@@ -58,295 +72,430 @@ class ServiceManager:
         logger.info("서비스 관리자가 시작되었습니다.")
         return True
     
+    @property
+    def _services(self):
+        """등록된 서비스 목록 (읽기 전용)"""
+        return self._registry.get_services()
+    
     def _load_services(self):
-        """서비스 목록을 YAML 파일에서 로드"""
-        try:
-            if not os.path.exists(SERVICE_FILE_PATH):
-                # 파일이 없으면 빈 서비스 목록으로 초기화
-                self._save_services()
-                return
-                
-            with open(SERVICE_FILE_PATH, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                
-            # None 타입 체크 및 기본값 설정
-            if not data:
-                data = {}
-                
-            self._services = {
-                "ec2_instances": data.get("ec2_instances", []) or [],
-                "ecs_services": data.get("ecs_services", []) or [],
-                "eks_nodegroups": data.get("eks_nodegroups", []) or []
-            }
-            
-            logger.info(f"서비스 목록을 로드했습니다: EC2 {len(self._services['ec2_instances'])}개, "
-                       f"ECS {len(self._services['ecs_services'])}개, "
-                       f"EKS {len(self._services['eks_nodegroups'])}개")
-                
-        except Exception as e:
-            logger.error(f"서비스 목록 로드 중 오류 발생: {e}")
-            self._services = {
-                "ec2_instances": [],
-                "ecs_services": [],
-                "eks_nodegroups": []
-            }
+        """공유 서비스 저장소를 구독하고 services.yaml 파일 감시를 시작"""
+        self._registry.subscribe(self._on_services_changed)
+        self._registry.start_watching(config.get("aws", "registry_watch_interval_seconds", 2.0))
+        
+        services = self._registry.get_services()
+        self._policy_engine.load(services)
+        logger.info(f"서비스 목록을 로드했습니다: EC2 {len(services['ec2_instances'])}개, "
+                   f"ECS {len(services['ecs_services'])}개, "
+                   f"EKS {len(services['eks_nodegroups'])}개")
+    
+    def _on_services_changed(self, changes):
+        """등록 항목이 변경되면 다음 루프에서 변경된 리소스 상태를 바로 조정하도록 요청"""
+        logger.info(f"등록된 서비스 변경: 추가 {len(changes['added'])}개, "
+                   f"삭제 {len(changes['removed'])}개, 변경 {len(changes['changed'])}개")
+        self._policy_engine.load(self._services)
+        if changes["added"] or changes["changed"]:
+            self._reconcile_requested = True
+            self._wake_event.set()
+    
+    def _on_policy_boundary(self, keys):
+        """시간대 정책이 시작되거나 끝난 리소스가 있으면 다음 루프에서 바로 상태를 조정하도록 요청"""
+        self._reconcile_requested = True
+        self._wake_event.set()
     
     def _save_services(self):
-        """서비스 목록을 YAML 파일로 저장"""
-        try:
-            with open(SERVICE_FILE_PATH, "w", encoding="utf-8") as f:
-                yaml.dump(self._services, f, default_flow_style=False, allow_unicode=True)
-                
-            logger.info("서비스 목록을 파일에 저장했습니다.")
-            return True
-        except Exception as e:
-            logger.error(f"서비스 목록 저장 중 오류 발생: {e}")
-            return False
+        """서비스 목록을 YAML 파일로 즉시 저장 (평소에는 변경 후 지연 저장됨)"""
+        return self._registry.flush()
     
     def _service_check_loop(self):
-        """서비스 상태 확인 및 관리 루프"""
-        inactivity_timeout = config.get("activity_monitor", "inactivity_timeout_minutes", 30)
-        check_interval = config.get("aws", "service_state_check_interval_minutes", 5)
+        """서비스 상태 확인 및 관리 루프
+        
+        주기적으로 폴링하지 않고 다음 마감 시간(부재 판단 시각, 상태 조정 시각, 미리 시작 시각)까지 대기하며,
+        부재중 상태에서 사용자 활동이 감지되면 즉시 깨어나 서비스를 시작합니다.
+        """
+        inactivity_seconds = config.get("activity_monitor", "inactivity_timeout_minutes", 30) * 60
+        reconcile_seconds = config.get("aws", "service_state_check_interval_minutes", 5) * 60
+        reconcile_enabled = config.get("aws", "reconcile_enabled", True)
+        next_reconcile = time.monotonic() + reconcile_seconds
         
         while self._running:
             try:
-                # 사용자가 자리에 없는지 확인
-                idle_time = datetime.now() - self._last_activity_time
-                idle_minutes = idle_time.total_seconds() / 60
+                # 상태를 읽기 전에 초기화해야 그 이후의 활동 이벤트를 놓치지 않음
+                self._wake_event.clear()
+                
+                now = time.monotonic()
+                idle_seconds = now - self._last_activity_time
+                
+                # 부재 중이면 복귀 예측에 따른 미리 시작/취소 시점 확인
+                warmup_action = None
+                if self._user_away and idle_seconds >= inactivity_seconds:
+                    warmup_action = self._activity_predictor.poll()
                 
                 # 상태 변경 확인
-                if idle_minutes >= inactivity_timeout and not self._user_away:
+                if idle_seconds >= inactivity_seconds and not self._user_away:
                     # 사용자가 부재중 상태로 변경
-                    logger.info(f"사용자가 {int(idle_minutes)}분 동안 활동이 없어 부재중 상태로 전환합니다.")
+                    logger.info(f"사용자가 {int(idle_seconds / 60)}분 동안 활동이 없어 부재중 상태로 전환합니다.")
                     self._user_away = True
                     self._stop_all_services()
+                    self._activity_predictor.begin_away()
+                    next_reconcile = time.monotonic() + reconcile_seconds
                     
-                elif idle_minutes < inactivity_timeout and self._user_away:
+                elif idle_seconds < inactivity_seconds and self._user_away:
                     # 사용자가 돌아옴 상태로 변경
-                    logger.info("사용자 활동이 감지되어 서비스를 시작합니다.")
                     self._user_away = False
+                    if self._activity_predictor.end_away():
+                        logger.info("사용자 활동이 감지되었습니다. 서비스는 이미 미리 시작되어 있습니다.")
+                    else:
+                        logger.info("사용자 활동이 감지되어 서비스를 시작합니다.")
+                        self._start_all_services()
+                    next_reconcile = time.monotonic() + reconcile_seconds
+                    
+                elif warmup_action == "warm_up":
+                    logger.info("예상 복귀 시각이 가까워 서비스를 미리 시작합니다.")
                     self._start_all_services()
+                    next_reconcile = time.monotonic() + reconcile_seconds
+                    
+                elif warmup_action == "cool_down":
+                    self._stop_all_services()
+                    next_reconcile = time.monotonic() + reconcile_seconds
                     
-                # 체크 간격 대기
-                time.sleep(check_interval * 60)
+                elif self._reconcile_requested or (reconcile_enabled and now >= next_reconcile):
+                    # 상태 변화가 없으면 실제 상태가 어긋난 리소스만 조정 (등록 변경, 정책 경계 시 즉시)
+                    self._reconcile_requested = False
+                    self._reconcile()
+                    next_reconcile = time.monotonic() + reconcile_seconds
+                
+                # 다음 마감 시간까지 대기 (부재중 복귀는 update_activity_time이 깨움)
+                deadlines = []
+                if not self._user_away:
+                    deadlines.append(self._last_activity_time + inactivity_seconds)
+                if reconcile_enabled:
+                    deadlines.append(next_reconcile)
+                if self._user_away:
+                    warmup_deadline = self._activity_predictor.next_deadline()
+                    if warmup_deadline is not None:
+                        deadlines.append(time.monotonic() + (warmup_deadline - datetime.now()).total_seconds())
+                
+                timeout = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+                self._wake_event.wait(timeout)
                 
             except Exception as e:
                 logger.error(f"서비스 체크 루프에서 오류 발생: {e}")
                 time.sleep(60)  # 오류 발생 시 1분 대기
     
-    def _stop_all_services(self):
-        """모든 등록된 서비스 중지"""
-        if not aws_auth.is_authenticated():
-            logger.error("AWS 인증이 되어있지 않아 서비스를 중지할 수 없습니다.")
-            return
+    @staticmethod
+    def _group_ec2_instances_by_region(services):
+        """EC2 인스턴스를 리전별로 묶습니다.
         
-        try:
-            # EC2 인스턴스 중지
-            for instance in self._services["ec2_instances"]:
-                instance_id = instance.get("instance_id")
-                region = instance.get("region")
-                description = instance.get("description", "")
-                
-                if instance_id and region:
-                    try:
-                        logger.info(f"EC2 인스턴스 중지 중: {instance_id} ({description})")
-                        stop_ec2_instance(instance_id, region)
-                    except Exception as e:
-                        logger.error(f"EC2 인스턴스 {instance_id} 중지 중 오류: {e}")
+        Args:
+            services (dict): 서비스 목록
             
-            # ECS 서비스 중지
-            for service in self._services["ecs_services"]:
-                cluster_name = service.get("cluster_name")
-                service_name = service.get("service_name")
-                region = service.get("region")
-                description = service.get("description", "")
-                
-                if cluster_name and service_name and region:
-                    try:
-                        logger.info(f"ECS 서비스 중지 중: {service_name} ({description})")
-                        stop_ecs_service(cluster_name, service_name, region)
-                    except Exception as e:
-                        logger.error(f"ECS 서비스 {service_name} 중지 중 오류: {e}")
+        Returns:
+            dict: 리전별 인스턴스 등록 정보 목록
+        """
+        groups = {}
+        for instance in services["ec2_instances"]:
+            if instance.get("instance_id") and instance.get("region"):
+                groups.setdefault(instance["region"], []).append(instance)
+        return groups
+    
+    def _build_transition_tasks(self, services, start):
+        """서비스 목록에 대한 전환 작업 목록을 만듭니다.
+        
+        Args:
+            services (dict): 전환 대상 서비스 목록
+            start (bool): True면 시작 작업, False면 중지 작업
             
-            # EKS 노드그룹 스케일 다운
-            for nodegroup in self._services["eks_nodegroups"]:
-                cluster_name = nodegroup.get("cluster_name")
-                nodegroup_name = nodegroup.get("nodegroup_name")
-                region = nodegroup.get("region")
-                description = nodegroup.get("description", "")
-                
-                if cluster_name and nodegroup_name and region:
-                    try:
-                        logger.info(f"EKS 노드그룹 중지 중: {nodegroup_name} ({description})")
-                        scale_eks_nodegroup(cluster_name, nodegroup_name, region, 0)
-                    except Exception as e:
-                        logger.error(f"EKS 노드그룹 {nodegroup_name} 중지 중 오류: {e}")
+        Returns:
+            list: TransitionTask 목록
+        """
+        tasks = []
+        action = "start" if start else "stop"
+        
+        # EC2 인스턴스 (리전별 일괄 처리)
+        ec2_func = start_ec2_instances if start else stop_ec2_instances
+        for region, instances in self._group_ec2_instances_by_region(services).items():
+            instance_ids = [instance.get("instance_id") for instance in instances]
+            tasks.append(TransitionTask(
+                "ec2", f"{region} ({len(instance_ids)}개)", region,
+                partial(ec2_func, instance_ids, region), action=action
+            ))
+        
+        # ECS 서비스
+        ecs_func = start_ecs_service if start else stop_ecs_service
+        for service in services["ecs_services"]:
+            cluster_name = service.get("cluster_name")
+            service_name = service.get("service_name")
+            region = service.get("region")
             
-            logger.info("모든 서비스 중지 작업이 완료되었습니다.")
+            if cluster_name and service_name and region:
+                tasks.append(TransitionTask(
+                    "ecs", service_name, region,
+                    partial(ecs_func, cluster_name, service_name, region),
+                    service.get("description", ""),
+                    f"{cluster_name}/{service_name}", action
+                ))
+        
+        # EKS 노드그룹 (중지 시 0으로, 시작 시 등록된 크기로 스케일링)
+        for nodegroup in services["eks_nodegroups"]:
+            cluster_name = nodegroup.get("cluster_name")
+            nodegroup_name = nodegroup.get("nodegroup_name")
+            region = nodegroup.get("region")
+            desired_size = nodegroup.get("desired_size", 1) if start else 0
             
-        except Exception as e:
-            logger.error(f"서비스 중지 중 오류 발생: {e}")
+            if cluster_name and nodegroup_name and region:
+                tasks.append(TransitionTask(
+                    "eks", nodegroup_name, region,
+                    partial(scale_eks_nodegroup, cluster_name, nodegroup_name, region, desired_size),
+                    nodegroup.get("description", ""),
+                    f"{cluster_name}/{nodegroup_name}", action
+                ))
+        
+        return tasks
     
-    def _start_all_services(self):
-        """모든 등록된 서비스 시작"""
+    def _run_transition(self, start):
+        """등록된 서비스를 동시에 시작 또는 중지하고 요약을 브로드캐스트합니다.
+        
+        시간대 정책으로 상태가 고정된 리소스(중지 시 keep_running, 시작 시 force_stop)는 제외합니다.
+        
+        Args:
+            start (bool): True면 시작, False면 중지
+            
+        Returns:
+            dict: 전환 요약 (인증 실패 시 None)
+        """
+        action = "start" if start else "stop"
+        action_name = "시작" if start else "중지"
         if not aws_auth.is_authenticated():
-            logger.error("AWS 인증이 되어있지 않아 서비스를 시작할 수 없습니다.")
-            return
+            logger.error(f"AWS 인증이 되어있지 않아 서비스를 {action_name}할 수 없습니다.")
+            return None
         
+        services = self._filter_by_policy(self._services, start)
+        txn = None
         try:
-            # EC2 인스턴스 시작
-            for instance in self._services["ec2_instances"]:
-                instance_id = instance.get("instance_id")
-                region = instance.get("region")
-                description = instance.get("description", "")
-                
-                if instance_id and region:
-                    try:
-                        logger.info(f"EC2 인스턴스 시작 중: {instance_id} ({description})")
-                        start_ec2_instance(instance_id, region)
-                    except Exception as e:
-                        logger.error(f"EC2 인스턴스 {instance_id} 시작 중 오류: {e}")
+            # 작업 전에 전환 의도를 저널에 기록하고, 리소스별 결과는 끝나는 대로 기록
+            txn = self._journal.begin(action, self._journal_resources(services))
+            on_result = partial(self._record_journal_results, txn)
             
-            # ECS 서비스 시작
-            for service in self._services["ecs_services"]:
-                cluster_name = service.get("cluster_name")
-                service_name = service.get("service_name")
-                region = service.get("region")
-                description = service.get("description", "")
-                
-                if cluster_name and service_name and region:
-                    try:
-                        logger.info(f"ECS 서비스 시작 중: {service_name} ({description})")
-                        start_ecs_service(cluster_name, service_name, region)
-                    except Exception as e:
-                        logger.error(f"ECS 서비스 {service_name} 시작 중 오류: {e}")
+            if start:
+                # 시작은 depends_on 의존성 순서를 지키며 준비된 리소스부터 진행
+                summary = StartPlan(services, self._transition_executor).run(on_result)
+            else:
+                summary = self._transition_executor.run(action, self._build_transition_tasks(services, start), on_result)
             
-            # EKS 노드그룹 스케일 업
-            for nodegroup in self._services["eks_nodegroups"]:
-                cluster_name = nodegroup.get("cluster_name")
-                nodegroup_name = nodegroup.get("nodegroup_name")
-                region = nodegroup.get("region")
-                desired_size = nodegroup.get("desired_size", 1)
-                description = nodegroup.get("description", "")
+            self._journal.commit(txn)
+            message_format.send_service_transition_summary(summary)
+            return summary
+        except Exception as e:
+            logger.error(f"서비스 {action_name} 중 오류 발생: {e}")
+            if txn is not None:
+                try:
+                    self._journal.commit(txn, "aborted")
+                except OSError as journal_error:
+                    # 종료 기록이 없으면 다음 시작 시 열린 전환으로 복구됨
+                    logger.error(f"전환 중단을 저널에 기록하지 못했습니다: {journal_error}")
+            return None
+    
+    @staticmethod
+    def _journal_resources(services):
+        """저널에 기록할 전환 대상 리소스 목록을 만듭니다."""
+        return [
+            {"type": service_type, "registration": dict(registration)}
+            for service_type, services_key in SERVICE_KEYS.items()
+            for registration in services.get(services_key, [])
+        ]
+    
+    def _record_journal_results(self, txn, task_results):
+        """작업 하나의 리소스별 결과를 저널에 기록합니다."""
+        for result in task_results:
+            self._journal.record_result(txn, result["type"], result["region"], result["id"], result["success"])
+    
+    def _recover_interrupted_transitions(self):
+        """저널을 재생하여 이전 실행에서 끝나지 않은 전환을 복구합니다.
+        
+        시작 시점에는 사용자가 자리에 있는 것으로 보므로, 중단된 시작 전환은 남은 리소스를 마저 시작하고
+        중단된 중지 전환은 이미 중지되었을 수 있는 리소스를 다시 시작하여 되돌립니다.
+        복구 후에는 저널을 압축하여 다음 복구 시간이 늘어나지 않게 합니다.
+        """
+        transactions = self._journal.replay()
+        if transactions and not aws_auth.is_authenticated():
+            logger.error("AWS 인증이 되어있지 않아 중단된 서비스 전환을 복구할 수 없습니다.")
+            return
+        
+        for transaction in transactions:
+            services = {services_key: [] for services_key in SERVICE_KEYS.values()}
+            finished = 0
+            for resource in transaction["resources"]:
+                service_type = resource.get("type")
+                registration = resource.get("registration", {})
+                if service_type not in SERVICE_KEYS:
+                    continue
                 
-                if cluster_name and nodegroup_name and region:
-                    try:
-                        logger.info(f"EKS 노드그룹 시작 중: {nodegroup_name} ({description})")
-                        scale_eks_nodegroup(cluster_name, nodegroup_name, region, desired_size)
-                    except Exception as e:
-                        logger.error(f"EKS 노드그룹 {nodegroup_name} 시작 중 오류: {e}")
+                key = registration_key(service_type, registration)
+                done = key is not None and transaction["done"].get("|".join(key))
+                if transaction["action"] == "start" and done:
+                    # 이미 시작된 리소스는 건너뜀
+                    finished += 1
+                    continue
+                services[SERVICE_KEYS[service_type]].append(registration)
             
-            logger.info("모든 서비스 시작 작업이 완료되었습니다.")
+            services = self._filter_by_policy(services, True)
+            mode = "마저 진행" if transaction["action"] == "start" else "되돌림"
+            logger.info(f"중단된 서비스 {transaction['action']} 전환을 {mode}합니다. "
+                       f"(완료 기록 {len(transaction['done'])}개, 건너뜀 {finished}개)")
+            try:
+                summary = StartPlan(services, self._transition_executor).run()
+                message_format.send_service_transition_summary(summary)
+                self._journal.commit(transaction["txn"], "recovered")
+            except Exception as e:
+                logger.error(f"중단된 서비스 전환 복구 중 오류 발생: {e}")
+        
+        self._journal.compact()
+    
+    def _filter_by_policy(self, services, start):
+        """시간대 정책상 전환하면 안 되는 리소스를 제외한 서비스 목록을 반환합니다.
+        
+        Args:
+            services (dict): 서비스 목록
+            start (bool): True면 시작 대상, False면 중지 대상을 고름
             
+        Returns:
+            dict: 정책을 반영한 서비스 목록
+        """
+        filtered = {}
+        for service_type, services_key in SERVICE_KEYS.items():
+            filtered[services_key] = [
+                registration for registration in services.get(services_key, [])
+                if self._policy_engine.is_desired_running(service_type, registration, start) == start
+            ]
+        
+        excluded = sum(len(services.get(key, [])) - len(items) for key, items in filtered.items())
+        if excluded:
+            logger.info(f"시간대 정책으로 {'시작' if start else '중지'}에서 제외한 리소스: {excluded}개")
+        return filtered
+    
+    def _is_desired_running(self, resource_type, registration):
+        """등록된 리소스가 실행 중이어야 하는지 반환합니다.
+        
+        시간대 정책(force_stop, keep_running)이 적용 중이면 정책을 따르고, 아니면 사용자가 자리에 있거나
+        부재 중이라도 미리 시작한 경우 실행 중이어야 합니다.
+        """
+        idle_desired = not self._user_away or self._activity_predictor.is_warmed()
+        return self._policy_engine.is_desired_running(resource_type, registration, idle_desired)
+    
+    def _reconcile(self):
+        """등록된 서비스의 실제 상태를 확인하고 어긋난 리소스만 조정합니다.
+        
+        Returns:
+            dict: 조정 작업 요약 (어긋난 리소스가 없거나 인증되지 않았으면 None)
+        """
+        if not aws_auth.is_authenticated():
+            return None
+        
+        try:
+            summary = self._reconciler.reconcile(self._services, self._is_desired_running)
+            if summary:
+                message_format.send_service_transition_summary(summary)
+            return summary
         except Exception as e:
-            logger.error(f"서비스 시작 중 오류 발생: {e}")
+            logger.error(f"서비스 상태 조정 중 오류 발생: {e}")
+            return None
+    
+    def _stop_all_services(self):
+        """모든 등록된 서비스 중지"""
+        return self._run_transition(start=False)
+    
+    def _start_all_services(self):
+        """모든 등록된 서비스 시작"""
+        return self._run_transition(start=True)
     
     def update_activity_time(self):
-        """사용자 활동 시간 업데이트"""
-        self._last_activity_time = datetime.now()
+        """사용자 활동 시간 업데이트
+        
+        부재중 상태일 때만 관리 루프를 깨웁니다. 자리에 있는 동안에는 루프가
+        부재 판단 시각에 깨어나 마지막 활동 시간으로 마감 시간을 다시 계산합니다.
+        """
+        self._last_activity_time = time.monotonic()
+        self._activity_predictor.record_activity()
+        if self._user_away:
+            self._wake_event.set()
     
     def register_ec2_instance(self, instance_id, region, description=""):
         """EC2 인스턴스 등록"""
-        for instance in self._services["ec2_instances"]:
-            if instance.get("instance_id") == instance_id and instance.get("region") == region:
-                logger.info(f"이미 등록된 EC2 인스턴스입니다: {instance_id}")
-                return False
-                
-        self._services["ec2_instances"].append({
+        if not self._registry.add("ec2", {
             "instance_id": instance_id,
             "region": region,
             "description": description
-        })
+        }):
+            logger.info(f"이미 등록된 EC2 인스턴스입니다: {instance_id}")
+            return False
         
-        self._save_services()
         logger.info(f"EC2 인스턴스가 등록되었습니다: {instance_id}")
         return True
     
     def unregister_ec2_instance(self, instance_id, region):
         """EC2 인스턴스 등록 해제"""
-        for i, instance in enumerate(self._services["ec2_instances"]):
-            if instance.get("instance_id") == instance_id and instance.get("region") == region:
-                self._services["ec2_instances"].pop(i)
-                self._save_services()
-                logger.info(f"EC2 인스턴스가 등록 해제되었습니다: {instance_id}")
-                return True
-                
-        logger.warning(f"등록되지 않은 EC2 인스턴스입니다: {instance_id}")
-        return False
+        if self._registry.remove("ec2", region, instance_id) is None:
+            logger.warning(f"등록되지 않은 EC2 인스턴스입니다: {instance_id}")
+            return False
+        
+        logger.info(f"EC2 인스턴스가 등록 해제되었습니다: {instance_id}")
+        return True
     
     def register_ecs_service(self, cluster_name, service_name, region, description=""):
         """ECS 서비스 등록"""
-        for service in self._services["ecs_services"]:
-            if (service.get("cluster_name") == cluster_name and 
-                service.get("service_name") == service_name and 
-                service.get("region") == region):
-                logger.info(f"이미 등록된 ECS 서비스입니다: {service_name}")
-                return False
-                
-        self._services["ecs_services"].append({
+        if not self._registry.add("ecs", {
             "cluster_name": cluster_name,
             "service_name": service_name,
             "region": region,
             "description": description
-        })
+        }):
+            logger.info(f"이미 등록된 ECS 서비스입니다: {service_name}")
+            return False
         
-        self._save_services()
         logger.info(f"ECS 서비스가 등록되었습니다: {service_name}")
         return True
     
     def unregister_ecs_service(self, cluster_name, service_name, region):
         """ECS 서비스 등록 해제"""
-        for i, service in enumerate(self._services["ecs_services"]):
-            if (service.get("cluster_name") == cluster_name and 
-                service.get("service_name") == service_name and 
-                service.get("region") == region):
-                self._services["ecs_services"].pop(i)
-                self._save_services()
-                logger.info(f"ECS 서비스가 등록 해제되었습니다: {service_name}")
-                return True
-                
-        logger.warning(f"등록되지 않은 ECS 서비스입니다: {service_name}")
-        return False
+        if self._registry.remove("ecs", region, f"{cluster_name}/{service_name}") is None:
+            logger.warning(f"등록되지 않은 ECS 서비스입니다: {service_name}")
+            return False
+        
+        logger.info(f"ECS 서비스가 등록 해제되었습니다: {service_name}")
+        return True
     
     def register_eks_nodegroup(self, cluster_name, nodegroup_name, region, desired_size=1, description=""):
         """EKS 노드그룹 등록"""
-        for nodegroup in self._services["eks_nodegroups"]:
-            if (nodegroup.get("cluster_name") == cluster_name and 
-                nodegroup.get("nodegroup_name") == nodegroup_name and 
-                nodegroup.get("region") == region):
-                logger.info(f"이미 등록된 EKS 노드그룹입니다: {nodegroup_name}")
-                return False
-                
-        self._services["eks_nodegroups"].append({
+        if not self._registry.add("eks", {
             "cluster_name": cluster_name,
             "nodegroup_name": nodegroup_name,
             "region": region,
             "desired_size": desired_size,
             "description": description
-        })
+        }):
+            logger.info(f"이미 등록된 EKS 노드그룹입니다: {nodegroup_name}")
+            return False
         
-        self._save_services()
         logger.info(f"EKS 노드그룹이 등록되었습니다: {nodegroup_name}")
         return True
     
     def unregister_eks_nodegroup(self, cluster_name, nodegroup_name, region):
         """EKS 노드그룹 등록 해제"""
-        for i, nodegroup in enumerate(self._services["eks_nodegroups"]):
-            if (nodegroup.get("cluster_name") == cluster_name and 
-                nodegroup.get("nodegroup_name") == nodegroup_name and 
-                nodegroup.get("region") == region):
-                self._services["eks_nodegroups"].pop(i)
-                self._save_services()
-                logger.info(f"EKS 노드그룹이 등록 해제되었습니다: {nodegroup_name}")
-                return True
-                
-        logger.warning(f"등록되지 않은 EKS 노드그룹입니다: {nodegroup_name}")
-        return False
+        if self._registry.remove("eks", region, f"{cluster_name}/{nodegroup_name}") is None:
+            logger.warning(f"등록되지 않은 EKS 노드그룹입니다: {nodegroup_name}")
+            return False
+        
+        logger.info(f"EKS 노드그룹이 등록 해제되었습니다: {nodegroup_name}")
+        return True
     
     def get_registered_services(self):
         """등록된 모든 서비스 조회"""
         return self._services
     
+    def get_warmup_stats(self):
+        """복귀 예측(미리 시작) 적중 통계 반환"""
+        return self._activity_predictor.get_stats()
+    
     def is_user_away(self):
         """사용자 부재 상태 확인"""
         return self._user_away
@@ -0,0 +1,395 @@
+"""
+등록된 서비스 목록(services.yaml) 저장소 모듈
+등록 항목을 (타입, 리전, ID) 기준으로 색인하여 중복 확인과 조회를 O(1)로 처리하고,
+파일 저장은 짧은 지연 후 한 번에 모아서(write-behind) 임시 파일 교체 방식으로 수행합니다.
+파일이 외부에서 수정되면 변경된 항목만 반영하고 구독자에게 변경분만 알립니다.
+"""
+import os
+import atexit
+import logging
+import threading
+import yaml
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 서비스 타입별 services.yaml 목록 키
+SERVICE_KEYS = {
+    "ec2": "ec2_instances",
+    "ecs": "ecs_services",
+    "eks": "eks_nodegroups"
+}
+
+# 서비스 타입별 ID 필드 (여러 필드는 "/"로 연결)
+ID_FIELDS = {
+    "ec2": ("instance_id",),
+    "ecs": ("cluster_name", "service_name"),
+    "eks": ("cluster_name", "nodegroup_name")
+}
+
+# 기본 저장 지연 시간(초)
+DEFAULT_FLUSH_DELAY_SECONDS = 1.0
+
+# 기본 파일 변경 확인 간격(초)
+DEFAULT_WATCH_INTERVAL_SECONDS = 2.0
+
+def registration_key(service_type, entry):
+    """등록 항목의 색인 키 (타입, 리전, ID)를 반환합니다. (필수 값이 없으면 None)"""
+    values = [entry.get(field) for field in ID_FIELDS[service_type]]
+    if not all(values) or not entry.get("region"):
+        return None
+    return service_type, entry["region"], "/".join(values)
+
+class ServiceRegistry:
+    """색인과 지연 저장을 지원하는 등록 서비스 저장소 클래스"""
+
+    def __init__(self, path, flush_delay=DEFAULT_FLUSH_DELAY_SECONDS):
+        """초기화
+
+        Args:
+            path (str): services.yaml 파일 경로
+            flush_delay (float): 변경 후 파일에 저장하기까지 기다리는 시간(초), 이 사이의 변경은 한 번에 저장
+        """
+        self.path = path
+        self.flush_delay = flush_delay
+
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        # 타입별 {(타입, 리전, ID): 등록 항목} - 삽입 순서가 파일 순서
+        self._entries = {service_type: {} for service_type in SERVICE_KEYS}
+        # 마지막으로 읽거나 쓴 파일 내용 (외부 수정 시 변경분 계산 기준)
+        self._file_entries = {service_type: {} for service_type in SERVICE_KEYS}
+        # 색인할 수 없는 항목(필수 값 없음, 중복) - 작업 대상에서는 제외하되 파일에 그대로 다시 씀
+        self._unindexed = {service_type: [] for service_type in SERVICE_KEYS}
+        self._file_signature = None
+        # 타입별 목록 캐시 (변경된 타입만 다시 만듦)
+        self._snapshots = {}
+        self._snapshot = None
+        self._dirty = False
+        self._flush_timer = None
+        self._flush_count = 0
+
+        self._subscribers = []
+        self._watch_thread = None
+        self._watch_stop = threading.Event()
+
+        # 종료 시 저장되지 않은 변경 사항 저장
+        atexit.register(self.flush)
+
+    def _get_signature(self):
+        """파일 변경 확인용 (수정 시각, 크기)를 반환합니다. (파일이 없으면 None)"""
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _read_file(self):
+        """services.yaml 파일을 읽어 타입별 색인으로 반환합니다.
+
+        Returns:
+            tuple: (타입별 {(타입, 리전, ID): 등록 항목}, 타입별 색인할 수 없는 항목 목록) (파일이 없으면 None)
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+
+        if not isinstance(data, dict):
+            logger.warning("서비스 파일 형식이 올바르지 않습니다. 빈 서비스 목록을 사용합니다.")
+            data = {}
+
+        entries = {service_type: {} for service_type in SERVICE_KEYS}
+        unindexed = {service_type: [] for service_type in SERVICE_KEYS}
+        for service_type, services_key in SERVICE_KEYS.items():
+            for entry in data.get(services_key, []) or []:
+                key = registration_key(service_type, entry) if isinstance(entry, dict) else None
+                if key is None:
+                    logger.warning(f"필수 값이 없는 등록 항목은 무시합니다: {entry}")
+                    unindexed[service_type].append(entry)
+                    continue
+                if key in entries[service_type]:
+                    logger.warning(f"중복된 등록 항목은 무시합니다: {key}")
+                    unindexed[service_type].append(entry)
+                    continue
+                entries[service_type][key] = entry
+        return entries, unindexed
+
+    def load(self):
+        """services.yaml 파일을 로드하고 색인을 다시 만듭니다.
+
+        Returns:
+            dict: 서비스 목록 (ec2_instances, ecs_services, eks_nodegroups)
+        """
+        signature = self._get_signature()
+        empty = ({service_type: {} for service_type in SERVICE_KEYS},
+                 {service_type: [] for service_type in SERVICE_KEYS})
+        try:
+            result = self._read_file()
+        except Exception as e:
+            logger.error(f"서비스 파일 로드 중 오류 발생: {e}")
+            result = empty
+
+        with self._lock:
+            if result is None:
+                logger.info("서비스 파일이 없습니다. 빈 서비스 파일을 생성합니다.")
+                result = empty
+                self._schedule_flush()
+
+            entries, self._unindexed = result
+            self._entries = {service_type: dict(items) for service_type, items in entries.items()}
+            self._file_entries = entries
+            self._file_signature = signature
+            self._snapshots = {}
+            self._snapshot = None
+
+        return self.get_services()
+
+    def reload(self):
+        """파일이 외부에서 수정되었으면 변경된 항목만 반영합니다.
+
+        마지막으로 읽거나 쓴 파일 내용과 비교한 변경분만 메모리에 적용하므로,
+        아직 저장되지 않은 메모리의 변경 사항은 유지됩니다.
+
+        Returns:
+            dict: 변경분 (added, removed, changed) - 파일이 바뀌지 않았으면 None
+        """
+        signature = self._get_signature()
+        if signature is None or signature == self._file_signature:
+            return None
+
+        try:
+            result = self._read_file()
+        except Exception as e:
+            # 편집 중인 파일일 수 있으므로 다음 확인 때 다시 시도
+            logger.warning(f"수정된 서비스 파일을 읽을 수 없습니다: {e}")
+            return None
+        if result is None:
+            return None
+        new_entries, unindexed = result
+
+        changes = {"added": [], "removed": [], "changed": []}
+        with self._lock:
+            for service_type in SERVICE_KEYS:
+                old = self._file_entries[service_type]
+                new = new_entries[service_type]
+                current = self._entries[service_type]
+                touched = False
+
+                for key, entry in new.items():
+                    if key not in old:
+                        if key not in current:
+                            changes["added"].append((service_type, entry))
+                        current[key] = entry
+                        touched = True
+                    elif old[key] != entry:
+                        changes["changed"].append((service_type, current.get(key, old[key]), entry))
+                        current[key] = entry
+                        touched = True
+
+                for key, entry in old.items():
+                    if key not in new and key in current:
+                        changes["removed"].append((service_type, current.pop(key)))
+                        touched = True
+
+                if touched:
+                    self._snapshots.pop(service_type, None)
+                    self._snapshot = None
+
+            self._file_entries = new_entries
+            self._unindexed = unindexed
+            self._file_signature = signature
+
+        if not any(changes.values()):
+            return None
+
+        logger.info(f"서비스 파일 변경 반영: 추가 {len(changes['added'])}개, "
+                    f"삭제 {len(changes['removed'])}개, 변경 {len(changes['changed'])}개")
+        self._notify(changes)
+        return changes
+
+    def subscribe(self, callback):
+        """등록 항목 변경 구독자를 추가합니다.
+
+        Args:
+            callback (Callable): 변경분 dict(added/removed/changed)를 받는 함수
+                - added, removed: (타입, 등록 항목) 목록
+                - changed: (타입, 이전 항목, 새 항목) 목록
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def _notify(self, changes):
+        """구독자에게 변경분을 전달합니다."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(changes)
+            except Exception as e:
+                logger.error(f"서비스 변경 알림 처리 중 오류 발생: {e}")
+
+    def start_watching(self, interval=DEFAULT_WATCH_INTERVAL_SECONDS):
+        """파일 수정 시각을 주기적으로 확인하는 감시 스레드를 시작합니다.
+
+        Args:
+            interval (float): 확인 간격(초)
+
+        Returns:
+            bool: 새로 시작했는지 여부
+        """
+        with self._lock:
+            if self._watch_thread is not None:
+                return False
+            self._watch_stop.clear()
+            self._watch_thread = threading.Thread(target=self._watch_loop, args=(interval,), daemon=True)
+            self._watch_thread.start()
+        logger.info(f"서비스 파일 감시를 시작합니다: {self.path}")
+        return True
+
+    def stop_watching(self):
+        """감시 스레드를 중지합니다."""
+        with self._lock:
+            thread = self._watch_thread
+            self._watch_thread = None
+        if thread is not None:
+            self._watch_stop.set()
+            thread.join(timeout=5)
+
+    def _watch_loop(self, interval):
+        """파일 감시 루프"""
+        while not self._watch_stop.wait(interval):
+            try:
+                self.reload()
+            except Exception as e:
+                logger.error(f"서비스 파일 감시 중 오류 발생: {e}")
+
+    def get_services(self):
+        """서비스 목록을 반환합니다.
+
+        변경이 없으면 이전에 만든 목록을 그대로 반환하므로, 반환된 목록은 읽기 전용으로 사용해야 합니다.
+
+        Returns:
+            dict: 서비스 목록 (ec2_instances, ecs_services, eks_nodegroups)
+        """
+        with self._lock:
+            if self._snapshot is None:
+                for service_type in SERVICE_KEYS:
+                    if service_type not in self._snapshots:
+                        self._snapshots[service_type] = list(self._entries[service_type].values())
+                self._snapshot = {
+                    services_key: self._snapshots[service_type]
+                    for service_type, services_key in SERVICE_KEYS.items()
+                }
+            return self._snapshot
+
+    def get(self, service_type, region, resource_id):
+        """등록 항목을 조회합니다.
+
+        Args:
+            service_type (str): 서비스 타입 (ec2, ecs, eks)
+            region (str): AWS 리전
+            resource_id (str): 리소스 ID (ECS/EKS는 "클러스터/이름")
+
+        Returns:
+            dict: 등록 항목 (없으면 None)
+        """
+        with self._lock:
+            return self._entries[service_type].get((service_type, region, resource_id))
+
+    def add(self, service_type, entry):
+        """등록 항목을 추가합니다.
+
+        Args:
+            service_type (str): 서비스 타입 (ec2, ecs, eks)
+            entry (dict): 등록 항목
+
+        Returns:
+            bool: 추가 여부 (필수 값이 없거나 이미 등록된 경우 False)
+        """
+        key = registration_key(service_type, entry)
+        if key is None:
+            return False
+
+        with self._lock:
+            if key in self._entries[service_type]:
+                return False
+            self._entries[service_type][key] = entry
+            self._snapshots.pop(service_type, None)
+            self._snapshot = None
+            self._schedule_flush()
+
+        self._notify({"added": [(service_type, entry)], "removed": [], "changed": []})
+        return True
+
+    def remove(self, service_type, region, resource_id):
+        """등록 항목을 삭제합니다.
+
+        Args:
+            service_type (str): 서비스 타입 (ec2, ecs, eks)
+            region (str): AWS 리전
+            resource_id (str): 리소스 ID (ECS/EKS는 "클러스터/이름")
+
+        Returns:
+            dict: 삭제된 등록 항목 (없으면 None)
+        """
+        with self._lock:
+            entry = self._entries[service_type].pop((service_type, region, resource_id), None)
+            if entry is None:
+                return None
+            self._snapshots.pop(service_type, None)
+            self._snapshot = None
+            self._schedule_flush()
+
+        self._notify({"added": [], "removed": [(service_type, entry)], "changed": []})
+        return entry
+
+    def _schedule_flush(self):
+        """지연 저장을 예약합니다. 이미 예약되어 있으면 그 저장에 합쳐집니다."""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """변경 사항을 파일에 저장합니다. (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            bool: 저장 성공 여부 (저장할 변경이 없으면 True)
+        """
+        with self._write_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return True
+                self._dirty = False
+                written = {service_type: dict(self._entries[service_type]) for service_type in SERVICE_KEYS}
+                # 색인할 수 없는 항목도 사용자가 작성한 내용이므로 삭제하지 않고 뒤에 다시 씀
+                data = {
+                    services_key: [dict(entry) for entry in written[service_type].values()]
+                    + list(self._unindexed[service_type])
+                    for service_type, services_key in SERVICE_KEYS.items()
+                }
+
+            try:
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+                os.replace(temp_path, self.path)
+                with self._lock:
+                    # 직접 쓴 내용은 외부 수정으로 감지하지 않도록 기준을 갱신
+                    self._file_entries = written
+                    self._file_signature = self._get_signature()
+                self._flush_count += 1
+                logger.info("서비스 목록을 파일에 저장했습니다.")
+                return True
+            except Exception as e:
+                logger.error(f"서비스 목록 저장 중 오류 발생: {e}")
+                with self._lock:
+                    self._dirty = True
+                return False
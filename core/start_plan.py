@@ -0,0 +1,300 @@
+"""
+등록된 서비스 시작 계획(의존성 그래프) 모듈
+services.yaml 항목의 name/depends_on으로 의존성 그래프를 만들고, 선행 리소스가 준비되는 즉시
+다음 리소스를 시작합니다. 의존성이 없는 리소스는 서로 기다리지 않고 동시에 시작합니다.
+"""
+import time
+import logging
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from core.transition_executor import TransitionTask
+from core.service_registry import registration_key
+from core.aws_services import (
+    start_ec2_instances,
+    start_ecs_service,
+    scale_eks_nodegroup,
+    wait_ec2_instances_running,
+    wait_ecs_services_stable,
+    wait_eks_nodegroup_active
+)
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 등록 목록 키별 리소스 타입
+RESOURCE_TYPES = {
+    "ec2_instances": "ec2",
+    "ecs_services": "ecs",
+    "eks_nodegroups": "eks"
+}
+
+def node_key(resource_type, registration):
+    """등록 항목의 그래프 노드 이름을 반환합니다.
+
+    name이 지정되지 않은 항목은 EC2는 인스턴스 ID, ECS/EKS는 "클러스터/이름"으로 참조합니다.
+    """
+    if registration.get("name"):
+        return registration["name"]
+    if resource_type == "ec2":
+        return registration.get("instance_id")
+    if resource_type == "ecs":
+        return f"{registration.get('cluster_name')}/{registration.get('service_name')}"
+    return f"{registration.get('cluster_name')}/{registration.get('nodegroup_name')}"
+
+class StartNode:
+    """시작 계획의 리소스 노드 클래스"""
+
+    def __init__(self, key, resource_type, registration):
+        """초기화
+
+        Args:
+            key (str): 노드 이름
+            resource_type (str): 리소스 타입 (ec2, ecs, eks)
+            registration (dict): services.yaml 등록 항목
+        """
+        self.key = key
+        self.resource_type = resource_type
+        self.region = registration.get("region")
+        self.registration = registration
+        # 등록 색인 ID (저널 기록에 사용)
+        self.resource_id = (registration_key(resource_type, registration) or (None, None, key))[2]
+        depends_on = registration.get("depends_on") or []
+        self.depends_on = [depends_on] if isinstance(depends_on, str) else list(depends_on)
+        self.dependents = []
+
+class StartPlan:
+    """의존성 순서를 지키며 리소스를 최대한 동시에 시작하는 클래스"""
+
+    def __init__(self, services, transition_executor):
+        """초기화
+
+        Args:
+            services (dict): 등록된 서비스 목록 (ec2_instances, ecs_services, eks_nodegroups)
+            transition_executor (TransitionExecutor): 작업 실행과 요약에 사용할 전환 실행기
+        """
+        self._transition_executor = transition_executor
+        self.nodes = {}
+
+        for services_key, resource_type in RESOURCE_TYPES.items():
+            for registration in services.get(services_key, []):
+                key = node_key(resource_type, registration)
+                if not key or not registration.get("region"):
+                    continue
+                if key in self.nodes:
+                    logger.warning(f"중복된 리소스 이름은 무시합니다: {key}")
+                    continue
+                self.nodes[key] = StartNode(key, resource_type, registration)
+
+        self._link()
+
+    def _link(self):
+        """의존성을 연결하고 알 수 없는 의존성과 순환 의존성을 제거합니다."""
+        for node in self.nodes.values():
+            unknown = [dependency for dependency in node.depends_on if dependency not in self.nodes]
+            for dependency in unknown:
+                logger.warning(f"{node.key}의 의존 리소스 {dependency}가 등록되어 있지 않아 무시합니다.")
+            node.depends_on = [dependency for dependency in dict.fromkeys(node.depends_on) if dependency in self.nodes]
+            for dependency in node.depends_on:
+                self.nodes[dependency].dependents.append(node.key)
+
+        # 순환 의존성은 순환에 포함된 리소스 사이의 의존성만 제거 (순환 뒤에 있는 리소스의 의존성은 유지)
+        for component in self._find_cycles():
+            logger.error(f"순환 의존성이 있어 다음 리소스 사이의 의존성을 무시합니다: {sorted(component)}")
+            for key in component:
+                node = self.nodes[key]
+                for dependency in [dependency for dependency in node.depends_on if dependency in component]:
+                    self.nodes[dependency].dependents.remove(key)
+                    node.depends_on.remove(dependency)
+
+    def _find_cycles(self):
+        """순환 의존성을 이루는 리소스 묶음을 찾습니다. (Tarjan 강한 연결 요소, 반복 구현)
+
+        Returns:
+            list: 순환을 이루는 노드 키 집합 목록 (둘 이상이 서로 의존하거나 자기 자신에 의존하는 경우)
+        """
+        index = {}
+        lowlink = {}
+        stack = []
+        on_stack = set()
+        cycles = []
+
+        for root in self.nodes:
+            if root in index:
+                continue
+            work = [(root, iter(self.nodes[root].depends_on))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                key, dependencies = work[-1]
+                for dependency in dependencies:
+                    if dependency not in index:
+                        index[dependency] = lowlink[dependency] = len(index)
+                        stack.append(dependency)
+                        on_stack.add(dependency)
+                        work.append((dependency, iter(self.nodes[dependency].depends_on)))
+                        break
+                    if dependency in on_stack:
+                        lowlink[key] = min(lowlink[key], index[dependency])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[key])
+                    if lowlink[key] == index[key]:
+                        component = set()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.add(member)
+                            if member == key:
+                                break
+                        if len(component) > 1 or key in self.nodes[key].depends_on:
+                            cycles.append(component)
+        return cycles
+
+    def _start_nodes(self, nodes):
+        """같은 타입/리전의 노드들을 시작하고, 후속 리소스가 있으면 준비될 때까지 대기합니다.
+
+        Returns:
+            dict: 노드 이름별 성공(준비) 여부
+        """
+        first = nodes[0]
+        region = first.region
+
+        if first.resource_type == "ec2":
+            instance_ids = [node.registration.get("instance_id") for node in nodes]
+            results = start_ec2_instances(instance_ids, region)
+
+            waiting = [node.registration.get("instance_id") for node in nodes
+                       if node.dependents and results.get(node.registration.get("instance_id"))]
+            if waiting:
+                results.update(wait_ec2_instances_running(waiting, region))
+            return {node.key: results.get(node.registration.get("instance_id"), False) for node in nodes}
+
+        registration = first.registration
+        cluster_name = registration.get("cluster_name")
+        if first.resource_type == "ecs":
+            service_name = registration.get("service_name")
+            success = start_ecs_service(cluster_name, service_name, region)
+            if success and first.dependents:
+                success = wait_ecs_services_stable(cluster_name, [service_name], region)
+        else:
+            nodegroup_name = registration.get("nodegroup_name")
+            success = scale_eks_nodegroup(cluster_name, nodegroup_name, region, registration.get("desired_size", 1))
+            if success and first.dependents:
+                success = wait_eks_nodegroup_active(cluster_name, nodegroup_name, region)
+
+        return {first.key: success}
+
+    def _make_tasks(self, keys):
+        """시작 가능한 노드들을 작업으로 묶습니다. (EC2는 리전별 한 번의 호출)"""
+        ec2_groups = {}
+        tasks = []
+        for key in keys:
+            node = self.nodes[key]
+            if node.resource_type == "ec2":
+                ec2_groups.setdefault(node.region, []).append(node)
+            else:
+                tasks.append(TransitionTask(
+                    node.resource_type, key, node.region,
+                    partial(self._start_nodes, [node]),
+                    node.registration.get("description", ""), action="start"
+                ))
+
+        for region, nodes in ec2_groups.items():
+            tasks.append(TransitionTask(
+                "ec2", f"{region} ({len(nodes)}개)", region,
+                partial(self._start_nodes, nodes), action="start"
+            ))
+        return tasks
+
+    def _expand_results(self, task, task_results):
+        """작업 자체가 실패하여 묶음 이름으로 기록된 결과를 노드별 결과로 펼칩니다."""
+        expanded = []
+        for result in task_results:
+            if result["name"] in self.nodes:
+                expanded.append(result)
+                continue
+            for node in task.func.args[0]:
+                expanded.append(dict(result, name=node.key))
+        return expanded
+
+    def run(self, on_result=None):
+        """시작 계획을 실행합니다.
+
+        선행 리소스가 모두 준비된 리소스부터 바로 시작하며, 선행 리소스가 실패하면
+        그 리소스에 의존하는 리소스는 시작하지 않고 실패로 기록합니다.
+
+        Args:
+            on_result (Callable, optional): 작업이 끝날 때마다 리소스별 결과 목록을 받는 함수
+
+        Returns:
+            dict: 전환 요약 (TransitionExecutor.summarize 형식)
+        """
+        started = time.monotonic()
+        results = []
+        finished = set()
+        waiting_on = {key: set(node.depends_on) for key, node in self.nodes.items()}
+
+        def _skip(key, reason):
+            # 실패한 리소스에 의존하는 리소스를 연쇄적으로 실패 처리
+            for dependent in self.nodes[key].dependents:
+                if dependent in finished:
+                    continue
+                finished.add(dependent)
+                node = self.nodes[dependent]
+                results.append({
+                    "type": node.resource_type,
+                    "name": dependent,
+                    "id": node.resource_id,
+                    "region": node.region,
+                    "description": node.registration.get("description", ""),
+                    "action": "start",
+                    "success": False,
+                    "elapsed_ms": 0,
+                    "error": reason
+                })
+                _skip(dependent, reason)
+
+        ready = [key for key, dependencies in waiting_on.items() if not dependencies]
+        workers = max(1, min(self._transition_executor.max_workers, len(self.nodes) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="start-plan") as executor:
+            futures = {executor.submit(self._transition_executor.run_task, task): task
+                       for task in self._make_tasks(ready)}
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                ready = []
+                for future in done:
+                    task = futures.pop(future)
+                    task_results = self._expand_results(task, future.result())
+                    for result in task_results:
+                        node = self.nodes[result["name"]]
+                        result["id"] = node.resource_id
+                        result["description"] = node.registration.get("description", "")
+                    if on_result is not None:
+                        try:
+                            on_result(task_results)
+                        except Exception as e:
+                            logger.error(f"시작 결과 처리 중 오류: {e}")
+
+                    for result in task_results:
+                        key = result["name"]
+                        node = self.nodes[key]
+                        results.append(result)
+                        finished.add(key)
+
+                        if not result["success"]:
+                            _skip(key, f"선행 리소스 {key} 시작 실패")
+                            continue
+
+                        for dependent in node.dependents:
+                            waiting_on[dependent].discard(key)
+                            if not waiting_on[dependent] and dependent not in finished:
+                                ready.append(dependent)
+
+                for task in self._make_tasks(ready):
+                    futures[executor.submit(self._transition_executor.run_task, task)] = task
+
+        return self._transition_executor.summarize("start", results, started)
@@ -0,0 +1,134 @@
+"""
+등록된 서비스 상태 전환(시작/중지) 실행 모듈
+여러 서비스/리전의 전환 작업을 동시에 실행하고 리소스별 결과와 소요 시간을 모읍니다.
+"""
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from core.config.config_loader import config
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+class TransitionTask:
+    """하나의 전환 작업 정보 클래스"""
+
+    def __init__(self, resource_type, name, region, func, description="", resource_id=None, action=None):
+        """초기화
+
+        Args:
+            resource_type (str): 리소스 타입 (ec2, ecs, eks)
+            name (str): 리소스 이름 (EC2 일괄 작업은 리전 단위 이름)
+            region (str): AWS 리전
+            func (Callable): 인자 없이 호출되는 작업 함수 - bool 또는 {리소스 ID: bool}을 반환
+            description (str): 리소스 설명
+            resource_id (str, optional): 등록 색인 ID (ECS/EKS는 "클러스터/이름", 없으면 name 사용)
+            action (str, optional): 리소스에 수행하는 전환 ('start' 또는 'stop', 조정처럼 작업마다 다를 때 구분용)
+        """
+        self.resource_type = resource_type
+        self.name = name
+        self.region = region
+        self.func = func
+        self.description = description
+        self.resource_id = resource_id or name
+        self.action = action
+
+class TransitionExecutor:
+    """서비스 전환 작업을 제한된 동시성으로 실행하는 클래스"""
+
+    def __init__(self, max_workers=None):
+        """초기화
+
+        Args:
+            max_workers (int, optional): 동시에 실행할 최대 작업 수
+        """
+        self.max_workers = max_workers or config.get("aws", "transition_max_workers", 8)
+
+    def run_task(self, task):
+        """작업 하나를 실행하고 리소스별 결과 목록을 반환합니다."""
+        started = time.monotonic()
+        error = None
+        try:
+            result = task.func()
+        except Exception as e:
+            logger.error(f"{task.resource_type.upper()} {task.name} 전환 작업 중 오류: {e}")
+            result = False
+            error = str(e)
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+
+        # EC2 일괄 작업은 인스턴스별 결과로 펼침
+        if isinstance(result, dict):
+            outcomes = [(resource_id, resource_id, bool(success)) for resource_id, success in result.items()]
+        else:
+            outcomes = [(task.name, task.resource_id, bool(result))]
+
+        return [{
+            "type": task.resource_type,
+            "name": name,
+            "id": resource_id,
+            "region": task.region,
+            "description": task.description,
+            "action": task.action,
+            "success": success,
+            "elapsed_ms": elapsed_ms,
+            "error": error
+        } for name, resource_id, success in outcomes]
+
+    def run(self, action, tasks, on_result=None):
+        """전환 작업을 동시에 실행하고 요약을 반환합니다.
+
+        Args:
+            action (str): 전환 종류 ('start' 또는 'stop')
+            tasks (list): TransitionTask 목록
+            on_result (Callable, optional): 작업이 끝날 때마다 리소스별 결과 목록을 받는 함수 (작업 스레드에서 호출)
+
+        Returns:
+            dict: 전환 요약 (전체/성공/실패 수, 전체 소요 시간, 리소스별 결과)
+        """
+        started = time.monotonic()
+        results = []
+
+        def _run(task):
+            task_results = self.run_task(task)
+            if on_result is not None:
+                try:
+                    on_result(task_results)
+                except Exception as e:
+                    logger.error(f"전환 결과 처리 중 오류: {e}")
+            return task_results
+
+        if tasks:
+            workers = max(1, min(self.max_workers, len(tasks)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"transition-{action}") as executor:
+                for task_results in executor.map(_run, tasks):
+                    results.extend(task_results)
+
+        return self.summarize(action, results, started)
+
+    def summarize(self, action, results, started):
+        """리소스별 결과를 전환 요약으로 만들고 로그를 남깁니다.
+
+        Args:
+            action (str): 전환 종류
+            results (list): 리소스별 결과 목록
+            started (float): 전환 시작 시각 (time.monotonic)
+
+        Returns:
+            dict: 전환 요약
+        """
+        succeeded = sum(1 for result in results if result["success"])
+        summary = {
+            "action": action,
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "elapsed_ms": int((time.monotonic() - started) * 1000),
+            "results": results
+        }
+
+        for result in results:
+            status = "완료" if result["success"] else "실패"
+            logger.info(f"{result['type'].upper()} {result['name']} {action} {status} "
+                        f"(리전: {result['region']}, {result['elapsed_ms']}ms)")
+        logger.info(f"서비스 {action} 전환 완료: {succeeded}/{len(results)} 성공, 소요 시간 {summary['elapsed_ms']}ms")
+        return summary
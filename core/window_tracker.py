@@ -0,0 +1,129 @@
+"""
+활성 창 추적 모듈
+화면 모니터링과 별도의 주기로 활성 창 제목을 확인하여 실제로 바뀐 경우에만 알리고,
+창별 머문 시간을 메모리에 기록합니다.
+"""
+import sys
+import time
+import logging
+import threading
+from core.adaptive_interval import AdaptiveInterval
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 시스템 창 목록 - 이러한 창은 활성 창 메시지와 머문 시간 기록에서 무시됨
+SYSTEM_WINDOWS = frozenset(sys.intern(title) for title in (
+    "Program Manager", "Windows Shell Experience Host", "Windows Explorer",
+    "Microsoft Text Input Application", "설정", "Settings", "Task Manager",
+    "작업 관리자", "시작", "Start", ""
+))
+
+class WindowTracker:
+    """활성 창 변경만 알리고 창별 머문 시간을 기록하는 클래스"""
+
+    def __init__(self, get_title, on_change, settings=None, input_age=None):
+        """초기화
+
+        Args:
+            get_title (Callable): 현재 활성 창 제목을 반환하는 함수
+            on_change (Callable): 시스템 창이 아닌 창으로 바뀌었을 때 제목을 받는 함수
+            settings (dict, optional): 활성 창 모니터링 설정 (activity_monitor.window)
+            input_age (Callable, optional): 마지막 키보드/마우스 입력 이후 경과 시간(초)을 반환하는 함수
+        """
+        settings = settings or {}
+        self._get_title = get_title
+        self._on_change = on_change
+        self._input_age = input_age or (lambda: float("inf"))
+        self.check_interval = settings.get("check_interval_sec", 1)
+        self.max_tracked = settings.get("max_tracked_windows", 500)
+        self._cadence = AdaptiveInterval(self.check_interval, settings.get("adaptive", {"enabled": False}))
+
+        self._lock = threading.Lock()
+        self._current = None
+        self._since = time.monotonic()
+        # {창 제목: 머문 시간(초)}
+        self._dwell = {}
+        self._running = False
+
+        self.polls = 0
+        self.changes = 0
+
+    def _record_dwell(self, title, seconds):
+        """창의 머문 시간을 누적합니다. (잠금 안에서 호출)"""
+        if title is None or title in SYSTEM_WINDOWS:
+            return
+        if title not in self._dwell and len(self._dwell) >= self.max_tracked:
+            # 기록할 창이 너무 많으면 머문 시간이 가장 짧은 창을 제외
+            del self._dwell[min(self._dwell, key=self._dwell.get)]
+        self._dwell[title] = self._dwell.get(title, 0.0) + seconds
+
+    def poll(self):
+        """활성 창을 한 번 확인합니다.
+
+        Returns:
+            str: 시스템 창이 아닌 창으로 바뀌었으면 새 창 제목, 아니면 None
+        """
+        title = sys.intern(self._get_title() or "")
+        self.polls += 1
+        if title is self._current:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            self._record_dwell(self._current, now - self._since)
+            self._current = title
+            self._since = now
+
+        if title in SYSTEM_WINDOWS:
+            logger.debug(f"시스템 창 무시됨: {title}")
+            return None
+
+        self.changes += 1
+        try:
+            self._on_change(title)
+        except Exception as e:
+            logger.error(f"활성 창 변경 처리 중 오류 발생: {e}")
+        return title
+
+    def run(self):
+        """중지될 때까지 활성 창을 주기적으로 확인합니다."""
+        self._running = True
+        logger.info(f"활성 창 추적 시작됨 (간격: {self.check_interval}초)")
+        while self._running:
+            changed = False
+            try:
+                changed = self.poll() is not None
+            except Exception as e:
+                logger.error(f"활성 창 확인 중 오류 발생: {e}")
+            time.sleep(self._cadence.next_interval(self._input_age(), changed))
+
+    def stop(self):
+        """추적 루프를 중지합니다."""
+        self._running = False
+
+    def get_dwell_times(self):
+        """창별 머문 시간을 반환합니다. (현재 창의 진행 중인 시간 포함)
+
+        Returns:
+            dict: {창 제목: 머문 시간(초)} - 머문 시간이 긴 순서
+        """
+        with self._lock:
+            dwell = dict(self._dwell)
+            current, since = self._current, self._since
+        if current is not None and current not in SYSTEM_WINDOWS:
+            dwell[current] = dwell.get(current, 0.0) + time.monotonic() - since
+        return dict(sorted(dwell.items(), key=lambda item: item[1], reverse=True))
+
+    def get_stats(self):
+        """추적 통계를 반환합니다.
+
+        Returns:
+            dict: 확인 횟수, 변경 알림 횟수, 현재 창, 기록 중인 창 수
+        """
+        return {
+            "polls": self.polls,
+            "changes": self.changes,
+            "current": self._current,
+            "tracked_windows": len(self._dwell)
+        }